@@ -0,0 +1,60 @@
+"""
+benchmarks/bench_backtest.py
+====================================
+Times the NumPy backtest on a random walk: each ta.* primitive, then each
+strategy on fresh bars (every series computed) and on bars that have
+already served another variant (only the variant's own series computed).
+Run from the project root: python benchmarks/bench_backtest.py [bars]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backtest import Bars, backtest, np, ta
+
+def random_walk(size: int) -> Bars:
+    rng = np.random.default_rng(369)
+    close = 10000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.002, size)))
+    spread = close * rng.uniform(0.0, 0.004, (2, size))
+    return Bars(np.concatenate(([close[0]], close[:-1])), close + spread[0], close - spread[1], close)
+
+def best_of(ritual, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ritual()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bars = random_walk(size)
+    h, l, c = bars.high, bars.low, bars.close
+    primitives = [
+        ("sma(200)", lambda: ta.sma(c, 200)), ("ema(377)", lambda: ta.ema(c, 377)),
+        ("ema(2)", lambda: ta.ema(c, 2)), ("wma(257)", lambda: ta.wma(c, 257)),
+        ("rsi(14)", lambda: ta.rsi(c, 14)), ("atr(14)", lambda: ta.atr(h, l, c, 14)),
+        ("dmi(14, 14)", lambda: ta.dmi(h, l, c, 14, 14)), ("highest(463)", lambda: ta.highest(h, 463)),
+        ("crossover", lambda: ta.crossover(c, c[0])),
+    ]
+    print(f"{size} bars")
+    print(f"{'ritual':<34}{'ms':>10}")
+    for name, ritual in primitives:
+        print(f"{name:<34}{best_of(ritual) * 1e3:>10.1f}")
+
+    variants = [("hybrid_oracle", dict(slow=200, adx=20, offset=21)),
+                ("hybrid_oracle", dict(slow=200, adaptive=True)),
+                ("enochian_watchtower", dict(vector_grid=257, fib_level=377))]
+    for strategy, params in variants:
+        label = f"{strategy}{' (adaptive)' if params.get('adaptive') else ''}"
+        fresh = best_of(lambda: backtest(strategy, Bars(bars.open, h, l, c), **params))
+        warm = Bars(bars.open, h, l, c)
+        backtest(strategy, warm, **params)
+        print(f"{label + ' fresh':<34}{fresh * 1e3:>10.1f}")
+        print(f"{label + ' warm':<34}{best_of(lambda: backtest(strategy, warm, **params)) * 1e3:>10.1f}")
+
+if __name__ == "__main__":
+    main()
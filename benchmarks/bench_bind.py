@@ -0,0 +1,97 @@
+"""
+benchmarks/bench_bind.py
+====================================
+Micro-benchmark for 'bind' against a nested scope chain.
+Compares three ways of binding:
+  baseline:   the original dict-and-list Environment (copied below) with the
+              exception-driven protocol (assign a throwaway Token, catch
+              RuntimeException, then define) - what 'bind' used to cost;
+  exception:  the same protocol on today's slot-based Environment, which
+              isolates the cost of the protocol itself;
+  direct:     Environment.set_or_define.
+Run from the project root: python benchmarks/bench_bind.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from typing import Any, Dict, List
+from src.lexer import Token, TokenType
+from src.environment import Environment, RuntimeException
+
+DEPTH = 4
+ROUNDS = 200_000
+
+class BaselineEnvironment:
+    """The Environment as it was before slots, trimmed to what 'bind' uses."""
+    def __init__(self, enclosing=None):
+        self.values: Dict[str, Any] = {}
+        self.enclosing = enclosing  # For parent scopes (like inside a loop)
+        self.sealed: List[str] = [] # List of sealed (immutable) variables
+
+    def define(self, name: str, value: Any):
+        if name in self.sealed:
+            raise RuntimeException(f"Cannot re-bind sealed variable '{name}'.")
+        self.values[name] = value
+
+    def assign(self, name: Token, value: Any):
+        if name.lexeme in self.sealed:
+            raise RuntimeException(f"Cannot hex/modify sealed variable '{name.lexeme}'.")
+
+        if name.lexeme in self.values:
+            self.values[name.lexeme] = value
+            return
+
+        if self.enclosing:
+            self.enclosing.assign(name, value)
+            return
+
+        raise RuntimeException(f"Undefined variable '{name.lexeme}'.")
+
+def nested_scope(environment: type = Environment):
+    """A global scope binding 'mana', wrapped in DEPTH empty circles."""
+    env = environment()
+    env.define("mana", 0)
+    for _ in range(DEPTH): env = environment(env)
+    return env
+
+def bind_by_exception(env, name: str, value):
+    try:
+        env.assign(Token(TokenType.IDENTIFIER, name, None, 0), value)
+    except RuntimeException:
+        env.define(name, value)
+
+def bind_directly(env: Environment, name: str, value):
+    env.set_or_define(name, value)
+
+def time_bind(bind, fresh_scope: bool, environment: type = Environment) -> float:
+    """Best of three: ROUNDS binds, each into a fresh inner scope or the same one."""
+    best = float("inf")
+    for _ in range(3):
+        outer = nested_scope(environment)
+        scopes = [environment(outer) for _ in range(ROUNDS)] if fresh_scope else [outer] * ROUNDS
+        name = "fresh" if fresh_scope else "mana"
+        start = timeit.default_timer()
+        for env in scopes: bind(env, name, 1)
+        best = min(best, timeit.default_timer() - start)
+    return best
+
+def main():
+    print(f"{'case':<34}{'baseline (s)':>13}{'exception (s)':>14}{'direct (s)':>11}{'vs baseline':>13}")
+    cases = {
+        # Updating a binding DEPTH circles out: the common 'bind counter to counter + 1'.
+        f"update outer binding (depth {DEPTH})": False,
+        # First binding of a name in a fresh scope: the old protocol raises every time.
+        "first binding in a fresh scope": True,
+    }
+    for label, fresh_scope in cases.items():
+        baseline = time_bind(bind_by_exception, fresh_scope, BaselineEnvironment)
+        slow = time_bind(bind_by_exception, fresh_scope)
+        fast = time_bind(bind_directly, fresh_scope)
+        print(f"{label:<34}{baseline:>13.4f}{slow:>14.4f}{fast:>11.4f}{baseline / fast:>12.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+benchmarks/bench_engines.py
+====================================
+Times the same long-cycle rituals on every execution engine.
+Run from the project root: python benchmarks/bench_engines.py
+"""
+
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+
+RITUAL = """
+bind mana to 0
+bind flux to 1
+cycle(20000) {
+    bind mana to mana + flux * 3 - 1
+    if mana > 100 {
+        bind flux to flux + 1
+    }
+}
+"""
+
+# Shaped like our generated rituals: Literal cycles whose bodies mostly
+# read parameters they never change.
+INVARIANT_RITUAL = """
+bind fast to 12
+bind slow to 26
+bind signal to 0
+cycle(2000) {
+    bind spread to slow - fast
+    cycle(9) {
+        bind signal to signal + spread * fast + slow / 2 - fast * 3
+    }
+}
+"""
+
+def time_engine(engine: str, ast, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        # Benchmarks measure the engine, not the Tesla Protocol's pause.
+        interpreter = Interpreter(engine=engine, resonance_delay=0)
+        with redirect_stdout(io.StringIO()):  # ...nor its banners.
+            start = time.perf_counter()
+            interpreter.interpret(ast)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    for title, ritual in (("long cycle", RITUAL), ("invariant cycles", INVARIANT_RITUAL)):
+        ast = Parser(Lexer(ritual).scan_tokens()).parse()
+        baseline = time_engine("tree", ast)
+        print(f"--- {title} ---")
+        print(f"{'engine':<10}{'seconds':>10}{'speedup':>10}")
+        for engine in Interpreter.ENGINES:
+            seconds = baseline if engine == "tree" else time_engine(engine, ast)
+            print(f"{engine:<10}{seconds:>10.4f}{baseline / seconds:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
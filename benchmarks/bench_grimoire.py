@@ -0,0 +1,66 @@
+"""
+benchmarks/bench_grimoire.py
+====================================
+Times opening the ontology: parsing the JSON grimoires whole (as the
+Resolver once did), reading them through their indexes, and reading the
+codex built by 'mpl grimoire build'.
+Run from the project root: python benchmarks/bench_grimoire.py
+"""
+
+import io
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.resolver import (Resolver, MAGI_PATH, SOLOMON_PATH, ABRAMELIN_PATH, CODEX_PATH, MAGI, GOETIA,
+                          array_records, build_codex)
+
+def json_load():
+    """Every grimoire parsed and keyed, the way the Resolver worked before its indexes."""
+    knowledge = {}
+    for path, (array_key, kind, keys_of) in ((MAGI_PATH, MAGI), (SOLOMON_PATH, GOETIA)):
+        with open(path, "r", encoding="utf-8") as file:
+            for record in array_records(json.load(file), array_key):
+                record["_type"] = kind
+                knowledge.update((key, record) for key in keys_of(record))
+    with open(ABRAMELIN_PATH, "r", encoding="utf-8") as file:
+        json.load(file)
+    return knowledge
+
+def best_of(ritual, repeat: int = 50) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            ritual()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    with redirect_stdout(io.StringIO()):
+        build_codex()
+    names = [record["id"] for record in json_load().values() if record["_type"] == "DAEMON"]
+
+    def open_and_resolve(**paths):
+        resolver = Resolver(**paths)
+        for name in names:
+            resolver.resolve(name)
+
+    loaders = [
+        ("json", json_load, json_load),
+        ("json+idx", lambda: Resolver(codex_path=""), lambda: open_and_resolve(codex_path="")),
+        ("codex", lambda: Resolver(codex_path=CODEX_PATH), lambda: open_and_resolve(codex_path=CODEX_PATH)),
+    ]
+    print(f"Codex: {os.path.getsize(CODEX_PATH)} bytes; resolving all {len(set(names))} daemons")
+    baseline = best_of(json_load)
+    print(f"{'loader':<10}{'open (ms)':>12}{'speedup':>10}{'+ resolve (ms)':>16}")
+    for name, opener, resolver in loaders:
+        opened = best_of(opener)
+        print(f"{name:<10}{opened * 1e3:>12.3f}{baseline / opened:>9.1f}x{best_of(resolver) * 1e3:>16.3f}")
+
+if __name__ == "__main__":
+    main()
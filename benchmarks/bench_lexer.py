@@ -0,0 +1,46 @@
+"""
+benchmarks/bench_lexer.py
+====================================
+Times both tokenizers on a large generated scroll.
+Run from the project root: python benchmarks/bench_lexer.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import LEXERS
+
+STATEMENTS = 20000
+
+def generated_scroll(statements: int = STATEMENTS) -> str:
+    """Shaped like our generated rituals: binds, arithmetic, cycles and comments."""
+    lines = []
+    for i in range(statements):
+        lines.append(f"# step {i}")
+        lines.append(f"bind signal_{i % 97} to signal_{(i + 1) % 97} * 1.5 + {i} - fast_period / 2")
+        if i % 10 == 0:
+            lines.append(f'cycle(3) {{ if signal_{i % 97} >= 100 echo "resonant {i}" else bind drift to drift + 1 }}')
+    return "\n".join(lines)
+
+def time_lexer(name: str, source: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        LEXERS[name](source).scan_tokens()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    source = generated_scroll()
+    print(f"Scroll: {len(source) / 1e6:.2f} MB, {STATEMENTS} statements")
+    baseline = time_lexer("scan", source)
+    print(f"{'lexer':<10}{'seconds':>10}{'speedup':>10}")
+    for name in LEXERS:
+        seconds = baseline if name == "scan" else time_lexer(name, source)
+        print(f"{name:<10}{seconds:>10.4f}{baseline / seconds:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+benchmarks/bench_memory.py
+====================================
+Measures the memory held by the Tokens and the AST of a large generated scroll.
+Run from the project root: python benchmarks/bench_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import RegexLexer
+from src.parser import Parser
+from bench_lexer import generated_scroll
+
+STATEMENTS = 20000
+
+def held_by(build) -> (object, int):
+    """What `build` returns, and the bytes it still holds once built."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, held
+
+def main():
+    source = generated_scroll(STATEMENTS)
+    tokens, token_bytes = held_by(lambda: RegexLexer(source).scan_tokens())
+    ast, ast_bytes = held_by(lambda: Parser(tokens).parse())
+    print(f"Scroll: {len(source) / 1e6:.2f} MB, {len(tokens)} tokens, {len(ast)} top-level statements")
+    print(f"tokens  {token_bytes / 1e6:8.2f} MB  {token_bytes / len(tokens):6.1f} bytes/token")
+    print(f"AST     {ast_bytes / 1e6:8.2f} MB  {ast_bytes / len(ast):6.1f} bytes/statement")
+
+if __name__ == "__main__":
+    main()
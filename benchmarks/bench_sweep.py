@@ -0,0 +1,64 @@
+"""
+benchmarks/bench_sweep.py
+====================================
+Times generating a grid of Hybrid Strategies: a loop around Market.divine
+capturing stdout (the nightly job before 'mpl sweep'), then Market.sweep
+into a directory and into a .zip archive, in one process and in a pool.
+Run from the project root: python benchmarks/bench_sweep.py [variants]
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.stdlib import Market
+
+def grid(variants: int):
+    """fast x slow, about `variants` combinations."""
+    fast = range(5, 105)
+    return dict(fast=fast, slow=range(100, 100 + max(1, variants // len(fast))))
+
+def divine_loop(realm: str, fast, slow):
+    for i, (f, s) in enumerate((f, s) for f in fast for s in slow):
+        captured = io.StringIO()
+        with redirect_stdout(captured):
+            Market.divine(title="Oracle", fast=f, slow=s)
+        with open(os.path.join(realm, f"{i}.pine"), "w", encoding="utf-8") as file:
+            file.write(captured.getvalue())
+
+def timed(ritual) -> float:
+    realm = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            ritual(realm)
+        return time.perf_counter() - start
+    finally:
+        shutil.rmtree(realm)
+
+def main():
+    variants = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    axes = grid(variants)
+    count = len(axes["fast"]) * len(axes["slow"])
+    workers = os.cpu_count() or 1
+    rituals = [
+        ("divine loop", lambda realm: divine_loop(realm, **axes)),
+        ("sweep dir x1", lambda realm: Market.sweep(realm, workers=1, **axes)),
+        (f"sweep dir x{workers}", lambda realm: Market.sweep(realm, **axes)),
+        ("sweep zip x1", lambda realm: Market.sweep(os.path.join(realm, "oracle.zip"), workers=1, **axes)),
+        (f"sweep zip x{workers}", lambda realm: Market.sweep(os.path.join(realm, "oracle.zip"), **axes)),
+    ]
+    print(f"{count} variants, {workers} CPUs")
+    print(f"{'ritual':<16}{'seconds':>10}{'variants/s':>14}")
+    for name, ritual in rituals:
+        seconds = timed(ritual)
+        print(f"{name:<16}{seconds:>10.2f}{count / seconds:>14.0f}")
+
+if __name__ == "__main__":
+    main()
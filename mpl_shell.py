@@ -3,19 +3,43 @@ mpl_shell.py
 ====================================
 The Interactive Shell (REPL).
 Allows the Magi to cast spells directly from the terminal.
+A ritual left open (e.g. an unclosed '{') continues on the next line; an
+empty line performs it as it stands. Tab completes entity names after
+'invoke.' (where the terminal supports readline).
 """
 
-import sys
-from src.lexer import Lexer
-from src.parser import Parser
+from src import __version__
+from src.incremental import IncrementalParser
 from src.interpreter import Interpreter
 
+def install_completion(interpreter):
+    """Completes 'invoke.<prefix>' with the entities the interpreter's Resolver finds."""
+    try:
+        import readline
+    except ImportError:
+        return  # No readline in this realm (e.g. Windows): no completion
+
+    def complete(text, state):
+        before = readline.get_line_buffer()[:readline.get_begidx()]
+        if not before.endswith("invoke."):
+            return None
+        keys = [hit.key for hit in interpreter.resolver.search(text, limit=20) if hit.score == 1.0]
+        return keys[state] if state < len(keys) else None
+
+    readline.set_completer_delims(" \t\n.(){}=,")
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+
 def main():
     # Initialize the Runtime Engine
     interpreter = Interpreter()
+    install_completion(interpreter)
+    # The entry being typed: each line is appended to it and only the
+    # unfinished statement is parsed again.
+    entry = IncrementalParser()
     
     print("========================================")
-    print("🔮 MPL (Magick Programming Language) v0.2.0")
+    print(f"🔮 MPL (Magick Programming Language) v{__version__}")
     print("   The Portal is Open.")
     print("   Type 'exit' to close the connection.")
     print("========================================")
@@ -23,25 +47,23 @@ def main():
     while True:
         try:
             # 1. OMEN: Read input from the Mage
-            text = input('mpl> ')
+            text = input('...> ' if entry.source else 'mpl> ')
             
-            if text.strip() == "exit":
+            if not entry.source and text.strip() == "exit":
                 print("Closing portal...")
                 break
             
-            if not text.strip():
+            if not entry.source and not text.strip():
                 continue
 
-            # 2. LEXER: Break into tokens
-            lexer = Lexer(text)
-            tokens = lexer.scan_tokens()
-            
-            # Debug: Uncomment to see raw tokens
-            # print(f"Tokens: {tokens}")
+            # 2. LEXER & PARSER: Extend the entry and build its AST
+            entry.append(text + "\n")
+            if entry.unfinished and text.strip():
+                continue  # Await the rest of the ritual
 
-            # 3. PARSER: Build the AST
-            parser = Parser(tokens)
-            statements = parser.parse()
+            for diagnostic in entry.diagnostics:
+                print(f"Syntax Error: {diagnostic}")
+            statements, entry = entry.statements, IncrementalParser()
             
             if not statements:
                 continue
@@ -53,6 +75,7 @@ def main():
             print("\nConnection interrupted.")
             break
         except Exception as e:
+            entry = IncrementalParser()
             print(f"🌑 Abyss Error: {e}")
 
 if __name__ == '__main__':
@@ -1,9 +1,17 @@
+import os
+import re
 from setuptools import setup, find_packages
 
+# The version lives in src/__init__.py only (the parse cache depends on it).
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "__init__.py"), encoding="utf-8") as f:
+    VERSION = re.search(r'__version__ = "([^"]+)"', f.read()).group(1)
+
 setup(
     name="mpl-magick",
-    version="0.9.5",
+    version=VERSION,
     packages=find_packages(), # Bu 'src' klasörünü bulur
+    package_data={"src": ["templates/*.pine"]},  # Pine Script templates (src/pine.py)
+    extras_require={"backtest": ["numpy"]},  # mpl backtest (src/backtest.py)
     entry_points={
         'console_scripts': [
             'mpl=src.main:main',  # Terminal 'mpl' deyince src/main.py içindeki main()'i çalıştırır.
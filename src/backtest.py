@@ -0,0 +1,221 @@
+"""
+src/backtest.py
+====================================
+The Backtest (The Mirror).
+Evaluates the strategies of src/templates/ on local OHLC bars, so that a
+sweep of thousands of variants can be scored without TradingView.
+
+    bars = load_csv("BTCUSD_1h.csv")
+    score = backtest("hybrid_oracle", bars, fast=50, slow=200, rsi=45, adx=20, offset=21)
+    for row, score in score_sweep(bars, "sweeps/oracle.zip"): ...
+
+Each strategy computes, with src/ta.py, exactly the series its template
+trades on (buyCond; buy_signal and sell_signal), on every bar at once.
+Series that do not depend on a variant's parameters (rsi, atr, dmi) are
+computed once per Bars.
+
+NumPy is optional (pip install mpl-magick[backtest]); without it, every
+entry point raises BacktestError.
+"""
+
+import csv
+import io
+import os
+import warnings
+import zipfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple
+
+try:
+    import numpy as np
+    from . import ta
+except ImportError:  # NumPy is optional: pip install mpl-magick[backtest]
+    np = ta = None
+
+from .sweep import MANIFEST
+
+class BacktestError(Exception):
+    """Raised when bars cannot be read, or there is no strategy or NumPy to evaluate them."""
+    pass
+
+def _require_numpy():
+    if np is None:
+        raise BacktestError("The backtest needs NumPy: pip install mpl-magick[backtest]")
+
+class Bars:
+    """OHLC price arrays, and the series already computed from them."""
+
+    def __init__(self, open, high, low, close):
+        _require_numpy()
+        self.open, self.high, self.low, self.close = (np.ascontiguousarray(column, dtype=np.float64)
+                                                      for column in (open, high, low, close))
+        if not len(self.open) == len(self.high) == len(self.low) == len(self.close):
+            raise BacktestError("Every OHLC column must have one value per bar.")
+        if not len(self.close):
+            raise BacktestError("There are no bars to test on.")
+        self._series: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def series(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """compute(), remembered under `key` for the next variant evaluated on these bars."""
+        found = self._series.get(key)
+        if found is None:
+            found = self._series[key] = compute()
+        return found
+
+def load_csv(path: str) -> Bars:
+    """
+    Reads bars from a CSV file whose header names open, high, low and close
+    columns (in any case and order, e.g. a TradingView export); any other
+    column, such as time or volume, is skipped.
+    """
+    _require_numpy()
+    with open(path, "r", encoding="utf-8") as file:
+        header = [name.strip().strip('"').lower() for name in file.readline().split(",")]
+    try:
+        columns = [header.index(name) for name in ("open", "high", "low", "close")]
+    except ValueError:
+        raise BacktestError(f"'{path}' needs open, high, low and close columns; its header is {header}.")
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # A file without rows is refused by Bars
+            table = np.loadtxt(path, delimiter=",", skiprows=1, usecols=columns, dtype=np.float64, ndmin=2)
+    except ValueError as e:
+        raise BacktestError(f"'{path}' holds a value that is not a price: {e}")
+    return Bars(*table.T)
+
+# --- STRATEGIES: the signals of each template ---
+@dataclass
+class Signals:
+    """
+    A strategy's entries on every bar. With `sell`, a buy goes long and a
+    sell goes short (stop and reverse); without it, each buy is held for
+    `hold` bars.
+    """
+    buy: Any
+    sell: Any = None
+    hold: int = 1
+
+def hybrid_oracle(bars: Bars, title: str = "Oracle", fast: int = 50, slow: int = 200, rsi: int = 45,
+                  adx: int = 20, offset: int = 21, adaptive: bool = False) -> Signals:
+    """
+    buyCond of src/templates/hybrid_oracle.pine; `adaptive` is its 'Living
+    Spirit' input. Each buy is held for `offset` bars (its Prophetic
+    Vision). `fast` and `title` only draw on the chart.
+    """
+    slow, offset = int(slow), int(offset)
+    close = bars.close
+    trend = bars.series(("ema" if adaptive else "sma", slow),
+                        lambda: (ta.ema if adaptive else ta.sma)(close, slow))
+    level = float(rsi)
+    if adaptive:
+        level = level - bars.series("atr", lambda: ta.atr(bars.high, bars.low, close, 14)) * 0.1
+    rsi_ma = bars.series("rsi_ma", lambda: ta.sma(ta.rsi(close, 14), 9))
+    adx_value = bars.series("adx", lambda: ta.dmi(bars.high, bars.low, close, 14, 14)[2])
+    buy = (close > trend) & ta.crossover(rsi_ma, level) & (adx_value > float(adx))
+    return Signals(buy=buy, hold=max(1, offset))
+
+def enochian_watchtower(bars: Bars, entity: str = "", vector_grid: int = 257, sigil_cipher: int = 463,
+                        fib_level: int = 377) -> Signals:
+    """
+    buy_signal and sell_signal of src/templates/enochian_watchtower.pine.
+    The gates of `sigil_cipher` only draw on the chart.
+    """
+    vector_grid, fib_level = int(vector_grid), int(fib_level)
+    basis = bars.series(("wma", vector_grid), lambda: ta.wma(bars.close, vector_grid))
+    signal = bars.series(("ema", fib_level), lambda: ta.ema(bars.close, fib_level))
+    return Signals(buy=ta.crossover(signal, basis), sell=ta.crossunder(signal, basis))
+
+# Template name -> its strategy.
+STRATEGIES: Dict[str, Callable[..., Signals]] = {
+    "hybrid_oracle": hybrid_oracle,
+    "enochian_watchtower": enochian_watchtower,
+}
+
+# --- SCORING ---
+@dataclass
+class Score:
+    """
+    How a strategy traded: entries at the close of the signal's bar.
+
+    Attributes:
+        total_return: Compounded, as a fraction (0.12 is +12%).
+        win_rate: The share of trades that gained.
+        exposure: The share of bars spent in the market.
+    """
+    signals: int
+    trades: int
+    total_return: float
+    win_rate: float
+    exposure: float
+
+def positions(signals: Signals) -> Any:
+    """The position (1 long, -1 short, 0 flat) held after each bar's close."""
+    buy = np.asarray(signals.buy, dtype=bool)
+    if signals.sell is not None:
+        side = np.where(buy, 1.0, np.where(np.asarray(signals.sell, dtype=bool), -1.0, 0.0))
+        last = np.maximum.accumulate(np.where(side != 0, np.arange(len(side)), 0))
+        return np.where(side[last] != 0, side[last], 0.0)
+    # Long while a buy lies within the last `hold` bars.
+    recent = np.cumsum(buy)
+    recent[signals.hold:] -= recent[:-signals.hold].copy()
+    return (recent > 0).astype(np.float64)
+
+def _log_moves(close: Any) -> Tuple[Any, Any]:
+    """Each bar's log return held long, and held short."""
+    moves = np.zeros(len(close))
+    moves[1:] = close[1:] / close[:-1] - 1.0
+    return np.log1p(moves), np.log1p(-moves)
+
+def score(bars: Bars, signals: Signals) -> Score:
+    position = positions(signals)
+    held = np.concatenate(([0.0], position[:-1]))  # The position through each bar's move
+    long, short = bars.series("log_moves", lambda: _log_moves(bars.close))
+    gains = np.where(held < 0, short, held * long)
+    opened = (position != 0) & (position != np.concatenate(([0.0], position[:-1])))
+    trades = int(opened.sum())
+    # Each bar's gain belongs to the trade that held it.
+    trade = np.concatenate(([0], np.cumsum(opened)[:-1]))
+    by_trade = np.bincount(trade[held != 0], weights=gains[held != 0], minlength=trades + 1)[1:]
+    entries = int(np.count_nonzero(signals.buy))
+    if signals.sell is not None:
+        entries += int(np.count_nonzero(signals.sell))
+    return Score(signals=entries,
+                 trades=trades,
+                 total_return=float(np.expm1(gains.sum())),
+                 win_rate=float((by_trade > 0).mean()) if trades else 0.0,
+                 exposure=float((held != 0).mean()) if len(held) else 0.0)
+
+def backtest(strategy: str, bars: Bars, **params: Any) -> Score:
+    """Scores one variant of a strategy (a template name) on `bars`."""
+    _require_numpy()
+    if strategy not in STRATEGIES:
+        raise BacktestError(f"No strategy named '{strategy}' (choose from {', '.join(STRATEGIES)}).")
+    try:
+        signals = STRATEGIES[strategy](bars, **params)
+    except (TypeError, ValueError) as e:
+        raise BacktestError(f"{strategy}: {e}")
+    return score(bars, signals)
+
+def read_manifest(sweep_output: str) -> List[Dict[str, str]]:
+    """The manifest rows of a sweep written into a directory or a .zip archive."""
+    try:
+        if sweep_output.endswith(".zip"):
+            with zipfile.ZipFile(sweep_output) as bundle:
+                text = bundle.read(MANIFEST).decode("utf-8")
+        else:
+            with open(os.path.join(sweep_output, MANIFEST), "r", encoding="utf-8") as file:
+                text = file.read()
+    except (OSError, KeyError, zipfile.BadZipFile) as e:
+        raise BacktestError(f"No sweep manifest in '{sweep_output}': {e}")
+    return list(csv.DictReader(io.StringIO(text)))
+
+def score_sweep(bars: Bars, sweep_output: str) -> Iterator[Tuple[Dict[str, str], Score]]:
+    """Each variant of a sweep (see src/sweep.py) with its score, in manifest order."""
+    for row in read_manifest(sweep_output):
+        params = dict(row)
+        # Scripts are named <template>_<index>.pine.
+        strategy = params.pop("file").rsplit("_", 1)[0]
+        yield row, backtest(strategy, bars, **params)
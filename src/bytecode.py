@@ -0,0 +1,263 @@
+"""
+src/bytecode.py
+====================================
+The Bytecode Compiler (The Scribe of Glyphs).
+Flattens the Abstract Syntax Tree into a compact Chunk: an opcode array
+with inline operands plus a constant pool. The Chunk is performed by the
+stack VM in src/vm.py.
+"""
+
+from enum import IntEnum
+from typing import Any, Dict, List, Tuple
+from .compiler import BINARY_OPERATORS
+from .environment import UNBOUND
+from .parser import (
+    Address, Stmt, Expr, Block, Cycle, Conditional,
+    Invoke, Bind, Summon, Circle, Seal, Omen, Pact, Hex, Morph, Banish, Purge, Abyss, Echo,
+    Literal, Variable, Binary
+)
+
+class OpCode(IntEnum):
+    # Families occupy contiguous ranges so the VM can dispatch by range.
+    # --- Stack & Memory ---           (operand)
+    CONSTANT = 0                # pool index of the value to push
+    GET = 1                     # pool index of (name, depth, slot)
+    BIND = 2                    # pool index of (name, depth, slot)
+    GET_NAME = 3                # pool index of the name (unresolved variable)
+    BIND_NAME = 4               # pool index of the name (unresolved variable)
+
+    # --- Arithmetic & Comparison (operator resolved at compile time) ---
+    BINARY = 10                 # pool index of the operator function
+    BINARY_CONSTANT = 11        # pool index of (operator, right-hand value)
+    GET_BINARY_CONSTANT = 12    # pool index of (name, depth, slot, operator, right-hand value)
+
+    # --- Control Flow ---
+    JUMP = 20                   # absolute target
+    JUMP_IF_FALSE = 21          # absolute target (pops the condition)
+    ATTUNE = 22                 # validates the cycle frequency on top of the stack
+    ENTER_CYCLE = 23            # absolute exit target, taken when no iteration remains
+    REPEAT_CYCLE = 24           # absolute body target, taken while iterations remain
+    ENTER_SCOPE = 25            # pool index of the Block's Layout
+    EXIT_SCOPE = 26
+    SETUP_CIRCLE = 27           # absolute target resumed after a protected failure
+    POP_CIRCLE = 28
+    RENEW_SCOPE = 29            # pool index of the fresh (all UNBOUND) slots of a cycle's scope
+
+    # --- The Sealed Verbs ---
+    ECHO = 30
+    INVOKE = 31                 # pool index of (entity, param names); pops one value per name
+    OMEN = 32                   # pool index of the target name
+    SEAL = 33                   # pool index of the target name
+    BANISH = 34                 # pool index of the target name
+    PURGE = 35
+    ABYSS = 36
+    MORPH = 37                  # pool index of (name, Morph statement)
+    HEX = 38                    # pool index of (name, depth, slot); depth is None if unresolved
+    POP = 39
+    PACT = 40                   # pool index of the target name (pops the request)
+    SUMMON = 41                 # pool index of the module name
+
+# Opcodes followed by one inline operand; every other opcode stands alone.
+WITH_OPERAND = frozenset({
+    OpCode.CONSTANT, OpCode.GET, OpCode.BIND, OpCode.GET_NAME, OpCode.BIND_NAME, OpCode.HEX,
+    OpCode.ENTER_SCOPE, OpCode.RENEW_SCOPE,
+    OpCode.BINARY, OpCode.BINARY_CONSTANT, OpCode.GET_BINARY_CONSTANT,
+    OpCode.JUMP, OpCode.JUMP_IF_FALSE, OpCode.ENTER_CYCLE, OpCode.REPEAT_CYCLE, OpCode.SETUP_CIRCLE,
+    OpCode.INVOKE, OpCode.OMEN, OpCode.PACT, OpCode.SUMMON, OpCode.SEAL, OpCode.BANISH, OpCode.MORPH,
+})
+JUMPS = frozenset({OpCode.JUMP, OpCode.JUMP_IF_FALSE, OpCode.ENTER_CYCLE, OpCode.REPEAT_CYCLE, OpCode.SETUP_CIRCLE})
+
+class Chunk:
+    """A compiled ritual: the opcode array and its constant pool."""
+
+    def __init__(self):
+        self.code: List[int] = []
+        self.constants: List[Any] = []
+        self._pool_index: Dict[Tuple[Any, Any], int] = {}
+
+    def emit(self, op: OpCode, operand: int = None) -> int:
+        """Appends an instruction and returns the address of its operand (or opcode)."""
+        self.code.append(int(op))
+        if operand is None: return len(self.code) - 1
+        self.code.append(operand)
+        return len(self.code) - 1
+
+    def constant(self, value: Any) -> int:
+        """Interns a value in the constant pool and returns its index."""
+        try:
+            # Types are part of the key so that 1, 1.0 and True stay distinct.
+            types = tuple(type(v) for v in value) if isinstance(value, tuple) else type(value)
+            key = (types, value)
+            index = self._pool_index.get(key)
+        except TypeError:  # Unhashable (e.g. AST nodes): never shared.
+            key, index = None, None
+        if index is None:
+            self.constants.append(value)
+            index = len(self.constants) - 1
+            if key is not None: self._pool_index[key] = index
+        return index
+
+    def patch(self, address: int, target: int):
+        self.code[address] = target
+
+    def disassemble(self) -> str:
+        """Renders the chunk as human-readable glyphs (for debugging rituals)."""
+        lines, ip = [], 0
+        while ip < len(self.code):
+            op = OpCode(self.code[ip])
+            if op in WITH_OPERAND:
+                operand = self.code[ip + 1]
+                shown = operand if op in JUMPS else f"{operand} ({self.constants[operand]!r})"
+                lines.append(f"{ip:04d} {op.name:<14} {shown}")
+                ip += 2
+            else:
+                lines.append(f"{ip:04d} {op.name}")
+                ip += 1
+        return "\n".join(lines)
+
+class BytecodeCompiler:
+    """Compiles Parser statements into a Chunk."""
+
+    def compile(self, statements: List[Stmt]) -> Chunk:
+        self.chunk = Chunk()
+        for stmt in statements:
+            self.statement(stmt)
+        return self.chunk
+
+    def _name(self, name: str) -> int:
+        return self.chunk.constant(name)
+
+    def _address(self, name: str, address: Address) -> int:
+        """Pools the (name, depth, slot) record of a resolved variable."""
+        depth, slot = address if address else (None, None)
+        return self.chunk.constant((name, depth, slot))
+
+    def statement(self, stmt: Stmt):
+        chunk = self.chunk
+        if stmt is None:
+            return  # Lost to a syntax error.
+
+        if isinstance(stmt, Bind):
+            self.expression(stmt.value)
+            if stmt.address:
+                chunk.emit(OpCode.BIND, self._address(stmt.name, stmt.address))
+            else:
+                chunk.emit(OpCode.BIND_NAME, self._name(stmt.name))
+
+        elif isinstance(stmt, Echo):
+            self.expression(stmt.message)
+            chunk.emit(OpCode.ECHO)
+
+        elif isinstance(stmt, Invoke):
+            params = stmt.params or []
+            for p in params:
+                self.expression(p.value)
+            signature = (stmt.entity, tuple(p.name for p in params))
+            chunk.emit(OpCode.INVOKE, chunk.constant(signature))
+
+        elif isinstance(stmt, Cycle):
+            # The remaining count lives on the stack while the body runs.
+            self.expression(stmt.frequency)
+            chunk.emit(OpCode.ATTUNE)
+            if isinstance(stmt.body, Block):
+                # One scope serves every iteration and is renewed (all slots
+                # UNBOUND, nothing sealed) instead of being created again.
+                chunk.emit(OpCode.ENTER_SCOPE, chunk.constant(stmt.body.layout))
+                exit_operand = chunk.emit(OpCode.ENTER_CYCLE, 0)
+                body_start = chunk.emit(OpCode.RENEW_SCOPE, chunk.constant((UNBOUND,) * len(stmt.body.layout or ()))) - 1
+                for inner in stmt.body.statements:
+                    self.statement(inner)
+                chunk.emit(OpCode.REPEAT_CYCLE, body_start)
+                chunk.patch(exit_operand, len(chunk.code))
+                chunk.emit(OpCode.EXIT_SCOPE)
+            else:
+                exit_operand = chunk.emit(OpCode.ENTER_CYCLE, 0)
+                body_start = len(chunk.code)
+                self.statement(stmt.body)
+                chunk.emit(OpCode.REPEAT_CYCLE, body_start)
+                chunk.patch(exit_operand, len(chunk.code))
+
+        elif isinstance(stmt, Conditional):
+            self.expression(stmt.condition)
+            else_operand = chunk.emit(OpCode.JUMP_IF_FALSE, 0)
+            self.statement(stmt.then_branch)
+            if stmt.else_branch:
+                end_operand = chunk.emit(OpCode.JUMP, 0)
+                chunk.patch(else_operand, len(chunk.code))
+                self.statement(stmt.else_branch)
+                chunk.patch(end_operand, len(chunk.code))
+            else:
+                chunk.patch(else_operand, len(chunk.code))
+
+        elif isinstance(stmt, Block):
+            chunk.emit(OpCode.ENTER_SCOPE, chunk.constant(stmt.layout))
+            for inner in stmt.statements:
+                self.statement(inner)
+            chunk.emit(OpCode.EXIT_SCOPE)
+
+        elif isinstance(stmt, Hex):
+            values = [p.value for p in stmt.params if p.name in ["val", "value"]]
+            if not values:
+                chunk.emit(OpCode.CONSTANT, chunk.constant(None))
+            for i, value in enumerate(values):
+                if i: chunk.emit(OpCode.POP)
+                self.expression(value)
+            chunk.emit(OpCode.HEX, self._address(stmt.target, stmt.address))
+
+        elif isinstance(stmt, Seal):
+            chunk.emit(OpCode.SEAL, chunk.constant(stmt.target))
+
+        elif isinstance(stmt, Circle):
+            resume_operand = chunk.emit(OpCode.SETUP_CIRCLE, 0)
+            self.statement(stmt.body)
+            chunk.emit(OpCode.POP_CIRCLE)
+            chunk.patch(resume_operand, len(chunk.code))
+
+        elif isinstance(stmt, Omen):
+            chunk.emit(OpCode.OMEN, chunk.constant(stmt.target))
+
+        elif isinstance(stmt, Pact):
+            self.expression(stmt.request)
+            chunk.emit(OpCode.PACT, chunk.constant(stmt.target))
+
+        elif isinstance(stmt, Summon):
+            chunk.emit(OpCode.SUMMON, chunk.constant(stmt.module_name))
+
+        elif isinstance(stmt, Banish):
+            chunk.emit(OpCode.BANISH, chunk.constant(stmt.target))
+
+        elif isinstance(stmt, Purge):
+            chunk.emit(OpCode.PURGE)
+
+        elif isinstance(stmt, Abyss):
+            self.expression(stmt.message)
+            chunk.emit(OpCode.ABYSS)
+
+        elif isinstance(stmt, Morph):
+            chunk.emit(OpCode.MORPH, chunk.constant((stmt.target, stmt)))
+
+    def expression(self, expr: Expr):
+        chunk = self.chunk
+        if isinstance(expr, Literal):
+            chunk.emit(OpCode.CONSTANT, chunk.constant(expr.value))
+        elif isinstance(expr, Variable) and expr.address:
+            chunk.emit(OpCode.GET, self._address(expr.name.lexeme, expr.address))
+        elif isinstance(expr, Variable):
+            chunk.emit(OpCode.GET_NAME, self._name(expr.name.lexeme))
+        elif isinstance(expr, Binary) and expr.operator.type in BINARY_OPERATORS:
+            op = BINARY_OPERATORS[expr.operator.type]
+            # Superinstructions: a Literal right-hand side rides in the operand,
+            # and so does a Variable on the left of it.
+            if isinstance(expr.right, Literal) and isinstance(expr.left, Variable) and expr.left.address:
+                depth, slot = expr.left.address
+                name = expr.left.name.lexeme
+                chunk.emit(OpCode.GET_BINARY_CONSTANT, chunk.constant((name, depth, slot, op, expr.right.value)))
+            elif isinstance(expr.right, Literal):
+                self.expression(expr.left)
+                chunk.emit(OpCode.BINARY_CONSTANT, chunk.constant((op, expr.right.value)))
+            else:
+                self.expression(expr.left)
+                self.expression(expr.right)
+                chunk.emit(OpCode.BINARY, chunk.constant(op))
+        else:
+            chunk.emit(OpCode.CONSTANT, chunk.constant(None))
@@ -0,0 +1,231 @@
+"""
+src/codex.py
+====================================
+The Codex (The Bound Grimoires).
+The grimoires compiled by 'mpl grimoire build' into one binary file
+(data/ontology.mplc) that opens without parsing anything: it is
+memory-mapped, and a record is decoded from its fixed-width row only when
+a ritual asks for it.
+
+Format (version 1, little-endian):
+
+    header   "MPLCODEX", version (u16), tables (u16), strings (u32),
+             where the strings start (u32)
+    tables   per table: the sha256 of its JSON source, then (u32 each) the
+             source's file name, the table's name and kind, its columns,
+             rows and keys, and where its columns, rows and keys start
+    columns  the string of each field name
+    rows     one cell per column: a tag (u8) and a value (i32), which is
+             an integer, or the string of a text or of nested JSON
+    keys     (key string, row) pairs sorted by key, searched by bisection
+    strings  offsets (u32, one more than there are strings) into a single
+             UTF-8 blob; every text is stored once
+
+A table whose sha256 no longer matches its JSON source is stale: it is not
+used (the Resolver reads the JSON) until the codex is built again.
+"""
+
+import array
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+CODEX_MAGIC = b"MPLCODEX"
+CODEX_VERSION = 1
+
+HEADER = struct.Struct("<8sHHII")
+TABLE = struct.Struct("<32s9I")
+CELL = struct.Struct("<Bi")
+KEY = struct.Struct("<II")
+OFFSET = struct.Struct("<I")
+
+# The tag of a cell.
+ABSENT, TEXT, INTEGER, NESTED = 0, 1, 2, 3
+
+class CodexError(Exception):
+    """Raised for a file that is not a codex this version can read."""
+    pass
+
+def file_checksum(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).digest()
+
+@dataclass
+class Folio:
+    """One table to bind: the records of a grimoire and the keys naming them."""
+    source: str                    # The JSON file the records were read from
+    name: str                      # e.g. "magi" (the array holding them)
+    kind: str                      # The _type of its records
+    records: List[Dict[str, Any]]
+    keys: Dict[str, int]           # Every key -> the index of its record
+    checksum: bytes                # sha256 of the source
+
+def bind(folios: Sequence[Folio]) -> bytes:
+    """Compiles folios into the bytes of a codex."""
+    strings: Dict[str, int] = {}
+    string = lambda text: strings.setdefault(text, len(strings))
+    body, directory = bytearray(), []
+    start = HEADER.size + TABLE.size * len(folios)
+
+    for folio in folios:
+        columns = list(dict.fromkeys(field for record in folio.records for field in record))
+        columns_at = start + len(body)
+        for column in columns:
+            body += OFFSET.pack(string(column))
+        rows_at = start + len(body)
+        for record in folio.records:
+            for column in columns:
+                body += CELL.pack(*_cell(record, column, string))
+        keys_at = start + len(body)
+        for key, row in sorted(folio.keys.items()):
+            body += KEY.pack(string(key), row)
+        directory.append(TABLE.pack(folio.checksum, string(os.path.basename(folio.source)), string(folio.name),
+                                    string(folio.kind), len(columns), len(folio.records), len(folio.keys),
+                                    columns_at, rows_at, keys_at))
+
+    blob, offsets = bytearray(), [0]
+    for text in strings:  # In the order of their ids
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+    header = HEADER.pack(CODEX_MAGIC, CODEX_VERSION, len(folios), len(strings), start + len(body))
+    return b"".join([header, *directory, body, struct.pack(f"<{len(offsets)}I", *offsets), blob])
+
+def _cell(record: Dict[str, Any], column: str, string: Callable[[str], int]) -> Tuple[int, int]:
+    if column not in record:
+        return ABSENT, 0
+    value = record[column]
+    if isinstance(value, str):
+        return TEXT, string(value)
+    if type(value) is int and -2**31 <= value < 2**31:
+        return INTEGER, value
+    return NESTED, string(json.dumps(value, ensure_ascii=False))
+
+def write_codex(path: str, folios: Sequence[Folio]) -> int:
+    """Binds folios into a codex file (replaced whole, never half-written). Returns its size."""
+    data = bind(folios)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+    return len(data)
+
+class Codex:
+    """
+    A codex read in place (from a memory map, or any bytes).
+
+    Attributes:
+        stale: The file names of the sources whose table no longer matches them.
+    """
+
+    def __init__(self, data: Any):
+        if len(data) < HEADER.size:
+            raise CodexError("Not a codex (too short).")
+        magic, version, tables, strings, strings_at = HEADER.unpack_from(data)
+        if magic != CODEX_MAGIC:
+            raise CodexError("Not a codex.")
+        if version != CODEX_VERSION:
+            raise CodexError(f"Codex version {version} cannot be read (this MPL reads version {CODEX_VERSION}).")
+        self.data = data
+        self._blob_at = strings_at + OFFSET.size * (strings + 1)
+        self._offsets = array.array("I", data[strings_at:self._blob_at])  # One copy, a few kilobytes
+        if sys.byteorder == "big":
+            self._offsets.byteswap()
+        self.directory = [TABLE.unpack_from(data, HEADER.size + i * TABLE.size) for i in range(tables)]
+        self.stale: List[str] = []
+
+    @classmethod
+    def open(cls, path: str) -> "Codex":
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b"")
+
+    def text(self, number: int) -> bytes:
+        """A string, still encoded (UTF-8 sorts as its text does)."""
+        at = self._blob_at
+        return self.data[at + self._offsets[number]:at + self._offsets[number + 1]]
+
+    def string(self, number: int) -> str:
+        at, offsets = self._blob_at, self._offsets
+        return self.data[at + offsets[number]:at + offsets[number + 1]].decode("utf-8")
+
+    def tables(self) -> Iterator[Tuple[str, str, str, int, bytes]]:
+        """(source file name, table name, kind, rows, sha256 of the source) of every table."""
+        for checksum, source, name, kind, _, rows, *_ in self.directory:
+            yield self.string(source), self.string(name), self.string(kind), rows, checksum
+
+    def grimoire(self, path: str, layout: Tuple[str, str, Callable[[Dict[str, Any]], List[str]]],
+                 checksum: Optional[bytes] = None) -> Optional["CodexTable"]:
+        """
+        The table bound from the grimoire at `path` with this layout, if it
+        is in the codex and still matches the file (or the given checksum).
+        """
+        source = os.path.basename(path)
+        for entry in self.directory:
+            if self.string(entry[1]) != source or self.string(entry[2]) != layout[0]:
+                continue
+            if entry[0] != (checksum if checksum is not None else file_checksum(path)):
+                self.stale.append(source)
+                return None
+            return CodexTable(self, path, layout, entry)
+        return None
+
+class CodexTable:
+    """
+    One grimoire of a codex, read like a Grimoire (see src/resolver.py):
+    its records are decoded from their rows, once, when first asked for.
+    """
+
+    def __init__(self, codex: Codex, path: str, layout: Tuple[str, str, Callable[[Dict[str, Any]], List[str]]],
+                 entry: Tuple):
+        self.codex, self.path = codex, path
+        self.array_key, self.kind, self.keys_of = layout
+        self.checksum = entry[0].hex()
+        columns, self.rows, self.key_count, columns_at, self.rows_at, self.keys_at = entry[4:]
+        self.columns = [codex.string(OFFSET.unpack_from(codex.data, columns_at + OFFSET.size * i)[0])
+                        for i in range(columns)]
+        self.row = struct.Struct("<" + "Bi" * columns)  # Every cell of a row, unpacked at once
+        self.records: Dict[int, Dict[str, Any]] = {}  # Decoded records, by row
+        self._index: Optional[Dict[str, int]] = None
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Every key -> its row, read in one pass over the key table (on the first lookup)."""
+        if self._index is None:
+            codex = self.codex
+            pairs = array.array("I", codex.data[self.keys_at:self.keys_at + KEY.size * self.key_count])
+            if sys.byteorder == "big":
+                pairs.byteswap()
+            data, at, offsets = codex.data, codex._blob_at, codex._offsets
+            self._index = {data[at + offsets[key]:at + offsets[key + 1]].decode("utf-8"): row
+                           for key, row in zip(pairs[::2], pairs[1::2])}
+        return self._index
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self.index.get(key)
+        return None if row is None else self._record(row)
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Every record, in the grimoire's order (each decoded once)."""
+        rows = sorted(set(self.index.values()))
+        for row in rows:
+            yield self._record(row)
+
+    def _record(self, row: int) -> Dict[str, Any]:
+        record = self.records.get(row)
+        if record is None:
+            record, codex = {}, self.codex
+            data, at, offsets = codex.data, codex._blob_at, codex._offsets
+            cells = self.row.unpack_from(data, self.rows_at + self.row.size * row)
+            for column, tag, value in zip(self.columns, cells[::2], cells[1::2]):
+                # Strings are sliced here rather than through Codex.string: this is the hot loop.
+                if tag == TEXT: record[column] = data[at + offsets[value]:at + offsets[value + 1]].decode("utf-8")
+                elif tag == INTEGER: record[column] = value
+                elif tag == NESTED: record[column] = json.loads(data[at + offsets[value]:at + offsets[value + 1]])
+            record["_type"] = self.kind
+            self.records[row] = record
+        return record
@@ -0,0 +1,390 @@
+"""
+src/compiler.py
+====================================
+The Closure Compiler (The Sigil Forge).
+Transmutes the Abstract Syntax Tree into a tree of pre-bound Python closures.
+Every node is inspected exactly once, at compile time: its handler and (for
+Binary nodes) its operator are resolved up front, so performing the ritual
+no longer pays for the isinstance dispatch chain of the tree-walker.
+
+Cycles get a specialised path: the body's Block scope is created once per
+cycle and renewed (its locals reset) between iterations, sub-expressions
+that the body cannot change are evaluated once per cycle, and the
+resonant frequencies 3, 6 and 9 of Literal cycles are unrolled by three.
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from .lexer import TokenType
+from .parser import (
+    Stmt, Expr, Block, Cycle, Conditional,
+    Invoke, Bind, Summon, Circle, Seal, Omen, Hex, Morph, Pact, Banish, Purge, Abyss, Echo,
+    Literal, Variable, Binary
+)
+from .environment import Environment, RuntimeException, UNBOUND
+from .stdlib import CallSite
+
+# A compiled statement performs itself against an Environment.
+Rite = Callable[[Environment], None]
+# A compiled expression evaluates itself against an Environment.
+Spell = Callable[[Environment], Any]
+
+def weave(left: Any, right: Any) -> Any:
+    """MPL's '+': joins as strings when either side is a Sigil, else adds."""
+    if isinstance(left, str) or isinstance(right, str): return str(left) + str(right)
+    return left + right
+
+BINARY_OPERATORS: Dict[TokenType, Callable[[Any, Any], Any]] = {
+    TokenType.PLUS: weave,
+    TokenType.MINUS: operator.sub,
+    TokenType.STAR: operator.mul,
+    TokenType.SLASH: operator.truediv,
+    TokenType.EQ: operator.eq,
+    TokenType.NEQ: operator.ne,
+    TokenType.GT: operator.gt,
+    TokenType.LT: operator.lt,
+    TokenType.GTE: operator.ge,
+    TokenType.LTE: operator.le,
+}
+
+def _scope_finder(depth: int) -> Callable[[Environment], Environment]:
+    """Returns the quickest way to reach the scope `depth` circles outwards."""
+    if depth == 0: return lambda env: env
+    if depth == 1: return lambda env: env.enclosing
+    return lambda env: env.ancestor(depth)
+
+def _written_names(stmt: Stmt, names: Set[str]) -> bool:
+    """
+    Collects the names a statement may write into `names`.
+    Returns False when it may write anything at all (a Purge).
+    """
+    if stmt is None: return True
+    if isinstance(stmt, Bind): names.add(stmt.name)
+    elif isinstance(stmt, (Hex, Morph, Omen, Pact, Banish)): names.add(stmt.target)
+    elif isinstance(stmt, Purge): return False
+    elif isinstance(stmt, Block): return all(_written_names(s, names) for s in stmt.statements)
+    elif isinstance(stmt, Cycle): return _written_names(stmt.body, names)
+    elif isinstance(stmt, Circle): return _written_names(stmt.body, names)
+    elif isinstance(stmt, Conditional):
+        return _written_names(stmt.then_branch, names) and _written_names(stmt.else_branch, names)
+    return True
+
+def _read_names(expr: Expr, names: Set[str]):
+    """Collects the variable names an expression reads into `names`."""
+    if isinstance(expr, Variable): names.add(expr.name.lexeme)
+    elif isinstance(expr, Binary):
+        _read_names(expr.left, names)
+        _read_names(expr.right, names)
+
+# Cycles whose (Literal) frequency is resonant, unrolled by three.
+RESONANT_FREQUENCIES = (3, 6, 9)
+
+def _inert(env: Environment) -> None:
+    """The compiled form of statements that perform nothing."""
+    return None
+
+class Compiler:
+    """
+    Compiles statements into closures bound to an Interpreter.
+
+    The Interpreter is only consulted for the behaviour it owns (invocation,
+    the Tesla Protocol, truthiness and transmutation), so both engines stay
+    observably identical.
+    """
+
+    def __init__(self, interpreter: Any):
+        self.interpreter = interpreter
+        self.statement_forges: Dict[type, Callable[[Any], Rite]] = {
+            Echo: self._echo, Bind: self._bind, Invoke: self._invoke,
+            Omen: self._omen, Pact: self._pact, Summon: self._summon, Circle: self._circle, Seal: self._seal,
+            Hex: self._hex, Banish: self._banish, Purge: self._purge,
+            Abyss: self._abyss, Cycle: self._cycle, Morph: self._morph,
+            Block: self._block, Conditional: self._conditional,
+        }
+        self.expression_forges: Dict[type, Callable[[Any], Spell]] = {
+            Literal: self._literal, Variable: self._variable, Binary: self._binary,
+        }
+        # The cycles being compiled, innermost last: (names the body may write,
+        # or None if it may write anything; memo of its hoisted invariants).
+        self.loops: List[Tuple[Optional[Set[str]], List[Any]]] = []
+
+    def compile(self, statements: List[Stmt]) -> Rite:
+        """Compiles a whole ritual into a single closure."""
+        return self._sequence(statements)
+
+    def compile_statement(self, stmt: Stmt) -> Rite:
+        forge = self.statement_forges.get(type(stmt))
+        return forge(stmt) if forge else _inert
+
+    def compile_expression(self, expr: Expr) -> Spell:
+        forge = self.expression_forges.get(type(expr))
+        return forge(expr) if forge else _inert
+
+    def _sequence(self, statements: List[Stmt]) -> Rite:
+        # Statements lost to syntax errors are None and simply vanish here.
+        rites = tuple(self.compile_statement(s) for s in statements if s is not None)
+        if len(rites) == 1: return rites[0]
+
+        def perform(env: Environment) -> None:
+            for rite in rites: rite(env)
+        return perform
+
+    # --- Statements ---
+
+    def _echo(self, stmt: Echo) -> Rite:
+        message = self.compile_expression(stmt.message)
+
+        def echo(env: Environment) -> None:
+            print(f"👁️‍🗨️ [ECHO]: {message(env)}")
+        return echo
+
+    def _bind(self, stmt: Bind) -> Rite:
+        value, name = self.compile_expression(stmt.value), stmt.name
+
+        def rebind(env: Environment, result: Any) -> None:
+            env.set_or_define(name, result)
+
+        if stmt.address is None:
+            return lambda env: rebind(env, value(env))
+        depth, slot = stmt.address
+
+        if depth == 0:
+            def bind(env: Environment) -> None:
+                result = value(env)
+                if env.slots[slot] is UNBOUND or name in env.sealed: rebind(env, result)
+                else: env.slots[slot] = result
+            return bind
+
+        owner = _scope_finder(depth)
+
+        def bind_outer(env: Environment) -> None:
+            result, scope = value(env), owner(env)
+            if scope.slots[slot] is UNBOUND or name in scope.sealed: rebind(env, result)
+            else: scope.slots[slot] = result
+        return bind_outer
+
+    def _invoke(self, stmt: Invoke) -> Rite:
+        entity = stmt.entity
+        params = tuple((p.name, self.compile_expression(p.value)) for p in stmt.params or [])
+        invoke, site = self.interpreter._invoke, CallSite()
+
+        def perform(env: Environment) -> None:
+            invoke(entity, {name: value(env) for name, value in params}, site)
+        return perform
+
+    def _omen(self, stmt: Omen) -> Rite:
+        target = stmt.target
+
+        def omen(env: Environment) -> None:
+            env.define(target, input(f"🔮 [OMEN] Enter value for '{target}': "))
+        return omen
+
+    def _pact(self, stmt: Pact) -> Rite:
+        target, request, pact = stmt.target, self.compile_expression(stmt.request), self.interpreter._pact
+
+        def seal_pact(env: Environment) -> None:
+            env.define(target, pact(request(env)))
+        return seal_pact
+
+    def _summon(self, stmt: Summon) -> Rite:
+        module_name, summon = stmt.module_name, self.interpreter._summon
+
+        def summon_module(env: Environment) -> None:
+            summon(module_name)
+        return summon_module
+
+    def _circle(self, stmt: Circle) -> Rite:
+        body = self.compile_statement(stmt.body)
+
+        def circle(env: Environment) -> None:
+            try:
+                body(env)
+            except Exception as e:
+                print(f"🛡️ [CIRCLE] Protected against chaos: {e}")
+        return circle
+
+    def _seal(self, stmt: Seal) -> Rite:
+        target = stmt.target
+
+        def seal(env: Environment) -> None:
+            env.seal(target)
+            print(f"🔒 [SEAL] Variable '{target}' is now immutable.")
+        return seal
+
+    def _hex(self, stmt: Hex) -> Rite:
+        target = stmt.target
+        values = [self.compile_expression(p.value) for p in stmt.params if p.name in ["val", "value"]]
+        owner, slot = (_scope_finder(stmt.address[0]), stmt.address[1]) if stmt.address else (None, None)
+
+        def hex_(env: Environment) -> None:
+            val = None
+            for value in values: val = value(env)
+            if val is None:
+                print(f"⚠️ [HEX] No 'value' parameter provided to hex '{target}'.")
+                return
+            scope = owner(env) if owner else None
+            if scope is None or scope.slots[slot] is UNBOUND or target in scope.sealed:
+                env.assign_name(target, val)
+            else:
+                scope.slots[slot] = val
+        return hex_
+
+    def _banish(self, stmt: Banish) -> Rite:
+        target = stmt.target
+
+        def banish(env: Environment) -> None:
+            env.banish(target)
+            print(f"🗑️ [BANISH] '{target}' cast into the void.")
+        return banish
+
+    def _purge(self, stmt: Purge) -> Rite:
+        def purge(env: Environment) -> None:
+            env.purge()
+            print("🔥 [PURGE] Memory cleansed.")
+        return purge
+
+    def _abyss(self, stmt: Abyss) -> Rite:
+        message = self.compile_expression(stmt.message)
+
+        def abyss(env: Environment) -> None:
+            raise RuntimeException(message(env))
+        return abyss
+
+    def _cycle(self, stmt: Cycle) -> Rite:
+        frequency = self.compile_expression(stmt.frequency)
+        attune = self.interpreter._attune_cycle
+        written: Optional[Set[str]] = set()
+        if not _written_names(stmt.body, written): written = None
+        memo: List[Any] = []
+
+        self.loops.append((written, memo))
+        try:
+            if isinstance(stmt.body, Block):
+                body, layout = self._sequence(stmt.body.statements), stmt.body.layout
+            else:
+                body, layout = self.compile_statement(stmt.body), None
+        finally:
+            self.loops.pop()
+
+        # Invariants are only valid for one performance of the cycle.
+        forget = [UNBOUND] * len(memo)
+        unrolled = isinstance(stmt.frequency, Literal) and stmt.frequency.value in RESONANT_FREQUENCIES
+
+        if layout is None:
+            if unrolled:
+                def cycle(env: Environment) -> None:
+                    count = attune(frequency(env))
+                    memo[:] = forget
+                    for _ in range(count // 3):
+                        body(env); body(env); body(env)
+                return cycle
+
+            def cycle(env: Environment) -> None:
+                count = attune(frequency(env))
+                memo[:] = forget
+                for _ in range(count): body(env)
+            return cycle
+
+        # One scope serves every iteration; renewing it (all slots UNBOUND and
+        # nothing sealed) is indistinguishable from a fresh Environment.
+        def cycle_scoped(env: Environment) -> None:
+            count = attune(frequency(env))
+            memo[:] = forget
+            if count <= 0: return
+            scope = Environment(env, layout)
+            slots, sealed = scope.slots, scope.sealed
+            fresh = [UNBOUND] * len(slots)
+            if unrolled and count % 3 == 0:
+                for _ in range(count // 3):
+                    slots[:] = fresh; sealed.clear(); body(scope)
+                    slots[:] = fresh; sealed.clear(); body(scope)
+                    slots[:] = fresh; sealed.clear(); body(scope)
+                return
+            for _ in range(count):
+                slots[:] = fresh
+                if sealed: sealed.clear()
+                body(scope)
+        return cycle_scoped
+
+    def _morph(self, stmt: Morph) -> Rite:
+        target, transmute = stmt.target, self.interpreter._transmute
+
+        def morph(env: Environment) -> None:
+            env.assign_name(target, transmute(stmt, env.get_name(target)))
+        return morph
+
+    def _block(self, stmt: Block) -> Rite:
+        body, layout = self._sequence(stmt.statements), stmt.layout
+
+        def block(env: Environment) -> None:
+            body(Environment(env, layout))
+        return block
+
+    def _conditional(self, stmt: Conditional) -> Rite:
+        condition = self.compile_expression(stmt.condition)
+        then_branch = self.compile_statement(stmt.then_branch)
+        else_branch = self.compile_statement(stmt.else_branch) if stmt.else_branch else _inert
+        is_truthy = self.interpreter._is_truthy
+
+        def conditional(env: Environment) -> None:
+            if is_truthy(condition(env)): then_branch(env)
+            else: else_branch(env)
+        return conditional
+
+    # --- Expressions ---
+
+    def _literal(self, expr: Literal) -> Spell:
+        value = expr.value
+        return lambda env: value
+
+    def _variable(self, expr: Variable) -> Spell:
+        name = expr.name.lexeme
+        if expr.address is None: return lambda env: env.get_name(name)
+        depth, slot = expr.address
+
+        # An UNBOUND slot means the binding was made (or banished) dynamically:
+        # the name-based lookup then decides, exactly like the tree-walker.
+        if depth == 0:
+            def read(env: Environment) -> Any:
+                value = env.slots[slot]
+                return env.get_name(name) if value is UNBOUND else value
+            return read
+
+        owner = _scope_finder(depth)
+
+        def read_outer(env: Environment) -> Any:
+            value = owner(env).slots[slot]
+            return env.get_name(name) if value is UNBOUND else value
+        return read_outer
+
+    def _binary(self, expr: Binary) -> Spell:
+        if self.loops and self.loops[-1][0] is not None:
+            written, memo = self.loops[-1]
+            reads: Set[str] = set()
+            _read_names(expr, reads)
+            if reads and reads.isdisjoint(written): return self._hoist(expr, memo)
+
+        left, right = self.compile_expression(expr.left), self.compile_expression(expr.right)
+        op = BINARY_OPERATORS.get(expr.operator.type)
+        if op is None: return _inert
+        return lambda env: op(left(env), right(env))
+
+    def _hoist(self, expr: Binary, memo: List[Any]) -> Spell:
+        """
+        Evaluates a loop-invariant expression once per performance of its
+        cycle. The first evaluation happens exactly where it used to, so a
+        failure (e.g. an undefined variable) still surfaces at the same point.
+        """
+        loops, self.loops = self.loops, []
+        try:
+            spell = self._binary(expr)
+        finally:
+            self.loops = loops
+        cell = len(memo)
+        memo.append(UNBOUND)
+
+        def invariant(env: Environment) -> Any:
+            value = memo[cell]
+            if value is UNBOUND: value = memo[cell] = spell(env)
+            return value
+        return invariant
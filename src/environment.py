@@ -0,0 +1,191 @@
+"""
+src/environment.py
+====================================
+The Memory of the System (The Ether).
+Holds the Environment (scopes of Bindings) shared by every engine
+that performs a ritual: the tree-walking Interpreter and the Compiler.
+
+Bindings live in an indexed list of slots. The name -> slot mapping is a
+Layout, shared by every Environment created for the same Block, so that
+engines which resolved a variable ahead of time (see src/scope_resolver.py)
+can read it with a plain index instead of searching the scope chain.
+"""
+
+from typing import Any, List, Dict, Optional, Set
+from .lexer import Token
+
+class RuntimeException(Exception):
+    """Raised when a ritual fails during execution."""
+    pass
+
+class _Unbound:
+    """Marks a slot whose variable has not been bound (or was banished)."""
+    def __repr__(self): return "UNBOUND"
+
+UNBOUND = _Unbound()
+
+class Layout:
+    """
+    The shape of a scope: which slot each variable name occupies.
+    Layouts only ever grow, so a slot index stays valid for their lifetime.
+    """
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def declare(self, name: str) -> int:
+        slot = self.index.get(name)
+        if slot is None:
+            slot = self.index[name] = len(self.names)
+            self.names.append(name)
+        return slot
+
+    def __len__(self): return len(self.names)
+
+class Environment:
+    """
+    The Memory of the System.
+    Stores variables (Bindings) and handles Scopes.
+    """
+    def __init__(self, enclosing=None, layout: Layout = None):
+        self.layout = layout if layout is not None else Layout()
+        self.slots: List[Any] = [UNBOUND] * len(self.layout)
+        self.enclosing = enclosing  # For parent scopes (like inside a loop)
+        self.sealed: Set[str] = set() # Names of sealed (immutable) variables
+        self.frozen = False         # A frozen scope accepts no writes at all
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """A name-keyed snapshot of the variables bound in this scope."""
+        slots = self.slots
+        return {name: slots[slot] for name, slot in self.layout.index.items()
+                if slot < len(slots) and slots[slot] is not UNBOUND}
+
+    def ancestor(self, depth: int) -> 'Environment':
+        """The scope `depth` circles outwards from this one."""
+        scope = self
+        for _ in range(depth): scope = scope.enclosing
+        return scope
+
+    def reserve(self):
+        """Grows the slots to cover names declared in the Layout since creation."""
+        missing = len(self.layout) - len(self.slots)
+        if missing > 0: self.slots.extend([UNBOUND] * missing)
+
+    def define(self, name: str, value: Any):
+        if name in self.sealed:
+            raise RuntimeException(f"Cannot re-bind sealed variable '{name}'.")
+        if self.frozen:
+            raise RuntimeException(f"Cannot bind '{name}' in a frozen scope.")
+        slot = self.layout.declare(name)
+        if slot >= len(self.slots): self.reserve()
+        self.slots[slot] = value
+
+    def lookup_owner(self, name: str) -> Optional['Environment']:
+        """The nearest scope (this one or an enclosing one) where the name is bound, else None."""
+        scope = self
+        while scope is not None:
+            slot = scope.layout.index.get(name)
+            if slot is not None and slot < len(scope.slots) and scope.slots[slot] is not UNBOUND:
+                return scope
+            scope = scope.enclosing
+        return None
+
+    def get_name(self, name: str) -> Any:
+        owner = self.lookup_owner(name)
+        if owner is None:
+            raise RuntimeException(f"Undefined variable '{name}'.")
+        return owner.slots[owner.layout.index[name]]
+
+    def get(self, name: Token) -> Any:
+        return self.get_name(name.lexeme)
+
+    def assign_name(self, name: str, value: Any):
+        scope = self
+        while scope is not None:
+            if name in scope.sealed:
+                raise RuntimeException(f"Cannot hex/modify sealed variable '{name}'.")
+            slot = scope.layout.index.get(name)
+            if slot is not None and slot < len(scope.slots) and scope.slots[slot] is not UNBOUND:
+                scope.slots[slot] = value
+                return
+            scope = scope.enclosing
+
+        raise RuntimeException(f"Undefined variable '{name}'.")
+
+    def assign(self, name: Token, value: Any):
+        self.assign_name(name.lexeme, value)
+
+    def set_or_define(self, name: str, value: Any):
+        """
+        The semantics of 'bind': update the nearest existing binding, else
+        define the name in this scope. A binding sealed in an enclosing
+        scope is shadowed here instead; one sealed in this scope cannot be
+        re-bound.
+        """
+        scope = self
+        while scope is not None:
+            slot = scope.layout.index.get(name)
+            if slot is not None and slot < len(scope.slots) and scope.slots[slot] is not UNBOUND:
+                if name in scope.sealed:
+                    break
+                scope.slots[slot] = value
+                return
+            scope = scope.enclosing
+
+        self.define(name, value)
+
+    def is_bound(self, name: str) -> bool:
+        """True when the name is bound in this very scope (not an enclosing one)."""
+        slot = self.layout.index.get(name)
+        return slot is not None and slot < len(self.slots) and self.slots[slot] is not UNBOUND
+
+    def seal(self, name: str):
+        # 1. Check local scope
+        if self.is_bound(name):
+            self.sealed.add(name)
+            return
+
+        # 2. Check outer scope (Recursive Fix)
+        if self.enclosing:
+            self.enclosing.seal(name)
+            return
+
+        # 3. Not found anywhere
+        raise RuntimeException(f"Cannot seal undefined variable '{name}'.")
+
+    def banish(self, name: str):
+        if self.is_bound(name):
+            if self.frozen:
+                raise RuntimeException(f"Cannot banish '{name}' from a frozen scope.")
+            self.slots[self.layout.index[name]] = UNBOUND
+        elif self.enclosing:
+            self.enclosing.banish(name)
+        else:
+            pass # Silent banish
+
+    def purge(self):
+        if self.frozen:
+            raise RuntimeException("Cannot purge a frozen scope.")
+        self.slots[:] = [UNBOUND] * len(self.slots)
+
+    def frozen_snapshot(self) -> 'Environment':
+        """
+        Captures every binding visible from this scope (inner ones win) into a
+        single, fully sealed, frozen Environment. Nothing can modify it, so one
+        snapshot can be shared as the enclosing scope of any number of rituals
+        (see Interpreter(parameters=...)) without being copied again.
+        """
+        visible: Dict[str, Any] = {}
+        scope = self
+        while scope is not None:
+            for name, value in scope.values.items():
+                visible.setdefault(name, value)
+            scope = scope.enclosing
+
+        snapshot = Environment()
+        for name, value in visible.items():
+            snapshot.define(name, value)
+        snapshot.sealed = set(visible)
+        snapshot.frozen = True
+        return snapshot
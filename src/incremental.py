@@ -0,0 +1,157 @@
+"""
+src/incremental.py
+====================================
+The Incremental Parser (The Palimpsest).
+Keeps a scroll parsed while it is being edited: the REPL's multi-line
+entries, or an editor showing diagnostics on every keystroke.
+
+The scroll is held as one span per top-level statement. An edit re-lexes
+and re-parses from the statement before the one it touches (whose end may
+depend on the first token after it) and stops as soon as a statement ends
+exactly where an untouched statement after the edit begins. Every
+statement from there on (and its Diagnostics) is reused as it was, only
+moved:
+
+    parser = IncrementalParser(source)
+    parser.edit(start, end, "new text")   # Like source[start:end] = "new text"
+    parser.statements                     # As Parser.parse() would return them
+    parser.diagnostics                    # ... and their Diagnostics
+
+Top-level statements are independent (a statement's extent only depends on
+its own tokens and the one after it), so the result is always the same as
+a full parse of the new source.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterator, List, Optional
+from .lexer import LexerError, Token, TokenType, scan_from
+from .parser import Parser, Diagnostic, Stmt, Expr, Param
+
+NEWLINE = re.compile(r"\n")
+
+@dataclass
+class Span:
+    """One top-level statement and where it lies in the source."""
+    start: int                     # Offset of its first token
+    end: int                       # Offset just past its last token
+    stmt: Optional[Stmt]           # None when it was lost to an error
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+    unfinished: bool = False       # It failed at the end of the scroll: more text may complete it
+
+def _tokens(node: Any) -> Iterator[Token]:
+    """Every Token held by an AST (Variable names, Binary operators)."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _tokens(item)
+    elif isinstance(node, Token):
+        yield node
+    elif isinstance(node, (Stmt, Expr, Param)):
+        for f in fields(node):
+            yield from _tokens(getattr(node, f.name))
+
+class IncrementalParser:
+    """
+    A scroll that can be edited and re-parsed in place.
+
+    Attributes:
+        source: The current text of the scroll.
+        spans: Its top-level statements, in order.
+        reparsed: How many statements the last edit parsed again.
+        reused: How many statements the last edit kept as they were.
+    """
+
+    def __init__(self, source: str = ""):
+        self.source = ""
+        self.line_starts = [0]
+        self.spans: List[Span] = []
+        self.reparsed = self.reused = 0
+        self.edit(0, 0, source)
+
+    @property
+    def statements(self) -> List[Stmt]:
+        return [span.stmt for span in self.spans if span.stmt is not None]
+
+    @property
+    def diagnostics(self) -> List[Diagnostic]:
+        return [diagnostic for span in self.spans for diagnostic in span.diagnostics]
+
+    @property
+    def unfinished(self) -> bool:
+        """True when the last statement ran out of scroll before it was complete."""
+        return bool(self.spans) and self.spans[-1].unfinished
+
+    def append(self, text: str):
+        self.edit(len(self.source), len(self.source), text)
+
+    def edit(self, start: int, end: int, text: str):
+        """Replaces source[start:end] with text and brings the statements up to date."""
+        if not 0 <= start <= end <= len(self.source):
+            raise ValueError(f"Edit [{start}:{end}] lies outside the scroll (length {len(self.source)}).")
+        old_spans, old_line_starts = self.spans, self.line_starts
+        self.source = self.source[:start] + text + self.source[end:]
+        self.line_starts = [0] + [m.end() for m in NEWLINE.finditer(self.source)]
+        delta = len(text) - (end - start)
+
+        # The statement holding the first token the edit may change (one that
+        # ends right at `start` may grow), and the one before it.
+        starts = [span.start for span in old_spans]
+        restart = max(bisect_left(starts, start) - 2, 0)
+        position = old_spans[restart].start if restart else 0
+        # Untouched statements that parsing may converge on, as they are now.
+        following = bisect_left(starts, end)
+
+        spans = old_spans[:restart]
+        self.reparsed = 0
+        begin = position
+        try:
+            line = bisect_right(self.line_starts, position)
+            parser = Parser(scan_from(self.source, position, line, self.line_starts[line - 1]))
+            while not parser.is_at_end():
+                begin = self._offset(parser.current)
+                while following < len(old_spans) and old_spans[following].start + delta < begin:
+                    following += 1
+                if following < len(old_spans) and old_spans[following].start + delta == begin:
+                    self._reuse(old_spans[following:], old_line_starts, end, start + len(text), delta)
+                    spans.extend(old_spans[following:])
+                    break
+                spans.append(self._statement(parser, begin))
+                self.reparsed += 1
+            else:
+                following = len(old_spans)
+        except LexerError as e:
+            # Nothing after an unreadable glyph can be tokenized.
+            spans.append(Span(begin, len(self.source), None, [Diagnostic(e.line, e.column, e.message)]))
+            following = len(old_spans)
+        self.reused = restart + len(old_spans) - following
+        self.spans = spans
+
+    def _statement(self, parser: Parser, begin: int) -> Span:
+        reported = len(parser.diagnostics)
+        stmt = parser.declaration()
+        diagnostics = parser.diagnostics[reported:]
+        end = parser.current
+        unfinished = end.type == TokenType.EOF and any(d.line == end.line and d.column == end.column for d in diagnostics)
+        last = parser.previous()
+        return Span(begin, self._offset(last) + last.end - last.start, stmt, diagnostics, unfinished)
+
+    def _offset(self, token: Token) -> int:
+        """Where a token of the current source begins in it."""
+        if token.text is self.source:
+            return token.start
+        return self.line_starts[token.line - 1] + token.column - 1  # Names keep only their own text
+
+    def _reuse(self, spans: List[Span], old_line_starts: List[int], old_end: int, new_end: int, delta: int):
+        """Moves reused statements past an edit, keeping the lines and columns of their Tokens and Diagnostics right."""
+        old_line = bisect_right(old_line_starts, old_end)
+        new_line = bisect_right(self.line_starts, new_end)
+        lines = new_line - old_line
+        columns = (new_end - self.line_starts[new_line - 1]) - (old_end - old_line_starts[old_line - 1])
+        for span in spans:
+            span.start += delta
+            span.end += delta
+            if lines or columns:
+                for placed in [*_tokens(span.stmt), *span.diagnostics]:
+                    if placed.line == old_line: placed.column += columns
+                    placed.line += lines
@@ -8,92 +8,95 @@ and executes the 13 Sealed Verbs.
 """
 
 import time
-from typing import Any, List, Dict, Optional
-from .lexer import TokenType, Token
+from typing import Any, Callable, List, Dict, Optional
+from .lexer import TokenType
 from .parser import (
     Stmt, Expr, Block, Cycle, Conditional,
     Invoke, Bind, Summon, Circle, Seal, Omen, Hex, Morph, Pact, Banish, Purge, Abyss, Echo,
-    Literal, Variable, Binary, Param
+    Literal, Variable, Binary
 )
+from .environment import Environment, RuntimeException
+from .compiler import Compiler
+from .bytecode import BytecodeCompiler
+from .vm import VM
+from .scope_resolver import ScopeResolver
+from .resolver import Resolver, shared_resolver
+from .search import similarity, FUZZY_THRESHOLD
+from .query import QueryError, parse_request
 # Integration with the Standard Library
-from .stdlib import StdLib
+from .stdlib import StdLib, CallSite
 
-class RuntimeException(Exception):
-    """Raised when a ritual fails during execution."""
-    pass
+# Seconds the Tesla Protocol pauses on a resonant frequency (3, 6, 9) by default.
+RESONANCE_DELAY = 0.1
 
-class Environment:
+class Interpreter:
     """
-    The Memory of the System.
-    Stores variables (Bindings) and handles Scopes.
+    The Ritual Performer.
+
+    Args:
+        engine: "closure" (default) compiles the AST into pre-bound closures
+            before performing it and is the fast engine; "vm" compiles it into
+            bytecode that can be inspected, threaded into closures for the
+            stack VM; "tree" walks the AST node by node and is kept as the
+            reference implementation.
+        parameters: An optional frozen snapshot (Environment.frozen_snapshot)
+            enclosing the ritual's own global scope. It is shared, never
+            copied, so large sealed parameter sets can be reused across runs.
+        resonance_delay: Seconds to pause when a cycle hits a resonant
+            frequency. Use 0 in batch/production mode; the banner is kept.
+        resonance_hook: Called with the frequency instead of pausing, for
+            embedders that want their own Tesla Protocol behaviour.
+        resolver: The ontology consulted by 'invoke'. By default, the
+            process-wide one for data/ (resolver.shared_resolver()), opened
+            on the first invocation, so rituals that invoke nothing never
+            load the grimoires.
     """
-    def __init__(self, enclosing=None):
-        self.values: Dict[str, Any] = {}
-        self.enclosing = enclosing  # For parent scopes (like inside a loop)
-        self.sealed: List[str] = [] # List of sealed (immutable) variables
-
-    def define(self, name: str, value: Any):
-        if name in self.sealed:
-            raise RuntimeException(f"Cannot re-bind sealed variable '{name}'.")
-        self.values[name] = value
-
-    def get(self, name: Token) -> Any:
-        if name.lexeme in self.values:
-            return self.values[name.lexeme]
-
-        if self.enclosing:
-            return self.enclosing.get(name)
-
-        raise RuntimeException(f"Undefined variable '{name.lexeme}'.")
-
-    def assign(self, name: Token, value: Any):
-        if name.lexeme in self.sealed:
-            raise RuntimeException(f"Cannot hex/modify sealed variable '{name.lexeme}'.")
-
-        if name.lexeme in self.values:
-            self.values[name.lexeme] = value
-            return
-
-        if self.enclosing:
-            self.enclosing.assign(name, value)
-            return
-
-        raise RuntimeException(f"Undefined variable '{name.lexeme}'.")
-
-    def seal(self, name: str):
-        # 1. Check local scope
-        if name in self.values:
-            self.sealed.append(name)
-            return
-        
-        # 2. Check outer scope (Recursive Fix)
-        if self.enclosing:
-            self.enclosing.seal(name)
-            return
-
-        # 3. Not found anywhere
-        raise RuntimeException(f"Cannot seal undefined variable '{name}'.")
-
-    def banish(self, name: str):
-        if name in self.values:
-            del self.values[name]
-        elif self.enclosing:
-            self.enclosing.banish(name)
-        else:
-            pass # Silent banish
-
-    def purge(self):
-        self.values.clear()
-
-class Interpreter:
-    def __init__(self):
-        self.environment = Environment()
-        self.resolver = None
+    ENGINES = ("closure", "vm", "tree")
+
+    def __init__(self, engine: str = "closure", parameters: Optional[Environment] = None,
+                 resonance_delay: float = RESONANCE_DELAY, resonance_hook: Optional[Callable[[int], None]] = None,
+                 resolver: Optional[Resolver] = None):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Choose one of {', '.join(self.ENGINES)}.")
+        if parameters is not None and not parameters.frozen:
+            raise ValueError("Shared parameters must be a frozen snapshot (Environment.frozen_snapshot()).")
+        self.environment = Environment(parameters)
+        self.resonance_delay = resonance_delay
+        self.resonance_hook = resonance_hook
+        self._resolver = resolver
+        self.engine = engine
+        self.compiler = Compiler(self)
+        self.vm = VM(self)
+        self._call_sites: Dict[str, CallSite] = {}  # The tree engine's, by entity
+
+    @property
+    def resolver(self) -> Resolver:
+        if self._resolver is None:
+            self._resolver = shared_resolver()
+        return self._resolver
+
+    @resolver.setter
+    def resolver(self, resolver: Resolver):
+        self._resolver = resolver
 
     def interpret(self, statements: List[Stmt]):
         try:
-            for statement in statements:
-                self.execute(statement)
+            if self.engine == "tree":
+                for statement in statements:
+                    self.execute(statement)
+                return
+
+            # The compiled engines address variables by slot.
+            layouts, scope = [], self.environment
+            while scope is not None:
+                layouts.insert(0, scope.layout)
+                scope = scope.enclosing
+            ScopeResolver(*layouts).resolve(statements)
+            self.environment.reserve()
+            if self.engine == "vm":
+                self.vm.run(BytecodeCompiler().compile(statements), self.environment)
+            else:
+                self.compiler.compile(statements)(self.environment)
         except RuntimeException as e:
             print(f"💥 Ritual Failure: {e}")
 
@@ -107,12 +110,8 @@ class Interpreter:
 
         elif isinstance(stmt, Bind):
             value = self.evaluate(stmt.value)
-            # Try to update existing variable first, else define new
-            try:
-                dummy_token = Token(TokenType.IDENTIFIER, stmt.name, None, 0)
-                self.environment.assign(dummy_token, value)
-            except RuntimeException:
-                self.environment.define(stmt.name, value)
+            # Update existing variable first, else define new
+            self.environment.set_or_define(stmt.name, value)
 
         elif isinstance(stmt, Invoke):
             self._execute_invoke(stmt)
@@ -121,6 +120,12 @@ class Interpreter:
             val = input(f"🔮 [OMEN] Enter value for '{stmt.target}': ")
             self.environment.define(stmt.target, val)
 
+        elif isinstance(stmt, Pact):
+            self.environment.define(stmt.target, self._pact(self.evaluate(stmt.request)))
+
+        elif isinstance(stmt, Summon):
+            self._summon(stmt.module_name)
+
         elif isinstance(stmt, Circle):
             try:
                 self.execute(stmt.body)
@@ -137,8 +142,7 @@ class Interpreter:
                 if p.name in ["val", "value"]:
                     val = self.evaluate(p.value)
             if val is not None:
-                dummy_token = Token(TokenType.IDENTIFIER, stmt.target, None, 0)
-                self.environment.assign(dummy_token, val)
+                self.environment.assign_name(stmt.target, val)
             else:
                  print(f"⚠️ [HEX] No 'value' parameter provided to hex '{stmt.target}'.")
 
@@ -176,14 +180,30 @@ class Interpreter:
         Executes an invocation. It first checks the JSON Ontology (Resolver).
         If the entity is not in the JSON, it falls back to the Standard Library.
         """
-        entity_id = stmt.entity
         params = {}
         if stmt.params:
             for p in stmt.params:
                 params[p.name] = self.evaluate(p.value)
-        
-        args_list = list(params.values())
+        site = self._call_sites.get(stmt.entity)
+        if site is None:
+            site = self._call_sites[stmt.entity] = CallSite()
+        self._invoke(stmt.entity, params, site)
 
+    def _invoke(self, entity_id: str, params: Dict[str, Any], site: Optional[CallSite] = None):
+        """
+        Performs an invocation with its parameters already evaluated. With a
+        call site, the entity is only resolved again once the resolver or the
+        StdLib registry has changed.
+        """
+        if site is None:
+            return self._summoning(entity_id)(params)
+        if site.resolver is not self.resolver or site.generation != StdLib.modules.generation:
+            site.perform = self._summoning(entity_id)
+            site.resolver, site.generation = self.resolver, StdLib.modules.generation
+        return site.perform(params)
+
+    def _summoning(self, entity_id: str) -> Callable[[Dict[str, Any]], Any]:
+        """Resolves what an invocation does, as a callable taking its parameters."""
         # 1. Try to find the Entity in the JSON Database (Grimoire)
         entity_data = None
         if self.resolver:
@@ -191,7 +211,8 @@ class Interpreter:
 
         # SCENARIO A: Found in JSON (e.g., Historical figures)
         if entity_data:
-            print(f"🕯️ [INVOKE] Summoning {entity_data.get('name', entity_id)}...")
+            name = entity_data.get('name', entity_id)
+            spell = None
             
             magic_func = entity_data.get('mpl_function')
             if magic_func:
@@ -201,10 +222,14 @@ class Interpreter:
                 if '.' in clean_func:
                     module_name = clean_func.split('.')[0]
                     func_name = clean_func.split('.')[1]
-                    StdLib.call(module_name, func_name, args_list)
+                    spell = StdLib.bind(module_name, func_name)
                 else:
-                     StdLib.call(clean_func, None, args_list)
-            return
+                    spell = StdLib.bind(clean_func, None)
+
+            def summon(params):
+                print(f"🕯️ [INVOKE] Summoning {name}...")
+                if spell: spell(params)
+            return summon
 
         # SCENARIO B: Not in JSON, Fallback to Standard Library directly
         # This handles cases like 'invoke.vassago' or 'market.divine' directly.
@@ -220,13 +245,55 @@ class Interpreter:
             module_name = parts[0]
             func_name = parts[1]
 
+        if not StdLib.knows(module_name):
+            message = f"⚠️ [INVOKE] The spirit '{module_name}' did not answer (Not found in Grimoire).{self._did_you_mean(module_name)}"
+            return lambda params: print(message)
+
         # Call the Standard Library
-        result = StdLib.call(module_name, func_name, args_list)
-        
-        # Note: StdLib.call handles printing error messages if the module is unknown.
+        return StdLib.bind(module_name, func_name)
+
+    def _did_you_mean(self, name: str) -> str:
+        """Suggests the StdLib modules and ontology entities a misspelt name may have meant."""
+        name = name.lower().strip()
+        modules = sorted((m for m in StdLib.modules if similarity(name, m) >= FUZZY_THRESHOLD),
+                         key=lambda m: -similarity(name, m))
+        entities = self.resolver.suggest(name) if self.resolver else []
+        suggestions = list(dict.fromkeys(modules + entities))[:3]
+        return f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+
+    def _summon(self, module_name: str):
+        """Imports a StdLib module (or plugin) now, rather than on its first invocation."""
+        if not StdLib.knows(module_name):
+            print(f"⚠️ [SUMMON] The module '{module_name}' did not answer (Not registered nor installed).{self._did_you_mean(module_name)}")
+            return
+        try:
+            StdLib.summon(module_name)
+        except Exception as e:
+            raise RuntimeException(f"The module '{module_name}' could not be summoned: {e}")
+        print(f"📦 [SUMMON] The module '{module_name}' answers.")
+
+    def _pact(self, request: Any) -> List[str]:
+        """
+        Asks the ontology which entities answer a request (see src/query.py),
+        e.g. "element=Fire rank=King order=-en_count limit=3". Returns their names.
+        """
+        try:
+            filters, order_by, descending, limit = parse_request(request)
+            records = self.resolver.query(order_by, descending, limit, **filters) if self.resolver else []
+        except QueryError as e:
+            raise RuntimeException(f"The pact was refused: {e}")
+        names = [record.get("name", "") for record in records]
+        print(f"📜 [PACT] {len(names)} entities answered: {', '.join(names)}")
+        return names
 
     def _execute_cycle(self, stmt: Cycle):
-        count = self.evaluate(stmt.frequency)
+        count = self._attune_cycle(self.evaluate(stmt.frequency))
+
+        for i in range(count):
+            self.execute(stmt.body)
+
+    def _attune_cycle(self, count: Any) -> int:
+        """Validates a cycle frequency and applies the Tesla Protocol to it."""
         if not isinstance(count, int):
             raise RuntimeException("Cycle frequency must be an integer.")
 
@@ -234,27 +301,29 @@ class Interpreter:
 
         if is_resonant:
             print(f"⚡ [TESLA PROTOCOL] Resonant Frequency {count} detected. Optimizing ritual...")
-            time.sleep(0.1) 
+            if self.resonance_hook:
+                self.resonance_hook(count)
+            elif self.resonance_delay > 0:
+                time.sleep(self.resonance_delay)
 
-        for i in range(count):
-            self.execute(stmt.body)
+        return count
 
     def _execute_morph(self, stmt: Morph):
-        dummy_token = Token(TokenType.IDENTIFIER, stmt.target, None, 0)
-        current_val = self.environment.get(dummy_token)
+        current_val = self.environment.get_name(stmt.target)
+        self.environment.assign_name(stmt.target, self._transmute(stmt, current_val))
 
+    def _transmute(self, stmt: Morph, current_val: Any) -> Any:
+        """Casts a value into the essence (type) requested by a Morph."""
         try:
             if stmt.target_type == TokenType.TYPE_MANA: 
-                new_val = int(current_val)
-            elif stmt.target_type == TokenType.TYPE_FLUX: 
-                new_val = float(current_val)
-            elif stmt.target_type == TokenType.TYPE_SIGIL: 
-                new_val = str(current_val)
-            
-            self.environment.assign(dummy_token, new_val)
-
+                return int(current_val)
+            if stmt.target_type == TokenType.TYPE_FLUX: 
+                return float(current_val)
+            if stmt.target_type == TokenType.TYPE_SIGIL: 
+                return str(current_val)
         except ValueError:
             raise RuntimeException(f"Failed to morph '{stmt.target}'. Incompatible essence.")
+        raise RuntimeException(f"Cannot morph '{stmt.target}' into {stmt.target_type.name}.")
 
     def execute_block(self, statements: List[Stmt], environment: Environment):
         previous = self.environment
@@ -289,7 +358,8 @@ class Interpreter:
 
         return None
 
-    def _is_truthy(self, object: Any) -> bool:
+    @staticmethod
+    def _is_truthy(object: Any) -> bool:
         if object is None: return False
         if isinstance(object, bool): return object
         if object == 0: return False
@@ -3,11 +3,20 @@ src/lexer.py
 ====================================
 The Lexer (Tokenizer) for MPL.
 Updated to include Arithmetic Operators.
+
+Two tokenizers produce the same Token stream:
+  Lexer       scans one character at a time (the reference).
+  RegexLexer  matches one compiled master pattern per token; much faster
+              on large generated scrolls (mpl run --lexer=regex).
+
+stream_tokens() yields the same stream lazily from an iterable of lines
+(e.g. an open file), so huge scrolls are never held in memory as a whole.
 """
 
+import re
+import sys
 from enum import Enum, auto
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 class TokenType(Enum):
     # --- THE 13 SEALED VERBS ---
@@ -43,38 +52,71 @@ class TokenType(Enum):
 
     EOF = auto()
 
-@dataclass
 class Token:
-    type: TokenType
-    lexeme: str
-    literal: Any
-    line: int
+    """
+    One lexeme of a scroll. Slotted: a generated scroll holds millions of them.
+
+    The lexeme is not copied out of the source. `text` is the buffer it
+    lives in, at [start:end]: the scroll's source for numbers, Sigils and
+    symbols, or the interned name itself for identifiers and keywords, so
+    every occurrence of a name shares one string.
+    """
+    __slots__ = ("type", "text", "start", "end", "literal", "line", "column")
+
+    def __init__(self, type: TokenType, lexeme: str, literal: Any, line: int,
+                 column: int = 0, start: int = 0, end: Optional[int] = None):
+        # With start/end, `lexeme` is the buffer holding the lexeme.
+        self.type = type
+        self.text = lexeme
+        self.start = start
+        self.end = len(lexeme) if end is None else end
+        self.literal = literal
+        self.line = line
+        self.column = column  # 1-based; 0 when unknown
+
+    @property
+    def lexeme(self) -> str:
+        return self.text[self.start:self.end]  # The whole text is returned as is, not copied.
+
+    def __eq__(self, other):
+        if other.__class__ is not Token: return NotImplemented
+        return (self.type, self.lexeme, self.literal, self.line) == (other.type, other.lexeme, other.literal, other.line)
+
+    __hash__ = None  # Mutable and compared by value, like the AST nodes.
+
     def __repr__(self): return f"Token({self.type.name}, '{self.lexeme}', {self.literal})"
 
-class LexerError(Exception): pass
+class LexerError(Exception):
+    def __init__(self, message: str, line: int = 0, column: int = 0):
+        super().__init__(f"{message} at line {line}" if line else message)
+        self.message, self.line, self.column = message, line, column  # 0 when unknown
+
+KEYWORDS: Dict[str, TokenType] = {
+    "invoke": TokenType.INVOKE, "bind": TokenType.BIND, "summon": TokenType.SUMMON,
+    "circle": TokenType.CIRCLE, "seal": TokenType.SEAL, "omen": TokenType.OMEN,
+    "hex": TokenType.HEX, "morph": TokenType.MORPH, "pact": TokenType.PACT,
+    "banish": TokenType.BANISH, "purge": TokenType.PURGE, "abyss": TokenType.ABYSS,
+    "echo": TokenType.ECHO, "cycle": TokenType.CYCLE, "if": TokenType.IF,
+    "else": TokenType.ELSE, "to": TokenType.TO, "with": TokenType.WITH,
+    "into": TokenType.INTO, "Sigil": TokenType.TYPE_SIGIL, "Flux": TokenType.TYPE_FLUX,
+    "Mana": TokenType.TYPE_MANA, "Vessel": TokenType.TYPE_VESSEL, "Void": TokenType.TYPE_VOID,
+    "True": TokenType.BOOLEAN, "False": TokenType.BOOLEAN
+}
 
 class Lexer:
     def __init__(self, source: str):
         self.source = source
         self.tokens: List[Token] = []
         self.start = 0; self.current = 0; self.line = 1
-        self.keywords = {
-            "invoke": TokenType.INVOKE, "bind": TokenType.BIND, "summon": TokenType.SUMMON,
-            "circle": TokenType.CIRCLE, "seal": TokenType.SEAL, "omen": TokenType.OMEN,
-            "hex": TokenType.HEX, "morph": TokenType.MORPH, "pact": TokenType.PACT,
-            "banish": TokenType.BANISH, "purge": TokenType.PURGE, "abyss": TokenType.ABYSS,
-            "echo": TokenType.ECHO, "cycle": TokenType.CYCLE, "if": TokenType.IF,
-            "else": TokenType.ELSE, "to": TokenType.TO, "with": TokenType.WITH,
-            "into": TokenType.INTO, "Sigil": TokenType.TYPE_SIGIL, "Flux": TokenType.TYPE_FLUX,
-            "Mana": TokenType.TYPE_MANA, "Vessel": TokenType.TYPE_VESSEL, "Void": TokenType.TYPE_VOID,
-            "True": TokenType.BOOLEAN, "False": TokenType.BOOLEAN
-        }
+        self.line_start = 0  # Offset of the current line, for columns
+        self.keywords = KEYWORDS
 
     def scan_tokens(self) -> List[Token]:
         while not self.is_at_end():
             self.start = self.current
+            self.column = self.start - self.line_start + 1
             self.scan_token()
-        self.tokens.append(Token(TokenType.EOF, "", None, self.line))
+        self.tokens.append(Token(TokenType.EOF, "", None, self.line, self.current - self.line_start + 1))
         return self.tokens
 
     def scan_token(self):
@@ -99,27 +141,27 @@ class Lexer:
         elif c == '=': self.add_token(TokenType.EQ if self.match('=') else TokenType.ASSIGN)
         elif c == '!': 
             if self.match('='): self.add_token(TokenType.NEQ)
-            else: raise LexerError(f"Unexpected character '!' at line {self.line}")
+            else: raise LexerError("Unexpected character '!'", self.line, self.column)
         elif c == '<': self.add_token(TokenType.LTE if self.match('=') else TokenType.LT)
         elif c == '>': self.add_token(TokenType.GTE if self.match('=') else TokenType.GT)
 
         elif c in [' ', '\r', '\t']: pass
-        elif c == '\n': self.line += 1
+        elif c == '\n': self.line += 1; self.line_start = self.current
         elif c == '#':
             while self.peek() != '\n' and not self.is_at_end(): self.advance()
         elif c == '"': self.string()
         else:
             if c.isdigit(): self.number()
             elif self.is_alpha(c): self.identifier()
-            else: raise LexerError(f"Unknown glyph '{c}' at line {self.line}")
+            else: raise LexerError(f"Unknown glyph '{c}'", self.line, self.column)
 
     # Helpers
     def identifier(self):
         while self.is_alpha_numeric(self.peek()): self.advance()
-        text = self.source[self.start : self.current]
+        text = sys.intern(self.source[self.start : self.current])
         type_ = self.keywords.get(text, TokenType.IDENTIFIER)
         literal = True if text == "True" else (False if text == "False" else None)
-        self.add_token(type_, literal)
+        self.tokens.append(Token(type_, text, literal, self.line, self.column))
 
     def number(self):
         while self.peek().isdigit(): self.advance()
@@ -130,13 +172,14 @@ class Lexer:
         self.add_token(TokenType.NUMBER, float(val) if '.' in val else int(val))
 
     def string(self):
+        line = self.line  # A Sigil is placed on the line where it opens
         while self.peek() != '"' and not self.is_at_end():
-            if self.peek() == '\n': self.line += 1
+            if self.peek() == '\n': self.line += 1; self.line_start = self.current + 1
             self.advance()
-        if self.is_at_end(): raise LexerError("Unterminated string.")
+        if self.is_at_end(): raise LexerError("Unterminated string", line, self.column)
         self.advance()
         val = self.source[self.start + 1 : self.current - 1]
-        self.add_token(TokenType.STRING, val)
+        self.tokens.append(Token(TokenType.STRING, self.source, val, line, self.column, self.start, self.current))
 
     def match(self, expected):
         if self.is_at_end() or self.source[self.current] != expected: return False
@@ -144,7 +187,136 @@ class Lexer:
     def peek(self): return '\0' if self.is_at_end() else self.source[self.current]
     def peek_next(self): return '\0' if self.current + 1 >= len(self.source) else self.source[self.current + 1]
     def advance(self): self.current += 1; return self.source[self.current - 1]
-    def add_token(self, type_, literal=None): self.tokens.append(Token(type_, self.source[self.start : self.current], literal, self.line))
+    def add_token(self, type_, literal=None):
+        self.tokens.append(Token(type_, self.source, literal, self.line, self.column, self.start, self.current))
     def is_at_end(self): return self.current >= len(self.source)
     def is_alpha(self, c): return ('a'<=c<='z') or ('A'<=c<='Z') or c=='_'
     def is_alpha_numeric(self, c): return self.is_alpha(c) or c.isdigit()
+
+# One alternative per kind of token, tried in order at each position. Digits
+# are \d (like str.isdigit in Lexer); letters are ASCII only (like is_alpha).
+MASTER_PATTERN = re.compile(r"""
+    (?P<newline>\n)
+  | (?P<space>[ \r\t]+)
+  | (?P<comment>\#[^\n]*)
+  | (?P<name>[A-Za-z_][A-Za-z_\d]*)
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<string>"[^"]*")
+  | (?P<symbol>->|==|!=|<=|>=|[(){},.+*/=<>-])
+  | (?P<unterminated>")
+  | (?P<glyph>.)
+""", re.VERBOSE | re.DOTALL)
+
+SYMBOLS: Dict[str, TokenType] = {
+    "(": TokenType.LPAREN, ")": TokenType.RPAREN, "{": TokenType.LBRACE, "}": TokenType.RBRACE,
+    ",": TokenType.COMMA, ".": TokenType.DOT, "+": TokenType.PLUS, "*": TokenType.STAR,
+    "/": TokenType.SLASH, "-": TokenType.MINUS, "->": TokenType.ARROW, "=": TokenType.ASSIGN,
+    "==": TokenType.EQ, "!=": TokenType.NEQ, "<": TokenType.LT, "<=": TokenType.LTE,
+    ">": TokenType.GT, ">=": TokenType.GTE,
+}
+
+class RegexLexer:
+    """
+    A drop-in replacement for Lexer built on MASTER_PATTERN: one regex match
+    per token instead of several method calls per character. Produces the
+    same Tokens (lexemes, literals, lines and columns) and the same LexerErrors.
+    """
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens: List[Token] = []
+
+    def scan_tokens(self) -> List[Token]:
+        try:
+            self.tokens.extend(_scan(self.source, 1, 0, final=True))
+        except _ExoticDigit:
+            # A digit outside \d (e.g. '²'): rare enough to let Lexer decide.
+            self.tokens = Lexer(self.source).scan_tokens()
+        return self.tokens
+
+class _ExoticDigit(Exception): pass
+
+class _Unterminated(Exception):
+    """A Sigil still open at the end of a buffer that more lines may follow."""
+    def __init__(self, offset: int, line: int, line_start: int):
+        self.offset, self.line, self.line_start = offset, line, line_start
+
+def _scan(buffer: str, line: int, line_start: int, final: bool, pos: int = 0) -> Iterator[Token]:
+    """
+    Yields the Tokens of buffer[pos:], where `line` starts at offset
+    `line_start`. A final buffer ends with EOF; otherwise an unterminated
+    Sigil raises _Unterminated, so the caller can retry with more text.
+    """
+    intern, keywords = sys.intern, KEYWORDS
+    for match in MASTER_PATTERN.finditer(buffer, pos):
+        kind = match.lastgroup
+        if kind == "space" or kind == "comment":
+            continue
+        start = match.start()
+        if kind == "name":
+            # Names are interned: every occurrence shares one string.
+            text = intern(match.group())
+            yield Token(keywords.get(text, TokenType.IDENTIFIER), text,
+                        True if text == "True" else (False if text == "False" else None), line, start - line_start + 1)
+        elif kind == "symbol":
+            yield Token(SYMBOLS[match.group()], buffer, None, line, start - line_start + 1, start, match.end())
+        elif kind == "newline":
+            line += 1; line_start = match.end()
+        elif kind == "number":
+            text = match.group()
+            yield Token(TokenType.NUMBER, buffer, float(text) if "." in text else int(text), line,
+                        start - line_start + 1, start, match.end())
+        elif kind == "string":
+            text = match.group()
+            yield Token(TokenType.STRING, buffer, text[1:-1], line, start - line_start + 1, start, match.end())
+            newlines = text.count("\n")
+            if newlines:
+                line += newlines; line_start = start + text.rindex("\n") + 1
+        elif kind == "unterminated":
+            if final: raise LexerError("Unterminated string", line, start - line_start + 1)
+            raise _Unterminated(start, line, line_start)
+        elif match.group() == "!":
+            raise LexerError("Unexpected character '!'", line, start - line_start + 1)
+        elif match.group().isdigit():
+            raise _ExoticDigit()
+        else:
+            raise LexerError(f"Unknown glyph '{match.group()}'", line, start - line_start + 1)
+    if final:
+        yield Token(TokenType.EOF, "", None, line, len(buffer) - line_start + 1)
+
+def stream_tokens(lines: Iterable[str]) -> Iterator[Token]:
+    """
+    Tokenizes a scroll line by line with MASTER_PATTERN, yielding each Token
+    as soon as it is complete. Only the current line is held in memory (plus
+    the lines of a Sigil that spans several). Lines must keep their '\n'.
+    """
+    line, carried, line_start = 1, "", 0
+    for text in lines:
+        buffer, carried = carried + text if carried else text, ""
+        try:
+            for token in _scan(buffer, line, line_start, final=False):
+                yield token
+            # The next buffer starts where this one ended (at column 1 after a '\n').
+            newlines = buffer.count("\n")
+            line_start = (buffer.rindex("\n") + 1 if newlines else line_start) - len(buffer)
+            line += newlines
+        except _Unterminated as open_sigil:
+            # The Sigil may close on a later line: carry it over, keeping its column.
+            carried, line = buffer[open_sigil.offset:], open_sigil.line
+            line_start = open_sigil.line_start - open_sigil.offset
+        except _ExoticDigit:
+            raise LexerError(f"Unsupported digit at line {line} (not streamable; use Lexer)")
+    yield from _scan(carried, line, line_start, final=True)
+
+def scan_from(source: str, pos: int, line: int, line_start: int) -> Iterator[Token]:
+    """
+    Lazily tokenizes source[pos:] (pos must be a token boundary on `line`,
+    which starts at offset `line_start`), ending with EOF. Lets a caller
+    re-lex only the tail of a scroll that changed.
+    """
+    try:
+        yield from _scan(source, line, line_start, final=True, pos=pos)
+    except _ExoticDigit:
+        raise LexerError(f"Unsupported digit after line {line} (re-scan the whole scroll with Lexer)")
+
+# The tokenizers selectable with 'mpl run --lexer'.
+LEXERS = {"scan": Lexer, "regex": RegexLexer}
@@ -7,9 +7,186 @@ Reads the .ms file and initiates the interpretation process.
 
 import sys
 import os
-from .lexer import Lexer
-from .parser import Parser
-from .interpreter import Interpreter
+import csv
+import json
+import time
+import argparse
+from dataclasses import asdict
+from typing import Iterator, List, Optional
+from . import __version__
+from .parse_cache import parse_scroll
+from .lexer import LEXERS, LexerError, stream_tokens
+from .parser import Parser, Diagnostic
+from .interpreter import Interpreter, RESONANCE_DELAY
+from .optimizer import Optimizer
+from .codex import Codex, CodexError, file_checksum
+from .resolver import CODEX_PATH, DATA_DIR, build_codex
+from .pine import TemplateError
+from .stdlib import Market
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Describes the commands and flags understood by 'mpl'."""
+    parser = argparse.ArgumentParser(prog="mpl", description="MPL - Magick Programming Language")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="Perform a ritual scroll (.ms).")
+    run.add_argument("filename", help="The ritual file to perform.")
+    run.add_argument("--engine", choices=Interpreter.ENGINES, default="closure",
+                     help="Execution engine: 'closure' (compiled, fastest, default), 'vm' (threaded bytecode, "
+                          "inspectable) or 'tree' (reference tree-walker).")
+    run.add_argument("--no-resonance-delay", action="store_true",
+                     help="Keep the Tesla Protocol banner but skip its pause on cycles of 3, 6 and 9 (batch mode).")
+    run.add_argument("-O", "--optimize", action="store_true",
+                     help="Fold constant expressions and remove dead branches before the ritual.")
+    run.add_argument("--lexer", choices=sorted(LEXERS), default="scan",
+                     help="Tokenizer: 'scan' (character by character, default) or 'regex' (master pattern, faster on large scrolls).")
+    run.add_argument("--no-cache", action="store_true",
+                     help="Always lex and parse the scroll; neither read nor write its __mplcache__ archive.")
+    run.add_argument("--stream", action="store_true",
+                     help="Lex the scroll line by line while parsing it, never holding its whole text or token list "
+                          "(for huge generated scrolls; implies --no-cache).")
+
+    lint = commands.add_parser("lint", help="Report the syntax errors of scrolls without performing them.")
+    lint.add_argument("scrolls", nargs="+", help="Scrolls (.ms), or folders searched for them.")
+    lint.add_argument("--format", choices=["text", "json"], default="text",
+                      help="'text' (scroll:line:column: message) or 'json' (one object per line).")
+    lint.add_argument("--no-cache", action="store_true",
+                      help="Parse every scroll; neither read nor write __mplcache__ archives.")
+
+    grimoire = commands.add_parser("grimoire", help="Compile the JSON grimoires into the binary codex.")
+    grimoire.add_argument("action", choices=["build", "check"],
+                          help="'build' binds data/*.json into the codex; 'check' reports whether it is stale.")
+    grimoire.add_argument("--codex", default=CODEX_PATH, help="The codex file (default: data/ontology.mplc).")
+
+    sweep = commands.add_parser("sweep", help="Write the Hybrid Strategy for every combination of its parameters.")
+    sweep.add_argument("output", help="A directory, or an archive ending in .zip.")
+    sweep.add_argument("params", nargs="*", metavar="name=values",
+                       help="title, fast, slow, rsi, adx or offset, each as a value, 'a,b,c' or 'start:stop:step' "
+                            "(stop included), e.g. fast=10:50:10 title='Oracle {fast}/{slow}'.")
+    sweep.add_argument("--workers", type=int, default=None,
+                       help="Rendering processes (default: one per CPU; 1 renders in this process).")
+
+    backtest = commands.add_parser("backtest", help="Score every variant of a sweep on local OHLC bars (needs NumPy).")
+    backtest.add_argument("bars", help="A CSV file with open, high, low and close columns.")
+    backtest.add_argument("sweep", help="The output of 'mpl sweep': a directory or a .zip archive.")
+    backtest.add_argument("--top", type=int, default=10, help="How many of the best variants to show (default: 10).")
+    backtest.add_argument("--scores", default=None, help="Also write every variant's score to this CSV file.")
+    return parser
+
+def find_scrolls(paths: List[str]) -> Iterator[str]:
+    """The given scrolls, and every .ms scroll under the given folders."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for folder, subfolders, names in os.walk(path):
+            subfolders[:] = sorted(d for d in subfolders if d != "__mplcache__")
+            yield from (os.path.join(folder, name) for name in sorted(names) if name.endswith(".ms"))
+
+def lint(paths: List[str], output_format: str = "text", use_cache: bool = True) -> int:
+    """
+    Parses scrolls in one pass and prints every Diagnostic, one per line.
+    Returns the exit status: 1 if any scroll has an error, else 0.
+    """
+    failed = False
+    for scroll in find_scrolls(paths):
+        try:
+            with open(scroll, "r", encoding="utf-8") as file:
+                diagnostics = parse_scroll(scroll, file.read(), use_cache=use_cache, lexer="regex").diagnostics
+        except LexerError as e:
+            diagnostics = [Diagnostic(e.line, e.column, e.message)]
+        except (OSError, UnicodeDecodeError) as e:
+            diagnostics = [Diagnostic(0, 0, f"Unreadable scroll: {e}")]
+        for d in diagnostics:
+            if output_format == "json":
+                print(json.dumps({"scroll": scroll, "line": d.line, "column": d.column, "message": d.message}))
+            else:
+                print(f"{scroll}:{d.line}:{d.column}: {d.message}")
+        failed = failed or bool(diagnostics)
+    return 1 if failed else 0
+
+def grimoire(action: str, codex_path: str = CODEX_PATH) -> int:
+    """
+    'build' compiles the grimoires into a codex; 'check' compares the codex
+    with them. Returns the exit status: 1 if the codex is missing or stale.
+    """
+    if action == "build":
+        folios = build_codex(codex_path)
+        for folio in folios:
+            print(f"📕 Bound {len(folio.records)} {folio.name} from {os.path.basename(folio.source)}.")
+        print(f"✨ Codex written: {codex_path} ({os.path.getsize(codex_path)} bytes).")
+        return 0
+
+    try:
+        codex = Codex.open(codex_path)
+    except (CodexError, OSError) as e:
+        print(f"⚠️ No readable codex at '{codex_path}': {e}")
+        return 1
+    stale = False
+    for source, name, kind, rows, checksum in codex.tables():
+        path = os.path.join(DATA_DIR, source)
+        fresh = os.path.exists(path) and file_checksum(path) == checksum
+        stale = stale or not fresh
+        print(f"{'✅' if fresh else '⚠️'} {source}: {rows} {name} ({kind}){'' if fresh else ' STALE'}")
+    if stale:
+        print("Run 'mpl grimoire build' to rebind the codex.")
+    return 1 if stale else 0
+
+def sweep(output: str, assignments: List[str], workers: Optional[int] = None) -> int:
+    """
+    Sweeps Market.divine's parameters over the given values. Returns the
+    exit status: 1 if a parameter is malformed or does not fit.
+    """
+    # Imported here: only this subcommand reads axis specs.
+    from .sweep import axis
+    axes = {}
+    for assignment in assignments:
+        name, found, spec = assignment.partition("=")
+        try:
+            if not found:
+                raise ValueError("expected name=values")
+            axes[name] = spec if name == "title" else axis(spec)
+        except ValueError as e:
+            print(f"⚠️ [ERROR] '{assignment}': {e}")
+            return 1
+    try:
+        Market.sweep(output, workers=workers, **axes)
+    except (TypeError, TemplateError, OSError) as e:
+        print(f"⚠️ [ERROR] The sweep failed: {e}")
+        return 1
+    return 0
+
+def backtest(bars_path: str, sweep_output: str, top: int = 10, scores_path: Optional[str] = None) -> int:
+    """
+    Scores every variant of a sweep on the bars of a CSV file, shows the
+    `top` by total return and writes all the scores to `scores_path`.
+    Returns the exit status: 1 if the bars, the sweep or NumPy are missing.
+    """
+    # Imported here: NumPy is optional, and slow to load.
+    from .backtest import BacktestError, load_csv, score_sweep
+    start = time.perf_counter()
+    try:
+        bars = load_csv(bars_path)
+        scored = list(score_sweep(bars, sweep_output))
+    except (BacktestError, OSError) as e:
+        print(f"⚠️ [ERROR] {e}")
+        return 1
+    print(f"🔮 [BACKTEST] {len(scored)} variants scored on {len(bars)} bars ({time.perf_counter() - start:.2f}s).")
+
+    ranked = sorted(scored, key=lambda item: item[1].total_return, reverse=True)
+    print(f"{'file':<28}{'return':>10}{'trades':>8}{'wins':>7}{'exposure':>10}  parameters")
+    for row, score in ranked[:top]:
+        params = " ".join(f"{name}={value}" for name, value in row.items() if name not in ("file", "title", "entity"))
+        print(f"{row['file']:<28}{score.total_return:>+10.1%}{score.trades:>8}{score.win_rate:>7.0%}"
+              f"{score.exposure:>10.0%}  {params}")
+
+    if scores_path and scored:
+        with open(scores_path, "w", encoding="utf-8", newline="") as file:
+            ledger = csv.DictWriter(file, fieldnames=list(scored[0][0]) + list(asdict(scored[0][1])))
+            ledger.writeheader()
+            ledger.writerows(dict(row, **asdict(score)) for row, score in scored)
+        print(f"📜 [BACKTEST] Scores inscribed in {scores_path}.")
+    return 0
 
 def main():
     """
@@ -18,7 +195,7 @@ def main():
     """
     # 1. Argüman Kontrolü
     if len(sys.argv) < 2:
-        print("🌙 MPL - Magick Programming Language v0.9.5")
+        print(f"🌙 MPL - Magick Programming Language v{__version__}")
         print("Usage: mpl run <ritual_file.ms>")
         return
 
@@ -26,7 +203,8 @@ def main():
 
     # 2. Komut: 'run'
     if command == "run" and len(sys.argv) >= 3:
-        filename = sys.argv[2]
+        args = build_arg_parser().parse_args(sys.argv[1:])
+        filename = args.filename
         
         if not os.path.exists(filename):
             print(f"⚠️ [ERROR] The scroll '{filename}' does not exist in this realm.")
@@ -35,23 +213,26 @@ def main():
         print(f"🌙 MPL Interpreter Initialized. Loading '{filename}'...")
 
         try:
+            # --- The Pipeline ---
             with open(filename, 'r', encoding='utf-8') as file:
-                source_code = file.read()
+                if args.stream:
+                    # Lexer and Parser overlap: tokens exist only in the lookahead.
+                    ast = Parser(stream_tokens(file)).parse()
+                else:
+                    # Lexer -> Parser, skipped when __mplcache__ holds this exact scroll.
+                    ast = parse_scroll(filename, file.read(), use_cache=not args.no_cache, lexer=args.lexer)
+            for diagnostic in ast.diagnostics:
+                print(f"Syntax Error: {diagnostic}")
 
-            # --- The Pipeline ---
-            lexer = Lexer(source_code)
-            tokens = lexer.scan_tokens()
-            
-            # (Hata ayıklama için tokenleri görmek istersen burayı açabilirsin)
-            # print(tokens) 
-            
-            parser = Parser(tokens)
-            ast = parser.parse()
+            if args.optimize:
+                optimizer = Optimizer()
+                ast = optimizer.optimize(ast)
+                print(f"⚗️ [OPTIMIZER] {optimizer.eliminated} nodes eliminated.")
             
-            print("📚 Magi Loaded.")
             print("⚡ Beginning Ritual Execution...")
             
-            interpreter = Interpreter()
+            interpreter = Interpreter(engine=args.engine,
+                                      resonance_delay=0 if args.no_resonance_delay else RESONANCE_DELAY)
             interpreter.interpret(ast)
             
             print("✨ Ritual Concluded Successfully.")
@@ -59,9 +240,30 @@ def main():
         except Exception as e:
             print(f"💥 [BACKFIRE] Ritual Failed: {e}")
     
-    # 3. Bilinmeyen Komut
+    # 3. Komut: 'lint'
+    elif command == "lint" and len(sys.argv) >= 3:
+        args = build_arg_parser().parse_args(sys.argv[1:])
+        sys.exit(lint(args.scrolls, args.format, use_cache=not args.no_cache))
+
+    # 4. Komut: 'grimoire'
+    elif command == "grimoire" and len(sys.argv) >= 3:
+        args = build_arg_parser().parse_args(sys.argv[1:])
+        sys.exit(grimoire(args.action, args.codex))
+
+    # 5. Komut: 'sweep'
+    elif command == "sweep" and len(sys.argv) >= 3:
+        args = build_arg_parser().parse_args(sys.argv[1:])
+        sys.exit(sweep(args.output, args.params, args.workers))
+
+    # 6. Komut: 'backtest'
+    elif command == "backtest" and len(sys.argv) >= 4:
+        args = build_arg_parser().parse_args(sys.argv[1:])
+        sys.exit(backtest(args.bars, args.sweep, args.top, args.scores))
+
+    # 7. Bilinmeyen Komut
     else:
-        print(f"Unknown command: '{command}'. Try 'mpl run <file.ms>'")
+        print(f"Unknown command: '{command}'. Try 'mpl run <file.ms>', 'mpl lint <scrolls>', 'mpl grimoire build', "
+              f"'mpl sweep <output> fast=10:50:10' or 'mpl backtest <bars.csv> <sweep>'")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,132 @@
+"""
+src/optimizer.py
+====================================
+The Optimizer (The Alchemist's Reduction).
+An optional pass between Parser.parse and execution (mpl run -O) that
+distils the AST before any engine performs it:
+
+* Binary nodes over Literal operands are folded into a single Literal,
+  with MPL's own semantics (e.g. '+' weaves Sigils together).
+* Conditionals with a Literal condition are replaced by the branch that
+  would always be taken.
+* Empty Blocks are dropped from statement lists.
+
+Folding never hides a failure: an operation that would fail at runtime
+(e.g. a division by zero) is left in place to fail there. Nor does it
+build a Sigil longer than FOLD_LIMIT (e.g. "x" * 1000000000): that one is
+left for the ritual to build, if it ever gets there.
+"""
+
+from dataclasses import fields
+from typing import Any, List, Optional
+from .parser import Stmt, Expr, Block, Cycle, Conditional, Circle, Invoke, Bind, Hex, Pact, Abyss, Echo, Literal, Binary, Param
+from .lexer import TokenType
+from .compiler import BINARY_OPERATORS
+from .interpreter import Interpreter
+
+# The longest Sigil folding may produce.
+FOLD_LIMIT = 4096
+
+def _too_long(operator: TokenType, left: Any, right: Any) -> bool:
+    """Whether folding would build a Sigil longer than FOLD_LIMIT (measured before it is built)."""
+    if operator == TokenType.STAR:
+        return any(isinstance(text, str) and isinstance(count, int) and len(text) * count > FOLD_LIMIT
+                   for text, count in ((left, right), (right, left)))
+    if operator == TokenType.PLUS and (isinstance(left, str) or isinstance(right, str)):
+        return len(str(left)) + len(str(right)) > FOLD_LIMIT
+    return False
+
+def count_nodes(node: Any) -> int:
+    """Counts the AST nodes (statements, expressions and parameters) under a node or list of nodes."""
+    if isinstance(node, list):
+        return sum(count_nodes(n) for n in node)
+    if not isinstance(node, (Stmt, Expr, Param)):
+        return 0
+    return 1 + sum(count_nodes(getattr(node, f.name)) for f in fields(node))
+
+class Optimizer:
+    """
+    Rewrites a ritual into an equivalent, smaller one.
+
+    Attributes:
+        eliminated: How many AST nodes the last call to optimize() removed.
+    """
+
+    def __init__(self):
+        self.eliminated = 0
+
+    def optimize(self, statements: List[Stmt]) -> List[Stmt]:
+        optimized = self._statements(statements)
+        self.eliminated = count_nodes(statements) - count_nodes(optimized)
+        return optimized
+
+    def _statements(self, statements: List[Stmt]) -> List[Stmt]:
+        result = []
+        for stmt in statements:
+            stmt = self.statement(stmt)
+            if stmt is None or (isinstance(stmt, Block) and not stmt.statements):
+                continue  # Lost to a syntax error, or nothing left to perform.
+            result.append(stmt)
+        return result
+
+    def statement(self, stmt: Optional[Stmt]) -> Optional[Stmt]:
+        """Returns the optimized statement, or None when it performs nothing."""
+        if isinstance(stmt, Bind):
+            return Bind(stmt.name, self.expression(stmt.value))
+
+        if isinstance(stmt, Block):
+            return Block(self._statements(stmt.statements))
+
+        if isinstance(stmt, Cycle):
+            # An empty body is kept: the frequency is still validated and attuned.
+            return Cycle(self.expression(stmt.frequency), self.statement(stmt.body) or Block([]))
+
+        if isinstance(stmt, Conditional):
+            condition = self.expression(stmt.condition)
+            if isinstance(condition, Literal):
+                branch = stmt.then_branch if Interpreter._is_truthy(condition.value) else stmt.else_branch
+                return self.statement(branch)
+            then_branch = self.statement(stmt.then_branch) or Block([])
+            else_branch = self.statement(stmt.else_branch)
+            if isinstance(else_branch, Block) and not else_branch.statements:
+                else_branch = None
+            return Conditional(condition, then_branch, else_branch)
+
+        if isinstance(stmt, Circle):
+            body = self.statement(stmt.body)
+            return Circle(body) if body is not None else None
+
+        if isinstance(stmt, Invoke):
+            return Invoke(stmt.entity, self._params(stmt.params))
+
+        if isinstance(stmt, Hex):
+            return Hex(stmt.target, self._params(stmt.params))
+
+        if isinstance(stmt, Echo):
+            return Echo(self.expression(stmt.message))
+
+        if isinstance(stmt, Abyss):
+            return Abyss(self.expression(stmt.message))
+
+        if isinstance(stmt, Pact):
+            return Pact(stmt.target, self.expression(stmt.request))
+
+        return stmt
+
+    def _params(self, params: Optional[List[Param]]) -> Optional[List[Param]]:
+        if params is None: return None
+        return [Param(p.name, self.expression(p.value)) for p in params]
+
+    def expression(self, expr: Expr) -> Expr:
+        if not isinstance(expr, Binary):
+            return expr
+
+        left, right = self.expression(expr.left), self.expression(expr.right)
+        op = BINARY_OPERATORS.get(expr.operator.type)
+        if (op is not None and isinstance(left, Literal) and isinstance(right, Literal)
+                and not _too_long(expr.operator.type, left.value, right.value)):
+            try:
+                return Literal(op(left.value, right.value))
+            except Exception:
+                pass  # Left for the ritual to fail at runtime, as it would have.
+        return Binary(left, expr.operator, right)
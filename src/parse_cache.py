@@ -0,0 +1,138 @@
+"""
+src/parse_cache.py
+====================================
+The Scroll Archive (The Akashic Record).
+Keeps the parsed AST of every scroll in a compiled .msc file, so rituals
+that are performed again and again skip Lexer.scan_tokens and
+Parser.parse entirely, the way Python keeps __pycache__.
+
+    ritual.ms  ->  __mplcache__/ritual.msc
+
+An archive records the SHA-256 of the scroll's source and the MPL version
+that wrote it, and is only trusted when both still match. Anything else (a
+changed scroll, a new MPL, a damaged file) is quietly re-parsed and
+re-archived. Scrolls with syntax errors are never archived, so their
+Diagnostics are reported on every run.
+
+Archives are plain JSON: loading one can only ever rebuild AST nodes, never
+run code. Besides the version, each records a fingerprint of the AST's
+shape (node classes, their fields and the token types), so an archive
+written before the node classes changed is never trusted.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
+from . import __version__
+from . import parser as ast
+from .lexer import LEXERS, Token, TokenType
+from .parser import Parser, ParseResult
+
+CACHE_DIR = "__mplcache__"
+MAGIC = "MSC1"
+
+def _node_classes() -> Dict[str, type]:
+    """Every class an archive may rebuild, by name."""
+    classes = {"Token": Token, "Param": ast.Param}
+    for name, value in vars(ast).items():
+        if isinstance(value, type) and issubclass(value, (ast.Stmt, ast.Expr)):
+            classes[name] = value
+    return classes
+
+NODE_CLASSES = _node_classes()
+
+# Token is slotted rather than a dataclass; these rebuild it (see Token.__init__).
+TOKEN_FIELDS = ["type", "lexeme", "literal", "line", "column"]
+
+def _archived_fields(cls: type) -> List[str]:
+    """The fields an archive keeps. Resolver annotations (compare=False) are recomputed on every run."""
+    if cls is Token: return TOKEN_FIELDS
+    return [f.name for f in fields(cls) if f.compare]
+
+def _fingerprint() -> str:
+    shape = [(name, _archived_fields(cls)) for name, cls in sorted(NODE_CLASSES.items())]
+    shape.append(("TokenType", [t.name for t in TokenType]))
+    shape.append(("Token.__slots__", list(Token.__slots__)))
+    return hashlib.sha256(json.dumps(shape).encode("utf-8")).hexdigest()
+
+# Changes whenever parser.py or lexer.py change the shape of the AST.
+AST_FINGERPRINT = _fingerprint()
+
+def encode(value: Any) -> Any:
+    """Turns an AST (or any part of one) into plain JSON values."""
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, TokenType):
+        return {"type": value.name}
+    cls = type(value)
+    if NODE_CLASSES.get(cls.__name__) is cls:
+        return {"node": cls.__name__, "fields": [encode(getattr(value, name)) for name in _archived_fields(cls)]}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Cannot archive {type(value).__name__}.")
+
+def decode(value: Any) -> Any:
+    """Rebuilds what encode() produced. Anything unexpected raises."""
+    if isinstance(value, list):
+        return [decode(v) for v in value]
+    if isinstance(value, dict):
+        if "type" in value:
+            return TokenType[value["type"]]
+        cls = NODE_CLASSES[value["node"]]
+        names = _archived_fields(cls)
+        if len(value["fields"]) != len(names):
+            raise ValueError(f"Malformed {cls.__name__} in archive.")
+        return cls(**{name: decode(v) for name, v in zip(names, value["fields"])})
+    return value
+
+def cache_path(scroll: str) -> str:
+    """Where the archive of a scroll lives."""
+    folder, name = os.path.split(os.path.abspath(scroll))
+    return os.path.join(folder, CACHE_DIR, os.path.splitext(name)[0] + ".msc")
+
+def source_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def load(scroll: str, source: str) -> Optional[ParseResult]:
+    """The archived AST of a scroll, or None if there is no valid archive for this source."""
+    try:
+        with open(cache_path(scroll), "r", encoding="utf-8") as file:
+            record: Any = json.load(file)
+        if (not isinstance(record, dict) or record.get("magic") != MAGIC
+                or record.get("version") != __version__ or record.get("ast_fingerprint") != AST_FINGERPRINT
+                or record.get("source_hash") != source_hash(source)):
+            return None
+        return ParseResult(decode(record["ast"]))
+    except Exception:
+        return None  # Missing, stale or damaged: either way, parse again.
+
+def store(scroll: str, source: str, statements: List[ast.Stmt]):
+    """Archives a parsed scroll. A read-only realm simply goes without a cache."""
+    path = cache_path(scroll)
+    record = {"magic": MAGIC, "version": __version__, "ast_fingerprint": AST_FINGERPRINT,
+              "source_hash": source_hash(source), "ast": encode(statements)}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(record, file)
+        os.replace(temporary, path)  # Concurrent runs never see half an archive.
+    except OSError:
+        pass
+
+def parse_scroll(scroll: str, source: str, use_cache: bool = True, lexer: str = "scan") -> ParseResult:
+    """
+    Parses a scroll's source (tokenized by LEXERS[lexer]), through its
+    archive when one is valid. Syntax errors are in the result's diagnostics.
+    """
+    if use_cache:
+        statements = load(scroll, source)
+        if statements is not None:
+            return statements
+
+    statements = Parser(LEXERS[lexer](source).scan_tokens()).parse()
+    if use_cache and not statements.diagnostics:
+        store(scroll, source, statements)
+    return statements
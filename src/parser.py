@@ -2,77 +2,152 @@
 src/parser.py
 Updated to support Arithmetic Expressions (PEMDAS).
 """
-from dataclasses import dataclass
-from typing import List, Optional, Any
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Deque, Iterable, Iterator, List, Optional, Any, Tuple
 from .lexer import Token, TokenType
 
+def node(cls):
+    """
+    A @dataclass whose instances use __slots__ instead of a __dict__ (what
+    dataclass(slots=True) does on Python 3.10+). Generated scrolls hold
+    hundreds of thousands of nodes, so each one is kept as small as possible.
+    """
+    cls = dataclass(cls)
+    names = tuple(f.name for f in fields(cls) if f.name not in getattr(cls, '__slots__', ()))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 # AST Nodes
-@dataclass
+# A resolved variable address: (scopes to walk outwards, slot index in that scope).
+# Filled in by src/scope_resolver.py; None means "look the name up at runtime".
+Address = Optional[Tuple[int, int]]
+
+@node
 class Stmt: pass
-@dataclass
+@node
 class Expr: pass
 
-@dataclass
-class Block(Stmt): statements: List[Stmt]
-@dataclass
+@node
+class Block(Stmt):
+    statements: List[Stmt]
+    layout: Any = field(default=None, compare=False, repr=False)  # Resolved scope Layout
+@node
 class Cycle(Stmt): frequency: Expr; body: Stmt
-@dataclass
+@node
 class Conditional(Stmt): condition: Expr; then_branch: Stmt; else_branch: Optional[Stmt] = None
 
-@dataclass
+@node
 class Invoke(Stmt): entity: str; params: List['Param']
-@dataclass
-class Bind(Stmt): name: str; value: Expr
-@dataclass
+@node
+class Bind(Stmt): name: str; value: Expr; address: Address = field(default=None, compare=False)
+@node
 class Summon(Stmt): module_name: str
-@dataclass
+@node
 class Circle(Stmt): body: Stmt
-@dataclass
+@node
 class Seal(Stmt): target: str
-@dataclass
+@node
 class Omen(Stmt): target: str
-@dataclass
-class Hex(Stmt): target: str; params: List['Param']
-@dataclass
+@node
+class Hex(Stmt): target: str; params: List['Param']; address: Address = field(default=None, compare=False)
+@node
 class Morph(Stmt): target: str; target_type: TokenType
-@dataclass
+@node
 class Pact(Stmt): target: str; request: Expr
-@dataclass
+@node
 class Banish(Stmt): target: str
-@dataclass
+@node
 class Purge(Stmt): target: Optional[str]
-@dataclass
+@node
 class Abyss(Stmt): message: Expr
-@dataclass
+@node
 class Echo(Stmt): message: Expr
 
-@dataclass
+@node
 class Literal(Expr): value: Any
-@dataclass
-class Variable(Expr): name: Token
-@dataclass
+@node
+class Variable(Expr): name: Token; address: Address = field(default=None, compare=False)
+@node
 class Binary(Expr): left: Expr; operator: Token; right: Expr
-@dataclass
+@node
 class Param: name: str; value: Expr
 
-class ParserError(Exception): pass
+class ParserError(Exception):
+    def __init__(self, token: Token, message: str):
+        super().__init__(f"[Line {token.line}] {message}")
+        self.token, self.message = token, message
+
+@dataclass
+class Diagnostic:
+    """A syntax error, as reported by Parser.parse (column is 1-based; 0 when unknown)."""
+    line: int
+    column: int
+    message: str
+
+    def __str__(self): return f"[Line {self.line}:{self.column}] {self.message}"
+
+class ParseResult(list):
+    """The statements of a scroll, with the Diagnostics found while parsing it."""
+    def __init__(self, statements: Iterable[Stmt] = (), diagnostics: Optional[List[Diagnostic]] = None):
+        super().__init__(statements)
+        self.diagnostics: List[Diagnostic] = [] if diagnostics is None else diagnostics
+
+# The tokens a statement can begin with: where a parser lost in a broken
+# statement (panic mode) picks up again.
+STATEMENT_STARTS = frozenset({
+    TokenType.INVOKE, TokenType.BIND, TokenType.SUMMON, TokenType.CIRCLE, TokenType.SEAL,
+    TokenType.OMEN, TokenType.HEX, TokenType.MORPH, TokenType.PACT, TokenType.BANISH,
+    TokenType.PURGE, TokenType.ABYSS, TokenType.ECHO, TokenType.CYCLE, TokenType.IF,
+})
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.current = 0
+    """
+    Builds the AST from any iterable of Tokens: a list, or a lazy stream such
+    as lexer.stream_tokens(). Tokens are pulled one at a time: the parser
+    only holds the next token (plus any peek() looked further ahead).
+
+    Syntax errors never stop the parse: each is recorded in `diagnostics`
+    and the parser skips ahead to the next statement.
+    """
+    def __init__(self, tokens: Iterable[Token]):
+        self.stream: Iterator[Token] = iter(tokens)
+        self.last: Optional[Token] = None      # The most recently consumed token
+        self.current: Optional[Token] = None   # The next token to consume
+        self.lookahead: Deque[Token] = deque() # Tokens pulled beyond `current` by peek()
+        self.current = self._pull()
+        self.diagnostics: List[Diagnostic] = []
 
-    def parse(self) -> List[Stmt]:
-        statements = []
+    def parse(self) -> ParseResult:
+        """Every statement that parsed, with a Diagnostic for each one that did not."""
+        return ParseResult(self.statements(), self.diagnostics)
+
+    def statements(self) -> Iterator[Stmt]:
+        """Yields top-level statements as soon as each one is parsed."""
         while not self.is_at_end():
             stmt = self.declaration()
-            if stmt: statements.append(stmt)
-        return statements
+            if stmt: yield stmt
 
     def declaration(self):
+        start = self.current
         try: return self.statement()
         except ParserError as e:
-            print(f"Syntax Error: {e}"); return None
+            self.diagnostics.append(Diagnostic(e.token.line, e.token.column, e.message))
+            self.synchronize(start)
+            return None
+
+    def synchronize(self, start: Token):
+        """
+        Panic mode: skips to the next token that can begin a statement (or
+        the '}' closing the enclosing Block), so one broken statement is
+        reported once instead of cascading.
+        """
+        if self.current is start: self.advance()  # It failed on its very first token
+        while not self.is_at_end():
+            if self.current.type in STATEMENT_STARTS or self.current.type == TokenType.RBRACE: return
+            self.advance()
 
     def statement(self) -> Stmt:
         if self.match(TokenType.INVOKE): return self.invoke_stmt()
@@ -148,7 +223,9 @@ class Parser:
 
     def block(self):
         stmts = []
-        while not self.check(TokenType.RBRACE) and not self.is_at_end(): stmts.append(self.declaration())
+        while not self.check(TokenType.RBRACE) and not self.is_at_end():
+            stmt = self.declaration()
+            if stmt: stmts.append(stmt)
         self.consume(TokenType.RBRACE, "Expect '}'.")
         return Block(stmts)
 
@@ -200,14 +277,33 @@ class Parser:
         for t in types:
             if self.check(t): self.advance(); return True
         return False
-    def check(self, t): return False if self.is_at_end() else self.peek().type == t
+    def check(self, t):
+        type_ = self.current.type
+        return type_ == t and type_ != TokenType.EOF
     def advance(self):
-        if not self.is_at_end(): self.current += 1
-        return self.previous()
-    def is_at_end(self): return self.peek().type == TokenType.EOF
-    def peek(self): return self.tokens[self.current]
-    def previous(self): return self.tokens[self.current - 1]
+        if self.current.type != TokenType.EOF:
+            self.last = self.current
+            self.current = self.lookahead.popleft() if self.lookahead else self._pull()
+        return self.last
+    def is_at_end(self): return self.current.type == TokenType.EOF
+    def peek(self, distance: int = 0) -> Token:
+        """The token `distance` places ahead of the next one (EOF repeats forever)."""
+        if distance == 0: return self.current
+        lookahead = self.lookahead
+        while len(lookahead) < distance:
+            last = lookahead[-1] if lookahead else self.current
+            if last.type == TokenType.EOF: return last
+            lookahead.append(self._pull())
+        return lookahead[distance - 1]
+    def _pull(self) -> Token:
+        # A stream without its EOF Token ends as if it had one.
+        token = next(self.stream, None)
+        if token is None:
+            last = self.current or self.last
+            token = Token(TokenType.EOF, "", None, last.line if last else 1)
+        return token
+    def previous(self): return self.last
     def consume(self, t, msg):
         if self.check(t): return self.advance()
         raise self.error(self.peek(), msg)
-    def error(self, token, msg): return ParserError(f"[Line {token.line}] {msg}")
+    def error(self, token, msg): return ParserError(token, msg)
@@ -0,0 +1,154 @@
+"""
+src/pine.py
+====================================
+The Pine Emitter (The Scribe).
+Writes Pine Script from the templates in src/templates/ (one .pine file each).
+
+A template is plain Pine Script with typed slots:
+
+    teslaLen = input.int(${slow:int}, "Harmonic Trend Base")
+    indicator("${title:str} [Hakan Yorganci]", overlay=true)
+
+The kinds are int, float, bool and str (escaped to sit inside a Pine
+string); '$$' writes a '$'. Each template is parsed once, into its literal
+segments and slots. Renderings are cached (LRU) by their parameter values,
+so a sweep that meets a variant again never builds it twice, and they are
+written to a file or stream rather than printed:
+
+    emit("hybrid_oracle", "oracle.pine", title="Oracle", fast=50, slow=200, rsi=45, adx=20, offset=21)
+"""
+
+import functools
+import os
+import re
+from typing import Any, Callable, Dict, IO, List, Tuple, Union
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Renderings kept per template.
+CACHE_SIZE = 4096
+
+_SLOT = re.compile(r"\$\$|\$\{(\w+):(\w+)\}|\$")
+
+class TemplateError(Exception):
+    """Raised for a malformed template, or parameters that do not fit its slots."""
+    pass
+
+def _int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("a bool is not a number of bars")
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(f"{value!r} is not a whole number")
+    return int(number)
+
+def _float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError("a bool is not a number")
+    return float(value)
+
+def _bool(value: Any) -> str:
+    if isinstance(value, str) and value.lower() in ("true", "false"):
+        return value.lower()
+    if isinstance(value, (bool, int)):
+        return "true" if value else "false"
+    raise ValueError(f"{value!r} is neither true nor false")
+
+def _str(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Slot kind -> the conversion of a parameter (its result is what is cached on and written).
+KINDS: Dict[str, Callable[[Any], Any]] = {"int": _int, "float": _float, "bool": _bool, "str": _str}
+
+class Template:
+    """
+    A template parsed into segments: literal text, and (name, kind) slots.
+
+    Attributes:
+        names: The parameters, in the order they first appear.
+        kinds: Each parameter's slot kind.
+    """
+
+    def __init__(self, text: str, name: str = "<template>", cache_size: int = CACHE_SIZE):
+        self.name = name
+        self.segments: List[Union[str, Tuple[str, str]]] = []
+        kinds: Dict[str, str] = {}
+        literal, position = [], 0
+        for match in _SLOT.finditer(text):
+            literal.append(text[position:match.start()])
+            position = match.end()
+            if match.group() == "$$":
+                literal.append("$")
+                continue
+            slot, kind = match.group(1), match.group(2)
+            if slot is None:
+                raise TemplateError(f"{name}: a lone '$' at offset {match.start()} (write '$$').")
+            if kind not in KINDS:
+                raise TemplateError(f"{name}: slot '{slot}' has unknown kind '{kind}' (choose from {', '.join(KINDS)}).")
+            if kinds.setdefault(slot, kind) != kind:
+                raise TemplateError(f"{name}: slot '{slot}' is both {kinds[slot]} and {kind}.")
+            self.segments.append("".join(literal))
+            self.segments.append((slot, kind))
+            literal = []
+        literal.append(text[position:])
+        self.segments.append("".join(literal))
+
+        self.names: Tuple[str, ...] = tuple(kinds)
+        self.kinds = kinds
+        self._conversions = tuple((slot, KINDS[kind]) for slot, kind in kinds.items())
+        # The segments compiled into one str.format pattern ('{0}' is the first name's value).
+        self._pattern = "".join(segment.replace("{", "{{").replace("}", "}}") if isinstance(segment, str)
+                                else f"{{{self.names.index(segment[0])}}}" for segment in self.segments)
+        self._render = functools.lru_cache(maxsize=cache_size)(self._join)
+
+    def values(self, params: Dict[str, Any]) -> Tuple[Any, ...]:
+        """The parameters converted for their slots, in slot order: the cache key."""
+        missing = [name for name in self.names if name not in params]
+        if missing:
+            raise TemplateError(f"{self.name}: missing {', '.join(missing)}.")
+        unknown = [name for name in params if name not in self.names]
+        if unknown:
+            raise TemplateError(f"{self.name}: has no slot {', '.join(unknown)}.")
+        try:
+            return tuple(convert(params[slot]) for slot, convert in self._conversions)
+        except (TypeError, ValueError) as e:
+            raise TemplateError(f"{self.name}: {e}")
+
+    def render(self, **params: Any) -> str:
+        return self._render(self.values(params))
+
+    def _join(self, values: Tuple[Any, ...]) -> str:
+        return self._pattern.format(*values)
+
+    def cache_info(self):
+        return self._render.cache_info()
+
+_templates: Dict[str, Template] = {}
+
+def template(name: str) -> Template:
+    """The template src/templates/<name>.pine, parsed the first time it is asked for."""
+    found = _templates.get(name)
+    if found is None:
+        path = os.path.join(TEMPLATE_DIR, f"{name}.pine")
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                found = _templates[name] = Template(file.read(), name)
+        except OSError:
+            raise TemplateError(f"No Pine template named '{name}' in {TEMPLATE_DIR}.")
+    return found
+
+def render(name: str, **params: Any) -> str:
+    return template(name).render(**params)
+
+def emit(name: str, output: Union[str, IO[str]], **params: Any) -> str:
+    """
+    Renders a template into `output`: a path (the file is replaced) or an
+    open text stream. Returns the script.
+    """
+    script = render(name, **params)
+    if isinstance(output, str):
+        with open(output, "w", encoding="utf-8") as file:
+            file.write(script)
+    else:
+        output.write(script)
+    return script
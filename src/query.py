@@ -0,0 +1,116 @@
+"""
+src/query.py
+====================================
+The Attribute Index (The Catalogue).
+Answers questions about the ontology as a whole ("every Fire King, by the
+legions they command") without scanning the grimoires for each one.
+
+Each indexed attribute keeps a secondary index (value -> the entities that
+have it; a 'King/Earl' is found as a King and as an Earl too) and its sort
+order, both built once, the first time a Resolver is queried:
+
+    resolver.query(element="Fire", rank="King", order_by="en_count", descending=True)
+
+Rituals ask the same question through a pact, which binds the names of the
+entities that answered:
+
+    pact kings with "element=Fire rank=King order=-en_count limit=3"
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# The attributes with a secondary index ('kind' is MAGUS or DAEMON).
+INDEXED_FIELDS = ("kind", "rank", "planet", "metal", "element", "direction", "en_count")
+
+class QueryError(Exception):
+    """Raised for a question the catalogue cannot answer."""
+    pass
+
+def normalize(value: Any) -> Any:
+    """Compares attribute values without regard to case, and "66" as 66."""
+    if isinstance(value, str):
+        value = value.strip().lower()
+        try: return int(value)
+        except ValueError: return value
+    return value
+
+class AttributeIndex:
+    """Secondary indexes over the records of an ontology, in their original order."""
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self.records: List[Dict[str, Any]] = list(records)
+        self.values: Dict[str, Dict[Any, List[int]]] = {name: {} for name in INDEXED_FIELDS}
+        self.ranks: Dict[str, Dict[int, int]] = {}  # field -> position -> place in the field's order
+        for name in INDEXED_FIELDS:
+            ordered = []
+            for position, record in enumerate(self.records):
+                value = self._value(record, name)
+                if value is None: continue
+                ordered.append((value, position))
+                keys = {value}
+                if isinstance(value, str) and "/" in value:
+                    keys.update(normalize(part) for part in value.split("/"))
+                for key in keys:
+                    self.values[name].setdefault(key, []).append(position)
+            ordered.sort(key=lambda pair: (isinstance(pair[0], str), pair[0], pair[1]))
+            self.ranks[name] = {position: place for place, (_, position) in enumerate(ordered)}
+
+    @staticmethod
+    def _value(record: Dict[str, Any], name: str) -> Any:
+        value = record.get("_type" if name == "kind" else name)
+        return None if value is None else normalize(value)
+
+    def query(self, order_by: Optional[str] = None, descending: bool = False, limit: Optional[int] = None,
+              **filters: Any) -> List[Dict[str, Any]]:
+        """
+        The records matching every filter (an attribute's value, or a list of
+        values any of which may match), ordered by an attribute if asked.
+        """
+        for name in list(filters) + ([order_by] if order_by else []):
+            if name not in self.values:
+                raise QueryError(f"'{name}' is not indexed (choose from {', '.join(INDEXED_FIELDS)}).")
+
+        candidates: Optional[set] = None
+        # The most selective filter first: every later one only narrows it.
+        for name, wanted in sorted(filters.items(), key=lambda item: self._count(*item)):
+            matching = set()
+            for value in (wanted if isinstance(wanted, (list, tuple, set)) else [wanted]):
+                matching.update(self.values[name].get(normalize(value), ()))
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates: return []
+
+        positions = range(len(self.records)) if candidates is None else sorted(candidates)
+        if order_by:
+            ranks = self.ranks[order_by]
+            present = [p for p in positions if p in ranks]
+            present.sort(key=ranks.__getitem__, reverse=descending)
+            positions = present + [p for p in positions if p not in ranks]  # Those without it come last
+        return [self.records[p] for p in list(positions)[:limit]]
+
+    def _count(self, name: str, wanted: Any) -> int:
+        values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+        return sum(len(self.values[name].get(normalize(value), ())) for value in values)
+
+def parse_request(request: str) -> Tuple[Dict[str, Any], Optional[str], bool, Optional[int]]:
+    """
+    Reads the request of a pact: space-separated 'attribute=value' terms,
+    plus 'order=attribute' ('order=-attribute' for descending) and 'limit=N'.
+    Returns (filters, order_by, descending, limit).
+    """
+    filters: Dict[str, Any] = {}
+    order_by, descending, limit = None, False, None
+    for term in str(request).split():
+        name, separator, value = term.partition("=")
+        if not separator or not value:
+            raise QueryError(f"Malformed term '{term}' (expected attribute=value).")
+        name = name.lower()
+        if name == "order":
+            descending = value.startswith("-")
+            order_by = value.lstrip("-").lower()
+        elif name == "limit":
+            if not value.isdigit():
+                raise QueryError(f"The limit must be a number, not '{value}'.")
+            limit = int(value)
+        else:
+            filters[name] = value
+    return filters, order_by, descending, limit
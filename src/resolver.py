@@ -3,74 +3,398 @@ src/resolver.py
 ====================================
 The Ontology Resolver (The Librarian).
 Responsible for loading both the 'Magi Master List' and 'Solomonic Key'.
+
+The JSON grimoires are never parsed as a whole. Each has an index file
+beside it (data/MAGI_225.idx, ...) mapping every name, slug and id to the
+byte range of its record:
+
+    MPLIDX1<TAB><sha256 of the grimoire>
+    <key><TAB><offset><TAB><length>
+    ...
+
+The grimoire itself is memory-mapped, and a record is only decoded (once)
+when a ritual invokes it. Even the index is only searched as text until
+something needs all of it. An index whose checksum no longer matches its
+grimoire is rebuilt (and rewritten, where the realm allows it).
+
+Faster still, 'mpl grimoire build' binds the grimoires (and the Abramelin
+database) into one binary codex, data/ontology.mplc (src/codex.py), which
+opens with no parsing at all. It is preferred for every grimoire whose
+checksum it still matches; a stale one is read from its JSON instead.
+
+Resolver.search() finds entities by prefix or misspelling (src/search.py);
+Resolver.query() by their attributes (src/query.py).
+
+Interpreters share one Resolver per set of grimoires (shared_resolver()),
+so a process running many rituals opens them once. It is re-opened when
+a grimoire file changes, or on invalidate_resolvers().
 """
 
+import hashlib
 import json
+import mmap
 import os
 import re
-from typing import Dict, Any, Optional
+import threading
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+from .search import SearchIndex, SearchHit
+from .query import AttributeIndex
+from .codex import Codex, CodexError, CodexTable, Folio, bind as bind_folios, write_codex
+
+INDEX_MAGIC = "MPLIDX1"
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+MAGI_PATH = os.path.join(DATA_DIR, "MAGI_225.json")
+SOLOMON_PATH = os.path.join(DATA_DIR, "72_solomon_sigil_shapes.json")
+ABRAMELIN_PATH = os.path.join(DATA_DIR, "abramelin_db.json")
+CODEX_PATH = os.path.join(DATA_DIR, "ontology.mplc")
 
 class OntologyError(Exception):
     """Raised when knowledge cannot be found."""
     pass
 
+def _magus_keys(magus: Dict[str, Any]) -> List[str]:
+    # ID Generation: "Hermes Trismegistus" -> "hermes", "hermes_trismegistus"
+    full_name = magus.get("name", "")
+    if not full_name: return []
+    return [full_name.split(' ')[0].lower(), re.sub(r'[^a-zA-Z0-9]', '_', full_name.lower())]
+
+def _daemon_keys(entity: Dict[str, Any]) -> List[str]:
+    # ID Generation: "Bael" -> "bael" (numbering like '001_' removed), plus its id
+    name = entity.get("name", "").lower()
+    clean_name = name.split('_')[-1] if '_' in name else name
+    return [key for key in (clean_name, entity.get("id")) if key]
+
+def _square_keys(square: Dict[str, Any]) -> List[str]:
+    # "MILON" -> "milon", and the office it serves: "future_vision"
+    return [key for key in (square.get("name", "").lower(), square.get("office")) if key]
+
+def _office_keys(office: Dict[str, Any]) -> List[str]:
+    return [office["office"]]
+
+# Where each grimoire keeps its records (the key of the array holding them),
+# the kind it gives them and how they are named.
+MAGI = ("magi", "MAGUS", _magus_keys)
+GOETIA = ("entities", "DAEMON", _daemon_keys)
+
+# The Abramelin database keeps its squares and offices by name instead; they
+# are bound into the codex as records (see abramelin_records()).
+SQUARES = ("magic_squares", "SQUARE", _square_keys)
+OFFICES = ("primary_hierarchy", "OFFICE", _office_keys)
+
+# Strings (so braces inside them are skipped) and the brackets of a JSON text.
+_JSON_STRUCTURE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+
+def record_spans(data: bytes, array_key: str) -> Iterator[Tuple[int, int]]:
+    """The (offset, length) of every object held by an array under `array_key`."""
+    stack: List[Tuple[bytes, Optional[bytes], int]] = []  # (bracket, key of an array, offset)
+    last_string: Optional[bytes] = None
+    wanted = json.dumps(array_key).encode("utf-8")
+    for match in _JSON_STRUCTURE.finditer(data):
+        token = match.group()
+        if token[:1] == b'"':
+            last_string = token
+        elif token == b"[":
+            # The string right before an array that is a member's value is its key.
+            stack.append((token, last_string, match.start()))
+        elif token == b"{":
+            stack.append((token, None, match.start()))
+        else:
+            bracket, _, start = stack.pop()
+            if bracket == b"{" and stack and stack[-1][0] == b"[" and stack[-1][1] == wanted:
+                yield start, match.end() - start
+
+def array_records(document: Any, array_key: str) -> Iterator[Dict[str, Any]]:
+    """Every object held by an array under `array_key`, in the order record_spans() finds them."""
+    if isinstance(document, dict):
+        for key, value in document.items():
+            for item in (value if key == array_key and isinstance(value, list) else ()):
+                if isinstance(item, dict):
+                    yield from array_records(item, array_key)
+                    yield item
+            if key != array_key or not isinstance(value, list):
+                yield from array_records(value, array_key)
+    elif isinstance(document, list):
+        for item in document:
+            yield from array_records(item, array_key)
+
+def abramelin_records(document: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """The squares (each with the office it serves) and the spirit offices, as records."""
+    squares = [dict(square, office=office) for office, square in document.get("magic_squares", {}).items()]
+    hierarchy = document.get("spirits", {}).get("primary_hierarchy", {})
+    offices = [{"office": office, "spirit": spirit} for office, spirit in hierarchy.items()]
+    return {SQUARES[0]: squares, OFFICES[0]: offices}
+
+def folio(path: str, layout, records: List[Dict[str, Any]], checksum: bytes) -> Folio:
+    """A grimoire's records and keys, ready to bind (a later record wins a key, as in an index)."""
+    keys = {}
+    for row, record in enumerate(records):
+        for key in layout[2](record):
+            keys[key] = row
+    return Folio(path, layout[0], layout[1], records, keys, checksum)
+
+def read_folios(path: str, layouts: List[Tuple]) -> List[Folio]:
+    """Reads a JSON grimoire into one folio per layout."""
+    with open(path, "rb") as file:
+        data = file.read()
+    document, checksum = json.loads(data), hashlib.sha256(data).digest()
+    named = abramelin_records(document) if SQUARES in layouts else {}
+    return [folio(path, layout, named[layout[0]] if layout[0] in named else list(array_records(document, layout[0])),
+                  checksum) for layout in layouts]
+
+def build_codex(codex_path: str = CODEX_PATH, magi_path: str = MAGI_PATH, solomon_path: str = SOLOMON_PATH,
+                abramelin_path: str = ABRAMELIN_PATH) -> List[Folio]:
+    """Compiles the grimoires that exist into a codex ('mpl grimoire build'). Returns what was bound."""
+    folios = []
+    for path, layouts in ((magi_path, [MAGI]), (solomon_path, [GOETIA]), (abramelin_path, [SQUARES, OFFICES])):
+        if os.path.exists(path):
+            folios.extend(read_folios(path, layouts))
+    write_codex(codex_path, folios)
+    return folios
+
+class Grimoire:
+    """
+    One JSON grimoire, memory-mapped and read through its index.
+
+    Attributes:
+        index: Every key (lowercase) -> (offset, length) of its record,
+            read from the index text the first time it is needed.
+    """
+
+    def __init__(self, path: str, layout: Tuple[str, str, Callable[[Dict[str, Any]], List[str]]]):
+        self.path = path
+        self.array_key, self.kind, self.keys_of = layout
+        self.records: Dict[int, Dict[str, Any]] = {}  # Decoded records, by offset
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else b""
+        self.checksum = hashlib.sha256(self.data).hexdigest()
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+        self._index_text = self._read_index()
+        if self._index_text is None:
+            self._index = self.build_index()
+            self._index_text = self._index_as_text(self._index)
+            self._write_index()
+
+    @property
+    def index_path(self) -> str:
+        return os.path.splitext(self.path)[0] + ".idx"
+
+    @property
+    def index(self) -> Dict[str, Tuple[int, int]]:
+        if self._index is None:
+            index = {}
+            for line in self._index_text.split("\n")[1:]:
+                if line:
+                    key, offset, length = line.rsplit("\t", 2)
+                    index[key] = (int(offset), int(length))
+            self._index = index
+        return self._index
+
+    def span(self, key: str) -> Optional[Tuple[int, int]]:
+        """Where the record of a key lies, found without reading the whole index."""
+        if self._index is not None:
+            return self._index.get(key)
+        text = self._index_text
+        start = text.find(f"\n{key}\t")
+        if start < 0 or "\n" in key:
+            return None
+        end = text.find("\n", start + 1)
+        found, offset, length = text[start + 1:end if end >= 0 else len(text)].rsplit("\t", 2)
+        return (int(offset), int(length)) if found == key else self.index.get(key)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        span = self.span(key)
+        return self._record(*span) if span else None
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Every record, in the grimoire's order (each decoded once)."""
+        for offset, length in sorted(set(self.index.values())):
+            yield self._record(offset, length)
+
+    def _record(self, offset: int, length: int) -> Dict[str, Any]:
+        record = self.records.get(offset)
+        if record is None:
+            record = json.loads(self.data[offset:offset + length])
+            record["_type"] = self.kind
+            self.records[offset] = record
+        return record
+
+    def build_index(self) -> Dict[str, Tuple[int, int]]:
+        """Finds every record in the grimoire (a later record wins a key, as it always has)."""
+        index = {}
+        for offset, length in record_spans(self.data, self.array_key):
+            for key in self.keys_of(json.loads(self.data[offset:offset + length])):
+                index[key] = (offset, length)
+        return index
+
+    def _read_index(self) -> Optional[str]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                text = file.read()
+        except OSError:
+            return None
+        if not text.startswith(f"{INDEX_MAGIC}\t{self.checksum}\n"):
+            return None  # Built for another edition of the grimoire
+        return text
+
+    def _index_as_text(self, index: Dict[str, Tuple[int, int]]) -> str:
+        lines = [f"{INDEX_MAGIC}\t{self.checksum}"]
+        lines.extend(f"{key}\t{offset}\t{length}" for key, (offset, length) in sorted(index.items()))
+        return "\n".join(lines) + "\n"
+
+    def _write_index(self):
+        temporary = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.write(self._index_text)
+            os.replace(temporary, self.index_path)
+        except OSError:
+            pass  # A read-only realm keeps its index in memory only.
+
 class Resolver:
-    def __init__(self, magi_path: str = "data/MAGI_225.json", solomon_path: str = "data/72_solomon_sigil_shapes.json"):
-        self.knowledge_base: Dict[str, Any] = {}
-        
+    def __init__(self, magi_path: str = MAGI_PATH, solomon_path: str = SOLOMON_PATH,
+                 codex_path: str = CODEX_PATH, abramelin_path: str = ABRAMELIN_PATH):
+        self.grimoires: List[Any] = []  # Grimoires, or the CodexTables bound from them
+        self.codex = self._open_codex(codex_path)
+        self.abramelin_path = abramelin_path
+
         # Load the Historical Magi (Human Spirits)
-        self._load_magi(magi_path)
-        
+        self._open(magi_path, MAGI, "Magi file", "📚 Magi Loaded.", "Magi Error")
+
         # Load the Goetia (Daemons)
-        self._load_solomon(solomon_path)
+        self._open(solomon_path, GOETIA, "Solomon file", "👹 Goetia Loaded.", "Goetia Error")
 
-    def _load_magi(self, path):
-        if not os.path.exists(path):
-            print(f"⚠️ Warning: Magi file '{path}' not found.")
-            return
+        # Consulted latest first: a daemon's name outranks a magus's.
+        self.grimoires.reverse()
+        self._search_index: Optional[SearchIndex] = None
+        self._attribute_index: Optional[AttributeIndex] = None
+        self._abramelin: Optional[List[CodexTable]] = None
 
+    @staticmethod
+    def _open_codex(path: str) -> Optional[Codex]:
+        if not os.path.exists(path):
+            return None
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if "categories" in data:
-                    for category in data["categories"]:
-                        for magus in category.get("magi", []):
-                            full_name = magus.get("name", "")
-                            if not full_name: continue
-
-                            # ID Generation: "Hermes Trismegistus" -> "hermes"
-                            first_word = full_name.split(' ')[0].lower()
-                            full_slug = re.sub(r'[^a-zA-Z0-9]', '_', full_name.lower())
-                            
-                            magus["_type"] = "MAGUS"
-                            self.knowledge_base[first_word] = magus
-                            self.knowledge_base[full_slug] = magus
-            print(f"📚 Magi Loaded.")
-        except Exception as e:
-            print(f"⚠️ Magi Error: {e}")
+            return Codex.open(path)
+        except (CodexError, OSError) as e:
+            print(f"⚠️ Codex Error: {e} Reading the JSON grimoires (run 'mpl grimoire build').")
+            return None
 
-    def _load_solomon(self, path):
+    def _open(self, path: str, layout, missing: str, loaded: str, failed: str):
         if not os.path.exists(path):
-            print(f"⚠️ Warning: Solomon file '{path}' not found.")
+            print(f"⚠️ Warning: {missing} '{path}' not found.")
             return
-
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if "entities" in data:
-                    for entity in data["entities"]:
-                        # ID Generation: "Bael" -> "bael"
-                        name = entity.get("name", "").lower()
-                        # Clean up name (remove numbering like '001_')
-                        clean_name = name.split('_')[-1] if '_' in name else name
-                        
-                        entity["_type"] = "DAEMON"
-                        self.knowledge_base[clean_name] = entity
-                        self.knowledge_base[entity.get("id")] = entity
-            print(f"👹 Goetia Loaded.")
+            table = self.codex.grimoire(path, layout) if self.codex else None
+            if table is None and self.codex and os.path.basename(path) in self.codex.stale:
+                print(f"⚠️ The codex is stale for '{os.path.basename(path)}' (run 'mpl grimoire build').")
+            self.grimoires.append(table if table is not None else Grimoire(path, layout))
+            print(loaded)
         except Exception as e:
-            print(f"⚠️ Goetia Error: {e}")
+            print(f"⚠️ {failed}: {e}")
+
+    @property
+    def knowledge_base(self) -> Dict[str, Any]:
+        """Every key and its record, fully decoded (slow: prefer resolve())."""
+        knowledge = {}
+        for grimoire in reversed(self.grimoires):
+            for key in grimoire.index:
+                knowledge[key] = grimoire.get(key)
+        return knowledge
 
     def resolve(self, entity_id: str) -> Optional[Dict[str, Any]]:
         if not entity_id: return None
-        return self.knowledge_base.get(entity_id.lower())
+        key = entity_id.lower()
+        for grimoire in self.grimoires:
+            record = grimoire.get(key)
+            if record is not None:
+                return record
+        return None
+
+    def invocable(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Every entity a ritual can reach, with the first of its keys that resolves to it."""
+        for grimoire in self.grimoires:
+            for record in grimoire.entries():
+                key = next((k for k in grimoire.keys_of(record) if self.resolve(k) is record), None)
+                if key is not None:
+                    yield key, record
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Built on the first search (it decodes every record)."""
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.invocable())
+        return self._search_index
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Entities whose key, name, role, planet or element starts with (or resembles) `query`."""
+        return self.search_index.search(query, limit)
+
+    @property
+    def attribute_index(self) -> AttributeIndex:
+        """Built on the first query (it decodes every record)."""
+        if self._attribute_index is None:
+            self._attribute_index = AttributeIndex(record for _, record in self.invocable())
+        return self._attribute_index
+
+    def query(self, order_by: Optional[str] = None, descending: bool = False, limit: Optional[int] = None,
+              **filters: Any) -> List[Dict[str, Any]]:
+        """
+        The entities whose attributes match every filter, e.g. every Fire King
+        by legions: query(element="Fire", rank="King", order_by="en_count").
+        """
+        return self.attribute_index.query(order_by, descending, limit, **filters)
+
+    def abramelin(self, key: str) -> Optional[Dict[str, Any]]:
+        """A magic square ('milon', 'future_vision') or spirit office ('truth_seeker') of Abramelin."""
+        if self._abramelin is None:
+            self._abramelin = self._open_abramelin()
+        key = key.lower()
+        for table in self._abramelin:
+            record = table.get(key)
+            if record is not None:
+                return record
+        return None
+
+    def _open_abramelin(self) -> List[CodexTable]:
+        path = self.abramelin_path
+        if not os.path.exists(path):
+            return []
+        tables = [self.codex.grimoire(path, layout) for layout in (SQUARES, OFFICES)] if self.codex else []
+        if tables and None not in tables:
+            return tables
+        # Not bound (or stale): bind it in memory, it is small.
+        folios = read_folios(path, [SQUARES, OFFICES])
+        codex = Codex(bind_folios(folios))
+        return [codex.grimoire(path, layout, folios[0].checksum) for layout in (SQUARES, OFFICES)]
+
+    def suggest(self, entity_id: str, limit: int = 3) -> List[str]:
+        """The keys of the entities a misspelt name most likely meant ("did you mean")."""
+        hits = self.search_index.fuzzy(entity_id, limit, fields={"key", "name"})
+        return [hit.key for hit in hits]
+
+# (magi path, solomon path) -> (the files' (mtime, size) when opened, with the codex's and abramelin's; Resolver)
+_shared: Dict[Tuple[str, str], Tuple[Any, Resolver]] = {}
+_shared_lock = threading.Lock()
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        status = os.stat(path)
+        return status.st_mtime_ns, status.st_size
+    except OSError:
+        return None
+
+def shared_resolver(magi_path: str = MAGI_PATH, solomon_path: str = SOLOMON_PATH) -> Resolver:
+    """The process-wide Resolver of these grimoires, re-opened when either file (the codex, or abramelin) has changed."""
+    key = (os.path.abspath(magi_path), os.path.abspath(solomon_path))
+    stamp = (_stamp(key[0]), _stamp(key[1]), _stamp(CODEX_PATH), _stamp(ABRAMELIN_PATH))
+    with _shared_lock:
+        cached = _shared.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = _shared[key] = (stamp, Resolver(*key))
+        return cached[1]
+
+def invalidate_resolvers():
+    """Forgets every shared Resolver: the next interpreter opens the grimoires again."""
+    with _shared_lock:
+        _shared.clear()
@@ -0,0 +1,112 @@
+"""
+src/scope_resolver.py
+====================================
+The Scope Resolver (The Cartographer of Circles).
+A static pass, run between parsing and execution, that works out where
+every variable lives. Each Variable, Bind and Hex is annotated with an
+Address (scopes to walk outwards, slot index), and each Block with the
+Layout of the scope it opens, so the compiled engines read and write
+bindings by index instead of searching the scope chain by name.
+
+Not to be confused with src/resolver.py, which resolves *entities*
+from the ontology.
+
+MPL binds dynamically ("bind" updates the nearest existing binding, else
+defines one here), so an Address is a promise about *where* a name lives,
+not *that* it is bound: engines fall back to the name-based Environment
+API whenever the addressed slot turns out to be UNBOUND at runtime.
+A 'bind' of an enclosing scope's name also reserves a slot for it in its
+own scope, where it lands if the enclosing binding is sealed.
+"""
+
+from typing import List, Optional, Tuple
+from .parser import (
+    Stmt, Expr, Block, Cycle, Conditional, Circle, Invoke, Bind, Omen, Hex,
+    Pact, Abyss, Echo, Variable, Binary
+)
+from .environment import Layout
+
+class ScopeResolver:
+    """
+    Annotates an AST with slot addresses.
+
+    Args:
+        *layouts: The Layouts of the scope chain the ritual will be performed
+            in, outermost first. Global declarations are added to the last
+            one, so names bound by earlier rituals (e.g. previous REPL lines)
+            keep their slots; enclosing ones (e.g. a frozen parameter
+            snapshot) are only read.
+    """
+
+    def __init__(self, *layouts: Layout):
+        self.scopes: List[Layout] = list(layouts)
+
+    def resolve(self, statements: List[Stmt]):
+        for stmt in statements:
+            self.statement(stmt)
+
+    def _lookup(self, name: str) -> Optional[Tuple[int, int]]:
+        """Finds the innermost scope that has declared the name."""
+        for depth, layout in enumerate(reversed(self.scopes)):
+            slot = layout.index.get(name)
+            if slot is not None:
+                return depth, slot
+        return None
+
+    def statement(self, stmt: Stmt):
+        if stmt is None:
+            return  # Lost to a syntax error.
+
+        if isinstance(stmt, Bind):
+            self.expression(stmt.value)
+            address = self._lookup(stmt.name)
+            stmt.address = address if address else (0, self.scopes[-1].declare(stmt.name))
+            if address and address[0] > 0:
+                # Sealed out there, the name is shadowed here: later reads must look here first.
+                self.scopes[-1].declare(stmt.name)
+
+        elif isinstance(stmt, Block):
+            stmt.layout = Layout()
+            self.scopes.append(stmt.layout)
+            try:
+                self.resolve(stmt.statements)
+            finally:
+                self.scopes.pop()
+
+        elif isinstance(stmt, Cycle):
+            self.expression(stmt.frequency)
+            self.statement(stmt.body)
+
+        elif isinstance(stmt, Conditional):
+            self.expression(stmt.condition)
+            self.statement(stmt.then_branch)
+            self.statement(stmt.else_branch)
+
+        elif isinstance(stmt, Circle):
+            self.statement(stmt.body)
+
+        elif isinstance(stmt, Hex):
+            for p in stmt.params:
+                self.expression(p.value)
+            stmt.address = self._lookup(stmt.target)
+
+        elif isinstance(stmt, Invoke):
+            for p in stmt.params or []:
+                self.expression(p.value)
+
+        elif isinstance(stmt, Omen):
+            self.scopes[-1].declare(stmt.target)
+
+        elif isinstance(stmt, (Echo, Abyss)):
+            self.expression(stmt.message)
+
+        elif isinstance(stmt, Pact):
+            self.expression(stmt.request)
+            self.scopes[-1].declare(stmt.target)
+
+    def expression(self, expr: Expr):
+        if isinstance(expr, Variable):
+            expr.address = self._lookup(expr.name.lexeme)
+        elif isinstance(expr, Binary):
+            self.expression(expr.left)
+            self.expression(expr.right)
@@ -0,0 +1,162 @@
+"""
+src/search.py
+====================================
+The Search Index (The Concordance).
+Finds entities of the ontology by what a Mage half-remembers of them: a
+prefix for autocompletion ("herm" -> Hermes Trismegistus) or a misspelling
+for "did you mean" ("vasago" -> Vassago).
+
+Every record is indexed under its keys (the slugs and ids resolve()
+accepts), the words of its name, its role, planet and element:
+
+* a trie answers prefixes, each node holding its hits already ranked;
+* a trigram index answers misspellings, scored by Dice similarity.
+
+Both are built once, the first time a Resolver is searched.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Lower ranks first: a match on a name beats one on a planet.
+FIELD_RANKS = {"key": 0, "name": 1, "role": 2, "planet": 3, "element": 3}
+
+# The least similarity a misspelling may have to be suggested.
+FUZZY_THRESHOLD = 0.4
+
+@dataclass
+class SearchHit:
+    """One entity found by a search."""
+    key: str                   # What to write after 'invoke.' (resolve() accepts it)
+    name: str
+    kind: str                  # "MAGUS" or "DAEMON"
+    field: str                 # What matched: "key", "name", "role", "planet" or "element"
+    term: str                  # The indexed text that matched
+    score: float               # 1.0 for a prefix; the similarity of a fuzzy match
+    record: Dict[str, Any] = field(repr=False, compare=False)
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def similarity(a: str, b: str) -> float:
+    """Dice coefficient of the trigrams of two texts (1.0 when identical)."""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+class _TrieNode:
+    __slots__ = ("children", "hits")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.hits: List[int] = []  # Entries whose term passes through this node, best first
+
+class SearchIndex:
+    """
+    Built from (key, record) pairs: `key` is the record's invocable key.
+    """
+
+    def __init__(self, records: Iterable[Tuple[str, Dict[str, Any]]]):
+        self.entries: List[Tuple[str, str, Dict[str, Any], str]] = []  # (term, field, record, key)
+        self.root = _TrieNode()
+        self.terms: Dict[str, List[int]] = {}   # term -> its entries
+        self.grams: Dict[str, List[str]] = {}   # trigram -> the terms holding it
+        self.gram_counts: Dict[str, int] = {}   # term -> how many trigrams it has
+
+        for key, record in records:
+            for term, field_name in self._terms(key, record):
+                self._add(term, field_name, record, key)
+
+        rank = lambda entry: (FIELD_RANKS[self.entries[entry][1]], len(self.entries[entry][0]), entry)
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            node.hits.sort(key=rank)
+            stack.extend(node.children.values())
+        for term in self.terms:
+            grams = trigrams(term)
+            self.gram_counts[term] = len(grams)
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(term)
+
+    @staticmethod
+    def _terms(key: str, record: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+        name = str(record.get("name", "")).lower()
+        yield key, "key"
+        yield name, "name"
+        for word in re.split(r"[^\w]+", name):
+            yield word, "name"
+        for field_name in ("role", "planet", "element"):
+            value = str(record.get(field_name) or "").lower()
+            yield value, field_name
+            for word in value.split():
+                yield word, field_name
+
+    def _add(self, term: str, field_name: str, record: Dict[str, Any], key: str):
+        if not term: return
+        entry = len(self.entries)
+        self.entries.append((term, field_name, record, key))
+        self.terms.setdefault(term, []).append(entry)
+        node = self.root
+        for char in term:
+            node = node.children.setdefault(char, _TrieNode())
+            node.hits.append(entry)
+
+    def _hit(self, entry: int, score: float) -> SearchHit:
+        term, field_name, record, key = self.entries[entry]
+        return SearchHit(key, record.get("name", key), record.get("_type", ""), field_name, term, score, record)
+
+    def prefix(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Entities with an indexed term starting with `query`, best first."""
+        node: Optional[_TrieNode] = self.root
+        for char in query.lower():
+            node = node.children.get(char)
+            if node is None: return []
+        hits, seen = [], set()
+        for entry in node.hits:
+            record_id = id(self.entries[entry][2])
+            if record_id in seen: continue
+            seen.add(record_id)
+            hits.append(self._hit(entry, 1.0))
+            if len(hits) == limit: break
+        return hits
+
+    def fuzzy(self, query: str, limit: int = 10, threshold: float = FUZZY_THRESHOLD,
+              fields: Optional[Set[str]] = None) -> List[SearchHit]:
+        """
+        Entities with an indexed term similar to `query` (a misspelling), most
+        similar first; only terms of the given fields, if any are given.
+        """
+        query = query.lower()
+        grams = trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.grams.get(gram, ()))
+        scored, size, counts = [], len(grams), self.gram_counts
+        for term, common in shared.items():
+            score = 2 * common / (size + counts[term])
+            if score >= threshold:
+                for entry in self.terms[term]:
+                    if fields is not None and self.entries[entry][1] not in fields: continue
+                    scored.append((-score, FIELD_RANKS[self.entries[entry][1]], entry))
+        scored.sort()
+        hits, seen = [], set()
+        for negative_score, _, entry in scored:
+            record_id = id(self.entries[entry][2])
+            if record_id in seen: continue
+            seen.add(record_id)
+            hits.append(self._hit(entry, -negative_score))
+            if len(hits) == limit: break
+        return hits
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Prefix matches first, then misspellings, without repeating an entity."""
+        query = query.strip().lower()
+        if not query or limit <= 0: return []
+        hits = self.prefix(query, limit)
+        if len(hits) < limit:
+            found = {id(hit.record) for hit in hits}
+            hits.extend(hit for hit in self.fuzzy(query, limit) if id(hit.record) not in found)
+        return hits[:limit]
@@ -3,76 +3,62 @@ src/stdlib.py
 ====================================
 The Standard Library (The Grimoire).
 Patched v0.9.6 - The Robust Oracle
+
+Modules beyond these are plugins, imported on their first invocation (or
+'summon'): the bundled ones in src/modules/, and any package declaring an
+entry point in the "mpl.modules" group, e.g. in its setup.py:
+
+    entry_points={"mpl.modules": ["alchemy = my_grimoire.alchemy:Alchemy"]}
+
+after which 'invoke.alchemy(...)' (or any daemon whose mpl_function is
+'alchemy.<spell>()') reaches it.
 """
 
+import importlib
+import inspect
 import time
-import sys
-import subprocess
-import shlex
-import urllib.request
-import json
-import random
-import re
-import os
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from .pine import emit, render
 
 # --- 1. MARKET (Financial Technomancy) ---
 class Market:
     """Domain: TradingView & Pine Script Generation."""
+    default_spell = "divine"  # What 'invoke.market(...)' casts
 
     @staticmethod
-    def divine(title="Oracle", fast=50, slow=200, rsi=45, adx=20, offset=21):
+    def divine(title="Oracle", fast=50, slow=200, rsi=45, adx=20, offset=21, output=None):
+        """
+        Writes the Hybrid Strategy (src/templates/hybrid_oracle.pine) into
+        `output`, a path or a text stream; without one, it is shown.
+        """
         print(f"📈 [MARKET] Vassago is forging the Hybrid Strategy: {title}...")
-        
-        script = f"""
-//@version=6
-// Generated by MPL v0.9.5 (Hybrid Edition)
-// Strategy: {title}
-// Ritual: The Vassago Resonance & Tesla Protocol
-// Mode: Hybrid (User Selectable)
-
-indicator("{title} [Hakan Yorganci]", overlay=true)
-
-useAdaptive = input.bool(false, "Activate 'Living Spirit' (Adaptive Mode)?", group="Magick Controls", tooltip="OFF = Sealed Ritual\\nON = Living Spirit")
+        params = dict(title=title, fast=fast, slow=slow, rsi=rsi, adx=adx, offset=offset)
+        if output is not None:
+            emit("hybrid_oracle", output, **params)
+            if isinstance(output, str):
+                print(f"📜 [MARKET] The strategy is inscribed in {output}.")
+            return True
 
-teslaLen = input.int({slow}, "Harmonic Trend Base", group="Magick Settings")
-rsiBase  = input.int({rsi}, "Sniper Entry Base", group="Magick Settings")
-futureOffset = input.int({offset}, "Prophetic Vision (Bars)", group="Magick Settings")
-
-supportLen = input.int({fast}, "Support Line")
-adxThresh  = input.int({adx}, "ADX Threshold")
-
-maSealed = ta.sma(close, teslaLen)
-maLiving = ta.ema(close, teslaLen) 
-finalTrend = useAdaptive ? maLiving : maSealed
-
-volatility = ta.atr(14)
-rsiAdaptive = rsiBase - (volatility * 0.1) 
-finalRsiLvl = useAdaptive ? rsiAdaptive : rsiBase
-
-maFast  = ta.sma(close, supportLen)
-rsiVal  = ta.rsi(close, 14)
-rsiMa   = ta.sma(rsiVal, 9)
-[dp, dm, adxVal] = ta.dmi(14, 14)
-
-trendCond = close > finalTrend
-sniperSig = ta.crossover(rsiMa, finalRsiLvl) 
-strength  = adxVal > adxThresh
-buyCond = trendCond and sniperSig and strength
-
-trendColor = useAdaptive ? color.fuchsia : color.blue
-plot(finalTrend, "Vassago Trend", color=trendColor, linewidth=3)
-plot(maFast, "Support", color=color.orange, linewidth=2)
-plot(finalTrend, "Future Sight", color=color.new(trendColor, 40), linewidth=2, style=plot.style_circles, offset=futureOffset)
-
-plotshape(buyCond, title="Oracle Buy", style=shape.labelup, location=location.belowbar, color=trendColor, text="ORACLE\\nENTRY", textcolor=color.white, size=size.small)
-bgcolor(buyCond ? color.new(trendColor, 90) : na, title="Sniper Aura")
+        # One write: the template ends with its newline.
+        print("\n" + "="*40 + "\n" + render("hybrid_oracle", **params) + "="*40 + "\n")
+        return True
 
-alertcondition(buyCond, title="Hybrid Oracle Trigger", message="Vassago Protocol Triggered on {{ticker}}!")
+    @staticmethod
+    def sweep(output, title="Oracle", fast=50, slow=200, rsi=45, adx=20, offset=21, workers=None):
         """
-        print("\n" + "="*40)
-        print(script.strip())
-        print("="*40 + "\n")
-        return True
+        Writes the Hybrid Strategy for every combination of the given values
+        (each a single value, or a list or range of them) into `output`: a
+        directory, or a .zip archive. A manifest.csv names each script's
+        parameters; the title may name them too: "Oracle {fast}/{slow}".
+        Returns the number of scripts.
+        """
+        from .sweep import sweep  # Pulls in multiprocessing and zipfile, only when sweeping
+        axes = dict(title=title, fast=fast, slow=slow, rsi=rsi, adx=adx, offset=offset)
+        start = time.perf_counter()
+        count = sweep("hybrid_oracle", axes, output, workers=workers)
+        print(f"🧮 [MARKET] Vassago swept {count} Hybrid Strategies into {output} "
+              f"({time.perf_counter() - start:.2f}s).")
+        return count
 
 # --- 2. SOLOMONIC ---
 class Solomonic:
@@ -93,8 +79,143 @@ class Hermetic:
         return int(target) if str(target_type) in ["Mana", "int"] else str(target)
 
 # --- 5. REGISTRY (The Grimoire) ---
+PLUGIN_GROUP = "mpl.modules"
+
+class Plugin:
+    """
+    A module named by reference ('package.module' or 'package.module:Attribute'),
+    imported the first time it is needed. A class is instantiated once, so
+    its methods become spells.
+    """
+    __slots__ = ("reference",)
+
+    def __init__(self, reference: str):
+        self.reference = reference
+
+    def load(self) -> Any:
+        module_path, _, attribute = self.reference.partition(":")
+        target = importlib.import_module(module_path)
+        if attribute:
+            target = getattr(target, attribute)
+        return target() if inspect.isclass(target) else target
+
+    def __repr__(self):
+        return f"Plugin({self.reference!r})"
+
+class Registry(dict):
+    """
+    The modules by name (or the Plugins that will import them). Every change
+    bumps `generation`, which tells call sites their memo is stale.
+    """
+    generation = 0
+
+    def _changed(self):
+        self.generation += 1
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, Plugin):
+            value = value.load()
+            super().__setitem__(key, value)  # Loaded, but still the same module: no new generation
+        return value
+
+    def get(self, key, default=None): return self[key] if key in self else default
+    def __setitem__(self, key, value): super().__setitem__(key, value); self._changed()
+    def __delitem__(self, key): super().__delitem__(key); self._changed()
+    def clear(self): super().clear(); self._changed()
+    def update(self, *args, **kwargs): super().update(*args, **kwargs); self._changed()
+    def setdefault(self, key, default=None): self._changed(); return super().setdefault(key, default)
+    def pop(self, *args): self._changed(); return super().pop(*args)
+    def popitem(self): self._changed(); return super().popitem()
+
+    def loaded(self, key) -> bool:
+        return not isinstance(super().__getitem__(key), Plugin)
+
+def entry_point_plugins(group: str = PLUGIN_GROUP) -> Dict[str, Plugin]:
+    """The plugins installed packages declare as entry points of `group`."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        return {}
+    found = entry_points()
+    found = found.select(group=group) if hasattr(found, "select") else found.get(group, [])
+    return {point.name.lower(): Plugin(point.value) for point in found}
+
+class CallSite:
+    """
+    The memo of one invoke statement: what its entity resolved to (a callable
+    taking the parameters), valid for one resolver and registry generation.
+    """
+    __slots__ = ("perform", "resolver", "generation")
+
+    def __init__(self):
+        self.perform: Optional[Callable[[Dict[Any, Any]], Any]] = None
+        self.resolver: Any = None
+        self.generation = -1
+
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+_NAMED = _POSITIONAL + (inspect.Parameter.KEYWORD_ONLY,)
+# Stands in for builtins whose signature cannot be inspected (e.g. max): values go in order.
+_ANY_POSITIONAL = inspect.Signature([inspect.Parameter("args", inspect.Parameter.VAR_POSITIONAL)])
+_UNFILLED = object()
+
+class Spell:
+    """A function of a module, with its signature inspected once."""
+    __slots__ = ("title", "function", "signature", "names", "positional", "variadic", "keywords")
+
+    def __init__(self, title: str, function: Callable):
+        self.title, self.function = title, function
+        try:
+            self.signature = inspect.signature(function)
+        except (TypeError, ValueError):
+            self.signature = _ANY_POSITIONAL
+        parameters = self.signature.parameters.values()
+        kinds = {p.kind for p in parameters}
+        self.names = frozenset(p.name for p in parameters if p.kind in _NAMED)
+        self.positional = [p.name for p in parameters if p.kind in _POSITIONAL]
+        self.variadic = inspect.Parameter.VAR_POSITIONAL in kinds  # *args takes the leftover values
+        self.keywords = inspect.Parameter.VAR_KEYWORD in kinds  # **kwargs takes the unknown names
+
+    def bind(self, params: Dict[Any, Any]) -> inspect.BoundArguments:
+        """
+        Parameters named like the spell's bind by name; the others (and
+        unnamed ones, keyed by position) fill its free parameters in order,
+        as invocations always have. Values left over go to *args, and
+        unknown names to **kwargs, if the spell has them. Raises TypeError
+        if they do not fit.
+        """
+        named = {name: value for name, value in params.items() if name in self.names}
+        extra = {name: value for name, value in params.items()
+                 if self.keywords and isinstance(name, str) and name not in named}
+        rest = [value for name, value in params.items() if name not in named and name not in extra]
+        free = [name for name in self.positional if name not in named]
+        if len(rest) > len(free) and not self.variadic:
+            raise TypeError(f"takes {len(self.positional)} parameters, {len(params)} were given")
+        # Positional values up to the first free parameter left unfilled; the rest by name.
+        args, values = [], iter(rest)
+        for name in self.positional:
+            value = named.pop(name) if name in named else next(values, _UNFILLED)
+            if value is _UNFILLED:
+                break
+            args.append(value)
+        args.extend(values)
+        named.update(extra)
+        return self.signature.bind(*args, **named)
+
+    def cast(self, params: Dict[Any, Any]) -> Any:
+        try:
+            bound = self.bind(params)
+        except TypeError as e:
+            print(f"💥 [BACKFIRE] The spell '{self.title}' cannot take these parameters: {e}")
+            return None
+        try:
+            return self.function(*bound.args, **bound.kwargs)
+        except Exception as e:
+            print(f"💥 [BACKFIRE] Internal Error: {e}")
+            return None
+
 class StdLib:
-    modules = {
+    modules = Registry({
         "market": Market,
         "oracle": Market,
         "vassago": Market, 
@@ -102,11 +223,71 @@ class StdLib:
         "process": Solomonic,
         "system": Solomonic,
         "tesla": Tesla,
-        "hermetic": Hermetic
-    }
+        "hermetic": Hermetic,
+        # Bundled plugins (src/modules/)
+        "gematria": Plugin("src.modules.gematria_engine"),
+        "occultator": Plugin("src.modules.occultator:Occultator"),
+    })
+
+    # (module, function) -> its Spell, for the registry's generation in _dispatch_generation
+    _dispatch: Dict[Tuple[str, str], Spell] = {}
+    _inspected: Set[str] = set()  # The modules whose spells are in _dispatch
+    _dispatch_generation = -1
+    _discovered = False
+
+    @staticmethod
+    def discover():
+        """Registers the entry point plugins of installed packages (once; it scans their metadata)."""
+        StdLib._discovered = True
+        plugins = {name: plugin for name, plugin in entry_point_plugins().items() if name not in StdLib.modules}
+        if plugins:
+            StdLib.modules.update(plugins)
+
+    @staticmethod
+    def knows(module_name) -> bool:
+        """Whether a module (or an installed plugin) has this name, without importing it."""
+        module_name = str(module_name).lower().strip()
+        if module_name not in StdLib.modules and not StdLib._discovered:
+            StdLib.discover()
+        return module_name in StdLib.modules
+
+    @staticmethod
+    def lookup(module_name) -> Optional[Any]:
+        """The module registered under a name, imported now if it never was (None if unknown)."""
+        module_name = str(module_name).lower().strip()
+        return StdLib.modules[module_name] if StdLib.knows(module_name) else None
+
+    @staticmethod
+    def summon(module_name) -> Any:
+        """Imports a module ahead of its first invocation. Raises ImportError if it cannot be."""
+        module = StdLib.lookup(module_name)
+        if module is None:
+            raise ImportError(f"No module or plugin is named '{module_name}'.")
+        return module
+
+    @staticmethod
+    def dispatch_table() -> Dict[Tuple[str, str], Spell]:
+        """Every public function of every module imported so far, rebuilt when the registry changes."""
+        if StdLib._dispatch_generation != StdLib.modules.generation:
+            StdLib._dispatch, StdLib._inspected = {}, set()
+            StdLib._dispatch_generation = StdLib.modules.generation
+        table, inspected = StdLib._dispatch, StdLib._inspected
+        for module_name in StdLib.modules:
+            if module_name not in inspected and StdLib.modules.loaded(module_name):
+                inspected.add(module_name)
+                for func_name, function in inspect.getmembers(StdLib.modules[module_name], callable):
+                    if not func_name.startswith("_") and not inspect.isclass(function):
+                        table[(module_name, func_name)] = Spell(f"{module_name}.{func_name}", function)
+        return table
 
     @staticmethod
     def call(module_name, func_name, args):
+        """Casts a spell with named parameters (a dict), or with arguments in order (a list)."""
+        return StdLib.bind(module_name, func_name)(args if isinstance(args, dict) else dict(enumerate(args)))
+
+    @staticmethod
+    def bind(module_name, func_name) -> Callable[[Dict[Any, Any]], Any]:
+        """Looks a spell up once; the returned callable casts it with a dict of parameters."""
         # 1. GÜVENLİK: İsimleri küçült (Case-Insensitive)
         module_name = str(module_name).lower().strip()
         
@@ -115,26 +296,25 @@ class StdLib:
             # Fonksiyon adı ne olursa olsun, Vassago her zaman 'divine' (kehanet) yapar.
             func_name = "divine"
 
-        # 3. MODÜL KONTROLÜ
-        if module_name in StdLib.modules:
-            module = StdLib.modules[module_name]
-            
-            # Fonksiyon adı boşsa veya None ise varsayılan davranışı ara
-            if not func_name:
-                # Eğer modül 'Market' ise varsayılan fonksiyon 'divine'dır.
-                if module == Market: func_name = "divine"
-
-            if hasattr(module, func_name):
-                try: 
-                    return getattr(module, func_name)(*args)
-                except Exception as e: 
-                    # Argüman hatası varsa boş dene
-                    try: return getattr(module, func_name)()
-                    except: print(f"💥 [BACKFIRE] Internal Error: {e}")
-            else:
-                print(f"⚠️ [FIZZLE] The module '{module_name}' exists, but does not know spell '{func_name}'.")
-                return None
-        
+        # 3. MODÜL KONTROLÜ (ilk çağrıda içe aktarılır)
+        try:
+            module = StdLib.lookup(module_name)
+        except Exception as e:
+            module, message = None, f"💥 [BACKFIRE] The module '{module_name}' could not be summoned: {e}"
         else:
-            print(f"⚠️ [INVOKE] The spirit '{module_name}' did not answer (Not found in Grimoire).")
+            message = f"⚠️ [INVOKE] The spirit '{module_name}' did not answer (Not found in Grimoire)."
+
+        if module is not None:
+            # Fonksiyon adı boşsa veya None ise modülün varsayılan büyüsünü ara (Market -> 'divine')
+            if not func_name:
+                func_name = getattr(module, "default_spell", None)
+
+            spell = StdLib.dispatch_table().get((module_name, func_name)) if func_name else None
+            if spell is not None:
+                return spell.cast
+            message = f"⚠️ [FIZZLE] The module '{module_name}' exists, but does not know spell '{func_name}'."
+
+        def fizzle(params):
+            print(message)
             return None
+        return fizzle
@@ -0,0 +1,198 @@
+"""
+src/sweep.py
+====================================
+The Sweep (The Loom).
+Renders a Pine template once for every combination of its parameters.
+
+Each parameter is given an axis: one value, or several (a list, a range,
+or a spec such as '10:50:10'). Their Cartesian product is walked lazily,
+in batches that a ProcessPoolExecutor renders side by side, and written
+either into a directory or into a single .zip archive, next to a
+manifest.csv that names the parameters of every script:
+
+    sweep("hybrid_oracle", {"title": "Oracle {fast}/{slow}", "fast": range(10, 60, 10),
+                            "slow": range(100, 350, 50), "rsi": 45, "adx": 20, "offset": 21}, "sweeps/")
+
+A str parameter may name the others, and '{index}', the variant's number.
+"""
+
+import csv
+import functools
+import io
+import itertools
+import os
+import zipfile
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .pine import TemplateError, template
+
+# Variants rendered per task handed to a worker.
+BATCH_SIZE = 1000
+
+MANIFEST = "manifest.csv"
+
+def axis(spec: str) -> Sequence[Any]:
+    """
+    The values named by a command-line spec: 'start:stop:step' (stop
+    included), 'a,b,c', or a single value. Numbers are read as numbers.
+    """
+    if ":" in spec:
+        start, stop, *step = (_number(part) for part in spec.split(":"))
+        step = step[0] if step else 1
+        if not all(isinstance(n, (int, float)) for n in (start, stop, step)) or step <= 0:
+            raise ValueError(f"'{spec}' is not a range (start:stop:step, with a positive step)")
+        if all(isinstance(n, int) for n in (start, stop, step)):
+            return range(start, stop + 1, step)
+        return [start + i * step for i in range(int((stop - start) / step + 1e-9) + 1)]
+    if "," in spec:
+        return [_number(part) for part in spec.split(",")]
+    return (_number(spec),)
+
+def _number(text: str) -> Any:
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+def _values(value: Any) -> Sequence[Any]:
+    """One axis: a str or a scalar is a single value; other iterables are kept (a range stays lazy)."""
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+        return (value,)
+    return value if isinstance(value, (range, list, tuple)) else tuple(value)
+
+class Grid:
+    """The Cartesian product of the parameter axes, never held whole."""
+
+    def __init__(self, axes: Dict[str, Any]):
+        self.names: Tuple[str, ...] = tuple(axes)
+        self.axes: Tuple[Sequence[Any], ...] = tuple(_values(value) for value in axes.values())
+
+    def __len__(self) -> int:
+        count = 1
+        for values in self.axes:
+            count *= len(values)
+        return count
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return itertools.product(*self.axes)
+
+    def batches(self, size: int) -> Iterator[Tuple[int, List[Tuple[Any, ...]]]]:
+        """(index of the first variant, its variants), `size` at a time."""
+        combinations, start = iter(self), 0
+        while True:
+            batch = list(itertools.islice(combinations, size))
+            if not batch:
+                return
+            yield start, batch
+            start += len(batch)
+
+def _variant(name: str, names: Tuple[str, ...], index: int, combination: Tuple[Any, ...]) -> Dict[str, Any]:
+    """A combination as parameters, its str values formatted with the others."""
+    params = dict(zip(names, combination))
+    kinds = template(name).kinds
+    for slot, value in params.items():
+        if kinds[slot] == "str" and "{" in str(value):
+            try:
+                params[slot] = str(value).format(index=index, **params)
+            except (KeyError, IndexError, ValueError) as e:
+                raise TemplateError(f"{name}: '{value}' cannot be filled in: {e!r}")
+    return params
+
+def _render_batch(name: str, names: Tuple[str, ...], directory: Optional[str], width: int,
+                  start: int, batch: List[Tuple[Any, ...]]) -> Tuple[List[List[Any]], List[str]]:
+    """
+    Renders one batch (in a worker). Scripts bound for a directory are
+    written here; for an archive they are sent back. Returns the manifest
+    rows and the scripts not yet written.
+
+    The manifest records numbers as the script has them (a slow of 200.0
+    for an int slot is 200), and str values before they are escaped.
+    """
+    scroll = template(name)
+    rows, scripts = [], []
+    for index, combination in enumerate(batch, start):
+        params = _variant(name, names, index, combination)
+        script = scroll.render(**params)
+        written = dict(zip(scroll.names, scroll.values(params)))
+        file_name = f"{name}_{index:0{width}d}.pine"
+        if directory is None:
+            scripts.append(script)
+        else:
+            with open(os.path.join(directory, file_name), "w", encoding="utf-8") as file:
+                file.write(script)
+        rows.append([file_name] + [params[slot] if scroll.kinds[slot] == "str" else written[slot]
+                                   for slot in names])
+    return rows, scripts
+
+def _rendered(grid: Grid, job: Callable, workers: int, batch_size: int) -> Iterator[Tuple[List[List[Any]], List[str]]]:
+    """
+    The batches' results, in order. At most two batches per worker are in
+    flight, so the product is read only as fast as it is rendered.
+    """
+    if workers <= 1 or len(grid) <= batch_size:
+        for start, batch in grid.batches(batch_size):
+            yield job(start, batch)
+        return
+
+    # Imported here: multiprocessing is needed only by sweeps that use it.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, batch in grid.batches(batch_size):
+            pending.append(pool.submit(job, start, batch))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def sweep(name: str, axes: Dict[str, Any], output: str, workers: Optional[int] = None,
+          batch_size: int = BATCH_SIZE) -> int:
+    """
+    Renders the template `name` for every combination of `axes` (one per
+    slot) into `output`: a directory, or an archive if it ends in '.zip'.
+    Returns the number of scripts written.
+    """
+    scroll = template(name)
+    missing = [slot for slot in scroll.names if slot not in axes]
+    unknown = [slot for slot in axes if slot not in scroll.names]
+    if missing or unknown:
+        raise TemplateError(f"{name}: " + "; ".join(
+            ([f"missing {', '.join(missing)}"] if missing else []) +
+            ([f"has no slot {', '.join(unknown)}"] if unknown else [])) + ".")
+    grid = Grid(axes)
+    total = len(grid)
+    if total:
+        # The first variant is rendered here, so a bad parameter is reported before any worker starts.
+        scroll.render(**_variant(name, grid.names, 0, next(iter(grid))))
+
+    archive = output.endswith(".zip")
+    if archive:
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    else:
+        os.makedirs(output, exist_ok=True)
+    width = max(6, len(str(total - 1)))
+    job = functools.partial(_render_batch, name, grid.names, None if archive else output, width)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    manifest = io.StringIO()
+    ledger = csv.writer(manifest, lineterminator="\n")
+    ledger.writerow(["file"] + list(grid.names))
+    bundle = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) if archive else None
+    try:
+        for rows, scripts in _rendered(grid, job, workers, batch_size):
+            ledger.writerows(rows)
+            if bundle is not None:
+                for row, script in zip(rows, scripts):
+                    bundle.writestr(row[0], script)
+        if bundle is not None:
+            bundle.writestr(MANIFEST, manifest.getvalue())
+    finally:
+        if bundle is not None:
+            bundle.close()
+    if not archive:
+        with open(os.path.join(output, MANIFEST), "w", encoding="utf-8", newline="") as file:
+            file.write(manifest.getvalue())
+    return total
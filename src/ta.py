@@ -0,0 +1,168 @@
+"""
+src/ta.py
+====================================
+The Technical Analysis Primitives (The Lens).
+Pine Script's ta.* functions over whole NumPy arrays, so a generated
+strategy can be evaluated on every bar at once instead of in TradingView.
+
+Each follows the definition in the Pine Script reference: a value that
+Pine would leave na (the first length - 1 bars of a window, the first bar
+of a change) is NaN, and NaN never satisfies a comparison. The recursive
+averages (ema, rma) run blockwise in closed form, never bar by bar.
+
+Requires NumPy (pip install mpl-magick[backtest]); src/backtest.py is the
+entry point that reports its absence.
+"""
+
+import math
+from typing import Tuple, Union
+
+import numpy as np
+
+Series = np.ndarray
+Level = Union[Series, float]
+
+# ema/rma blocks are kept short enough that decay ** -block (at most e ** 500) stays finite.
+_EXPONENT = 500.0
+
+def _na(source: Series) -> Series:
+    return np.full(len(source), np.nan)
+
+def _first(source: Series) -> int:
+    """Index of the first value that is not NaN (len(source) if there is none)."""
+    valid = ~np.isnan(source)
+    return int(valid.argmax()) if valid.any() else len(source)
+
+def _previous(source: Series) -> Series:
+    """source[1]: the series one bar back."""
+    return np.concatenate(([np.nan], source[:-1]))
+
+def change(source: Series) -> Series:
+    return source - _previous(source)
+
+def sma(source: Series, length: int) -> Series:
+    out, start = _na(source), _first(source)
+    if len(source) - start < length:
+        return out
+    sums = np.cumsum(source[start:])
+    out[start + length - 1] = sums[length - 1]
+    out[start + length:] = sums[length:] - sums[:-length]
+    out[start + length - 1:] /= length
+    return out
+
+def _smooth(source: Series, alpha: float, length: int) -> Series:
+    """
+    y = alpha * source + (1 - alpha) * y[1], seeded with the sma of the
+    first `length` values. Within a block, with d = 1 - alpha,
+    y[t] = d ** t * (y[0] + sum(alpha * source[k] / d ** k, k = 1..t)).
+    """
+    out, start = _na(source), _first(source)
+    seed = start + length - 1
+    if seed >= len(source):
+        return out
+    level = out[seed] = source[start:seed + 1].mean()
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        out[seed:] = source[seed:]
+        return out
+
+    inflow = alpha * source[seed + 1:]
+    block = max(1, min(len(inflow), int(_EXPONENT / -math.log(decay))))
+    steps = np.arange(1, block + 1)
+    growth, fade = decay ** -steps, decay ** steps
+    for begin in range(0, len(inflow), block):
+        chunk = inflow[begin:begin + block]
+        values = fade[:len(chunk)] * (level + np.cumsum(chunk * growth[:len(chunk)]))
+        out[seed + 1 + begin:seed + 1 + begin + len(chunk)] = values
+        level = values[-1]
+    return out
+
+def ema(source: Series, length: int) -> Series:
+    return _smooth(source, 2.0 / (length + 1), length)
+
+def rma(source: Series, length: int) -> Series:
+    """Wilder's moving average, behind rsi, atr and dmi."""
+    return _smooth(source, 1.0 / length, length)
+
+def wma(source: Series, length: int) -> Series:
+    out, start = _na(source), _first(source)
+    if len(source) - start < length:
+        return out
+    # Each window is weighed on its own (the newest bar weighs `length`): a
+    # running sum would carry its rounding error across every later bar.
+    weights = np.arange(1.0, length + 1) / (length * (length + 1) / 2)
+    out[start + length - 1:] = np.convolve(source[start:], weights[::-1], "valid")
+    return out
+
+def _window(source: Series, length: int, accumulate, combine, identity: float) -> Series:
+    """
+    A sliding max/min in O(n) (van Herk / Gil-Werman): each window spans at
+    most two blocks of `length` bars, the suffix of one and the prefix of
+    the next.
+    """
+    out, size = _na(source), len(source)
+    if size < length:
+        return out
+    blocks = np.concatenate((source, np.full(-size % length, identity))).reshape(-1, length)
+    prefix = accumulate(blocks, axis=1).ravel()
+    suffix = accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    out[length - 1:] = combine(suffix[:size - length + 1], prefix[length - 1:size])
+    return out
+
+def highest(source: Series, length: int) -> Series:
+    return _window(source, length, np.maximum.accumulate, np.maximum, -np.inf)
+
+def lowest(source: Series, length: int) -> Series:
+    return _window(source, length, np.minimum.accumulate, np.minimum, np.inf)
+
+def crossover(a: Series, b: Level) -> Series:
+    """a > b on this bar, and a <= b on the one before."""
+    b = np.broadcast_to(b, a.shape)
+    crossed = np.zeros(len(a), dtype=bool)
+    crossed[1:] = (a[1:] > b[1:]) & (a[:-1] <= b[:-1])
+    return crossed
+
+def crossunder(a: Series, b: Level) -> Series:
+    """a < b on this bar, and a >= b on the one before."""
+    b = np.broadcast_to(b, a.shape)
+    crossed = np.zeros(len(a), dtype=bool)
+    crossed[1:] = (a[1:] < b[1:]) & (a[:-1] >= b[:-1])
+    return crossed
+
+def fixnan(source: Series) -> Series:
+    """NaN replaced by the last value that was not."""
+    last = np.where(np.isnan(source), 0, np.arange(len(source)))
+    return source[np.maximum.accumulate(last)]
+
+def rsi(source: Series, length: int) -> Series:
+    moved = change(source)
+    up, down = rma(np.maximum(moved, 0.0), length), rma(np.maximum(-moved, 0.0), length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength = 100.0 - 100.0 / (1.0 + up / down)
+    return np.where(down == 0, 100.0, np.where(up == 0, 0.0, strength))
+
+def tr(high: Series, low: Series, close: Series, handle_na: bool = False) -> Series:
+    """True range; on the first bar it is na, or high - low when handle_na."""
+    previous = _previous(close)
+    ranges = np.maximum(high - low, np.maximum(np.abs(high - previous), np.abs(low - previous)))
+    if handle_na and len(ranges):
+        ranges[0] = high[0] - low[0]
+    return ranges
+
+def atr(high: Series, low: Series, close: Series, length: int) -> Series:
+    return rma(tr(high, low, close, handle_na=True), length)
+
+def dmi(high: Series, low: Series, close: Series, di_length: int, adx_length: int) -> Tuple[Series, Series, Series]:
+    """(+DI, -DI, ADX)."""
+    up, down = change(high), -change(low)
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    plus_dm[np.isnan(up)] = np.nan
+    minus_dm[np.isnan(down)] = np.nan
+    true_range = rma(tr(high, low, close), di_length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus = fixnan(100.0 * rma(plus_dm, di_length) / true_range)
+        minus = fixnan(100.0 * rma(minus_dm, di_length) / true_range)
+        total = plus + minus
+        adx = 100.0 * rma(np.abs(plus - minus) / np.where(total == 0, 1.0, total), adx_length)
+    return plus, minus, adx
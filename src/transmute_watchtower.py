@@ -5,9 +5,10 @@
 import sys
 import os
 
-# Add module path to import Occultator
-sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
-from occultator import Occultator
+# Add the project root to the path, so this runs as a script too
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.modules.occultator import Occultator
+from src.pine import emit
 
 def transmute_artifact():
     print(">> [MPL] INITIATING TRANSMUTATION PROTOCOL (V6 UPGRADE)...")
@@ -25,62 +26,11 @@ def transmute_artifact():
 
     print(f">> [OCCULTATOR] COMPUTED VALUES: GRID={vector_grid}, SIGIL={sigil_cipher}, FIB={fib_level}")
 
-    # 3. PINE SCRIPT TEMPLATE (V6)
-    # Injecting the calculated numbers directly into the Pine Script code
-    pine_script_code = f"""// This source code is subject to the terms of the Mozilla Public License 2.0 at https://mozilla.org/MPL/2.0/
-// © MielaLabs
-// GENERATED BY MPL ENGINE (Occultator V2.0)
-// ARTIFACT: ENOCHIAN WATCHTOWER [Entity: {entity}]
-// VERSION: 6.0 (Latest Standard)
-
-//@version=6
-indicator("Miela Labs | Enochian Watchtower [{vector_grid}-{sigil_cipher}]", shorttitle="ML_WATCHTOWER", overlay=true)
-
-// --- SACRED GEOMETRY CONSTANTS (Calculated by MPL) ---
-var int VECTOR_GRID = {vector_grid}  // Enochian Vector (Trend Axis)
-var int SIGIL_CIPHER = {sigil_cipher} // Galethog Cipher (Volatility Gate)
-var int FIB_LEVEL = {fib_level}    // Golden Ratio (Signal Trigger)
-
-// --- THE WATCHTOWER LOGIC ---
-
-// 1. THE AXIS MUNDI (Trend Baseline)
-// Using Weighted Moving Average on the Enochian Vector
-basis_line = ta.wma(close, VECTOR_GRID)
-
-// 2. THE GATES (Volatility Channel)
-// Using the Sigil Cipher to find the absolute High/Low bounds
-upper_gate = ta.highest(high, SIGIL_CIPHER)
-lower_gate = ta.lowest(low, SIGIL_CIPHER)
-
-// 3. THE SIGNAL (Trigger)
-// Smoothed Fibonacci EMA
-signal_path = ta.ema(close, FIB_LEVEL)
-
-// --- VISUALIZATION (Manifestation) ---
-plot(basis_line, "Watchtower Axis", color=color.new(#9d00ff, 0), linewidth=3) // Electric Purple
-plot(upper_gate, "Heaven Gate", color=color.new(#00ff41, 50), linewidth=1)    // Neon Green
-plot(lower_gate, "Earth Gate", color=color.new(#dc143c, 50), linewidth=1)     // Crimson Red
-
-// Fill the channel for "Zone" effect
-fill(plot(upper_gate), plot(lower_gate), color=color.new(#9d00ff, 95), title="Enochian Field")
-
-// --- SIGNAL GENERATION ---
-buy_signal = ta.crossover(signal_path, basis_line)
-sell_signal = ta.crossunder(signal_path, basis_line)
-
-// Plot Signals on Chart
-plotshape(buy_signal, title="BUY SIGNAL", location=location.belowbar, color=#00ff41, style=shape.triangleup, size=size.small, text="L")
-plotshape(sell_signal, title="SELL SIGNAL", location=location.abovebar, color=#dc143c, style=shape.triangledown, size=size.small, text="S")
-
-// Alert Conditions
-alertcondition(buy_signal, title="Watchtower BUY", message="Miela Labs: Enochian Long Entry Detected")
-alertcondition(sell_signal, title="Watchtower SELL", message="Miela Labs: Enochian Short Entry Detected")
-"""
-
-    # 4. WRITE TO FILE
+    # 3. PINE SCRIPT TEMPLATE (V6): src/templates/enochian_watchtower.pine
+    # Injecting the calculated numbers into its slots, and writing the artifact
     output_path = "examples/enochian_watchtower.pine"
-    with open(output_path, "w") as f:
-        f.write(pine_script_code)
+    emit("enochian_watchtower", output_path,
+         entity=entity, vector_grid=vector_grid, sigil_cipher=sigil_cipher, fib_level=fib_level)
     
     print(f">> [SUCCESS] Artifact Transmuted to V6: {output_path}")
     print(">> COPY THE CONTENT OF THE .pine FILE TO TRADINGVIEW.")
@@ -0,0 +1,366 @@
+"""
+src/vm.py
+====================================
+The Virtual Machine (The Engine of Glyphs).
+A stack machine that performs the Chunks produced by src/bytecode.py.
+Behaviour that the Interpreter owns (invocation, the Tesla Protocol,
+truthiness and transmutation) is delegated back to it, so every engine
+produces the same ritual.
+
+The Chunk is threaded before it runs: each glyph becomes one closure with
+its operands already decoded, stored at the glyph's address, which
+performs it and returns the address of the next. The dispatch loop is then
+a single indexed call per glyph ('ip = program[ip]()'), with no chain of
+opcode comparisons. The stack, the current scope and the active Circles
+are cells shared by the closures of one run.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+from .bytecode import OpCode, Chunk, WITH_OPERAND
+from .environment import Environment, RuntimeException, UNBOUND
+from .stdlib import CallSite
+
+# A threaded glyph: performs itself, returns the next address.
+Glyph = Callable[[], int]
+
+class VM:
+    """Performs bytecode Chunks on behalf of an Interpreter."""
+
+    def __init__(self, interpreter: Any):
+        self.interpreter = interpreter
+
+    def run(self, chunk: Chunk, env: Environment):
+        code, constants = chunk.code, chunk.constants
+        interpreter = self.interpreter
+        is_truthy = interpreter._is_truthy
+        stack: List[Any] = []
+        push, pop = stack.append, stack.pop
+        # Active Circles: (resume address, scope, stack depth) at the time of entry.
+        circles: List[Tuple[int, Environment, int]] = []
+
+        # --- Stack & Memory ---
+        # Resolved variables are read and written by slot; an UNBOUND slot (or
+        # a sealed one) defers to the name-based Environment API. Reads are
+        # specialised for the scope depths that cycles and blocks produce.
+        def constant(ip: int, operand: int) -> Glyph:
+            value, after = constants[operand], ip + 2
+            def glyph():
+                push(value)
+                return after
+            return glyph
+
+        def get(ip: int, operand: int) -> Glyph:
+            name, depth, slot = constants[operand]
+            after = ip + 2
+            if depth == 0:
+                def glyph():
+                    value = env.slots[slot]
+                    push(env.get_name(name) if value is UNBOUND else value)
+                    return after
+            elif depth == 1:
+                def glyph():
+                    value = env.enclosing.slots[slot]
+                    push(env.get_name(name) if value is UNBOUND else value)
+                    return after
+            elif depth == 2:
+                def glyph():
+                    value = env.enclosing.enclosing.slots[slot]
+                    push(env.get_name(name) if value is UNBOUND else value)
+                    return after
+            else:
+                def glyph():
+                    value = env.ancestor(depth).slots[slot]
+                    push(env.get_name(name) if value is UNBOUND else value)
+                    return after
+            return glyph
+
+        def bind(ip: int, operand: int) -> Glyph:
+            name, depth, slot = constants[operand]
+            after = ip + 2
+            def glyph():
+                scope = (env if depth == 0 else env.enclosing if depth == 1
+                         else env.enclosing.enclosing if depth == 2 else env.ancestor(depth))
+                if scope.slots[slot] is UNBOUND or name in scope.sealed:
+                    env.set_or_define(name, pop())
+                else:
+                    scope.slots[slot] = pop()
+                return after
+            return glyph
+
+        def get_name(ip: int, operand: int) -> Glyph:
+            name, after = constants[operand], ip + 2
+            def glyph():
+                push(env.get_name(name))
+                return after
+            return glyph
+
+        def bind_name(ip: int, operand: int) -> Glyph:
+            name, after = constants[operand], ip + 2
+            def glyph():
+                env.set_or_define(name, pop())
+                return after
+            return glyph
+
+        def pop_value(ip: int, operand: int) -> Glyph:
+            after = ip + 1
+            def glyph():
+                pop()
+                return after
+            return glyph
+
+        # --- Arithmetic & Comparison ---
+        def binary(ip: int, operand: int) -> Glyph:
+            operator, after = constants[operand], ip + 2
+            def glyph():
+                right = pop()
+                stack[-1] = operator(stack[-1], right)
+                return after
+            return glyph
+
+        def binary_constant(ip: int, operand: int) -> Glyph:
+            (operator, right), after = constants[operand], ip + 2
+            def glyph():
+                stack[-1] = operator(stack[-1], right)
+                return after
+            return glyph
+
+        def get_binary_constant(ip: int, operand: int) -> Glyph:
+            name, depth, slot, operator, right = constants[operand]
+            after = ip + 2
+            if depth == 0:
+                def glyph():
+                    value = env.slots[slot]
+                    push(operator(env.get_name(name) if value is UNBOUND else value, right))
+                    return after
+            elif depth == 1:
+                def glyph():
+                    value = env.enclosing.slots[slot]
+                    push(operator(env.get_name(name) if value is UNBOUND else value, right))
+                    return after
+            elif depth == 2:
+                def glyph():
+                    value = env.enclosing.enclosing.slots[slot]
+                    push(operator(env.get_name(name) if value is UNBOUND else value, right))
+                    return after
+            else:
+                def glyph():
+                    value = env.ancestor(depth).slots[slot]
+                    push(operator(env.get_name(name) if value is UNBOUND else value, right))
+                    return after
+            return glyph
+
+        # --- Control Flow ---
+        def jump(ip: int, target: int) -> Glyph:
+            return lambda: target
+
+        def jump_if_false(ip: int, target: int) -> Glyph:
+            after = ip + 2
+            def glyph():
+                # Comparisons leave a bool: only other values need MPL's truthiness.
+                condition = pop()
+                if condition is True or (condition is not False and is_truthy(condition)):
+                    return after
+                return target
+            return glyph
+
+        def attune(ip: int, operand: int) -> Glyph:
+            after = ip + 1
+            def glyph():
+                push(interpreter._attune_cycle(pop()))
+                return after
+            return glyph
+
+        def enter_cycle(ip: int, exit_target: int) -> Glyph:
+            after = ip + 2
+            def glyph():
+                if stack[-1] > 0:
+                    stack[-1] -= 1
+                    return after
+                pop()
+                return exit_target
+            return glyph
+
+        def repeat_cycle(ip: int, body: int) -> Glyph:
+            after = ip + 2
+            def glyph():
+                if stack[-1] > 0:
+                    stack[-1] -= 1
+                    return body
+                pop()
+                return after
+            return glyph
+
+        def enter_scope(ip: int, operand: int) -> Glyph:
+            layout, after = constants[operand], ip + 2
+            def glyph():
+                nonlocal env
+                env = Environment(env, layout)
+                return after
+            return glyph
+
+        def exit_scope(ip: int, operand: int) -> Glyph:
+            after = ip + 1
+            def glyph():
+                nonlocal env
+                env = env.enclosing
+                return after
+            return glyph
+
+        def renew_scope(ip: int, operand: int) -> Glyph:
+            fresh, after = constants[operand], ip + 2
+            def glyph():
+                env.slots[:] = fresh
+                if env.sealed: env.sealed.clear()
+                return after
+            return glyph
+
+        def setup_circle(ip: int, resume: int) -> Glyph:
+            after = ip + 2
+            def glyph():
+                circles.append((resume, env, len(stack)))
+                return after
+            return glyph
+
+        def pop_circle(ip: int, operand: int) -> Glyph:
+            after = ip + 1
+            def glyph():
+                circles.pop()
+                return after
+            return glyph
+
+        # --- The Sealed Verbs ---
+        def echo(ip: int, operand: int) -> Glyph:
+            after = ip + 1
+            def glyph():
+                print(f"👁️‍🗨️ [ECHO]: {pop()}")
+                return after
+            return glyph
+
+        def invoke(ip: int, operand: int) -> Glyph:
+            (entity, names), after = constants[operand], ip + 2
+            count = len(names)
+            # What this INVOKE resolved to, so a cycle resolves it once.
+            site = CallSite()
+            def glyph():
+                values = stack[len(stack) - count:]
+                del stack[len(stack) - count:]
+                interpreter._invoke(entity, dict(zip(names, values)), site)
+                return after
+            return glyph
+
+        def hex_(ip: int, operand: int) -> Glyph:
+            name, depth, slot = constants[operand]
+            after = ip + 2
+            def glyph():
+                value = pop()
+                if value is None:
+                    print(f"⚠️ [HEX] No 'value' parameter provided to hex '{name}'.")
+                    return after
+                scope = None if depth is None else env.ancestor(depth)
+                if scope is None or scope.slots[slot] is UNBOUND or name in scope.sealed:
+                    env.assign_name(name, value)
+                else:
+                    scope.slots[slot] = value
+                return after
+            return glyph
+
+        def seal(ip: int, operand: int) -> Glyph:
+            target, after = constants[operand], ip + 2
+            def glyph():
+                env.seal(target)
+                print(f"🔒 [SEAL] Variable '{target}' is now immutable.")
+                return after
+            return glyph
+
+        def banish(ip: int, operand: int) -> Glyph:
+            target, after = constants[operand], ip + 2
+            def glyph():
+                env.banish(target)
+                print(f"🗑️ [BANISH] '{target}' cast into the void.")
+                return after
+            return glyph
+
+        def purge(ip: int, operand: int) -> Glyph:
+            after = ip + 1
+            def glyph():
+                env.purge()
+                print("🔥 [PURGE] Memory cleansed.")
+                return after
+            return glyph
+
+        def omen(ip: int, operand: int) -> Glyph:
+            target, after = constants[operand], ip + 2
+            def glyph():
+                env.define(target, input(f"🔮 [OMEN] Enter value for '{target}': "))
+                return after
+            return glyph
+
+        def summon(ip: int, operand: int) -> Glyph:
+            module, after = constants[operand], ip + 2
+            def glyph():
+                interpreter._summon(module)
+                return after
+            return glyph
+
+        def pact(ip: int, operand: int) -> Glyph:
+            target, after = constants[operand], ip + 2
+            def glyph():
+                env.define(target, interpreter._pact(pop()))
+                return after
+            return glyph
+
+        def morph(ip: int, operand: int) -> Glyph:
+            (name, stmt), after = constants[operand], ip + 2
+            def glyph():
+                env.assign_name(name, interpreter._transmute(stmt, env.get_name(name)))
+                return after
+            return glyph
+
+        def abyss(ip: int, operand: int) -> Glyph:
+            def glyph():
+                raise RuntimeException(pop())
+            return glyph
+
+        def unknown(ip: int, op: int) -> Glyph:
+            def glyph():
+                raise RuntimeException(f"Unknown glyph {op} at {ip}.")
+            return glyph
+
+        threading: Dict[int, Callable[[int, int], Glyph]] = {
+            OpCode.CONSTANT: constant, OpCode.GET: get, OpCode.BIND: bind,
+            OpCode.GET_NAME: get_name, OpCode.BIND_NAME: bind_name, OpCode.POP: pop_value,
+            OpCode.BINARY: binary, OpCode.BINARY_CONSTANT: binary_constant,
+            OpCode.GET_BINARY_CONSTANT: get_binary_constant,
+            OpCode.JUMP: jump, OpCode.JUMP_IF_FALSE: jump_if_false, OpCode.ATTUNE: attune,
+            OpCode.ENTER_CYCLE: enter_cycle, OpCode.REPEAT_CYCLE: repeat_cycle,
+            OpCode.ENTER_SCOPE: enter_scope, OpCode.EXIT_SCOPE: exit_scope, OpCode.RENEW_SCOPE: renew_scope,
+            OpCode.SETUP_CIRCLE: setup_circle, OpCode.POP_CIRCLE: pop_circle,
+            OpCode.ECHO: echo, OpCode.INVOKE: invoke, OpCode.HEX: hex_, OpCode.SEAL: seal,
+            OpCode.BANISH: banish, OpCode.PURGE: purge, OpCode.OMEN: omen, OpCode.SUMMON: summon,
+            OpCode.PACT: pact, OpCode.MORPH: morph, OpCode.ABYSS: abyss,
+        }
+
+        # Thread the Chunk: one glyph per instruction address (operand cells stay None).
+        program: List[Glyph] = [None] * len(code)
+        ip = 0
+        while ip < len(code):
+            op = code[ip]
+            if op in WITH_OPERAND:
+                program[ip] = threading[op](ip, code[ip + 1])
+                ip += 2
+            else:
+                program[ip] = threading[op](ip, None) if op in threading else unknown(ip, op)
+                ip += 1
+
+        ip, end = 0, len(code)
+        while True:
+            try:
+                while ip < end:
+                    ip = program[ip]()
+                return
+            except Exception as e:
+                # A failure inside a Circle resumes after it, like the tree-walker.
+                if not circles: raise
+                ip, env, depth = circles.pop()
+                del stack[depth:]
+                print(f"🛡️ [CIRCLE] Protected against chaos: {e}")
@@ -0,0 +1,202 @@
+import unittest
+import sys
+import os
+import io
+import csv
+import math
+import random
+import shutil
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.backtest import (BacktestError, Bars, Signals, backtest, load_csv, np, positions, score, score_sweep)
+from src.sweep import sweep
+from src import main
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+NA = float("nan")
+
+# --- Bar-by-bar references, as the Pine Script manual defines them ---
+def ref_sma(x, n):
+    return [sum(x[t - n + 1:t + 1]) / n if t >= n - 1 and not any(map(math.isnan, x[t - n + 1:t + 1])) else NA
+            for t in range(len(x))]
+
+def ref_smooth(x, alpha, n):
+    seeds, out, last = ref_sma(x, n), [], NA
+    for t, value in enumerate(x):
+        last = seeds[t] if math.isnan(last) else alpha * value + (1 - alpha) * last
+        out.append(last)
+    return out
+
+def ref_wma(x, n):
+    return [sum(x[t - n + 1 + i] * (i + 1) for i in range(n)) / (n * (n + 1) / 2) if t >= n - 1 else NA
+            for t in range(len(x))]
+
+def ref_rsi(x, n):
+    up = ref_smooth([NA] + [max(b - a, 0) for a, b in zip(x, x[1:])], 1 / n, n)
+    down = ref_smooth([NA] + [max(a - b, 0) for a, b in zip(x, x[1:])], 1 / n, n)
+    return [NA if math.isnan(u) or math.isnan(d) else 100 if d == 0 else 0 if u == 0 else 100 - 100 / (1 + u / d)
+            for u, d in zip(up, down)]
+
+def walk(size, seed=9):
+    rng = random.Random(seed)
+    close, price = [], 100.0
+    for _ in range(size):
+        price += rng.gauss(0, 1)
+        close.append(price)
+    high = [c + rng.random() for c in close]
+    low = [c - rng.random() for c in close]
+    return high, low, close
+
+@unittest.skipIf(np is None, "NumPy is not installed (pip install mpl-magick[backtest])")
+class TestBacktest(unittest.TestCase):
+    """
+    🔮 THE MIRROR (Backtest Engine Tests)
+    Verifies the ta.* primitives against Pine's own definitions, and that
+    strategies and sweeps are scored from local bars.
+    """
+
+    def setUp(self):
+        from src import ta
+        self.ta = ta
+        self.realm = tempfile.mkdtemp()
+        self.high, self.low, self.close = walk(600)
+
+    def tearDown(self):
+        shutil.rmtree(self.realm)
+
+    def assertSeries(self, actual, expected, label):
+        np.testing.assert_allclose(actual, np.array(expected, dtype=float), rtol=1e-9, atol=1e-9, err_msg=label)
+
+    def test_moving_averages(self):
+        """TEST 1: sma, ema, rma and wma agree with Pine's definitions, from their first valid bar."""
+        ta, close = self.ta, np.array(self.close)
+        for n in (1, 2, 9, 200):
+            self.assertSeries(ta.sma(close, n), ref_sma(self.close, n), f"sma {n}")
+            self.assertSeries(ta.ema(close, n), ref_smooth(self.close, 2 / (n + 1), n), f"ema {n}")
+            self.assertSeries(ta.rma(close, n), ref_smooth(self.close, 1 / n, n), f"rma {n}")
+            self.assertSeries(ta.wma(close, n), ref_wma(self.close, n), f"wma {n}")
+        self.assertSeries(ta.sma(ta.rsi(close, 14), 9), ref_sma(ref_rsi(self.close, 14), 9), "sma of rsi")
+        self.assertTrue(np.isnan(ta.sma(close[:5], 9)).all())
+        # Over a long series at a high price, each window still matches its own weighted sum.
+        prices = 1e6 + np.cumsum(np.random.default_rng(3).normal(0, 50, 1000000))
+        weights = np.arange(1.0, 258)
+        weighted = ta.wma(prices, 257)
+        for bar in (256, 5000, 500000, 999999):
+            self.assertAlmostEqual(weighted[bar], np.dot(prices[bar - 256:bar + 1], weights) / weights.sum(),
+                                   delta=1e-6, msg=f"wma at bar {bar}")
+        print("✅ [TEST] Moving Averages Passed.")
+
+    def test_oscillators_and_channels(self):
+        """TEST 2: rsi, atr, dmi, highest, lowest and the crosses agree with Pine's definitions."""
+        ta = self.ta
+        high, low, close = (np.array(series) for series in (self.high, self.low, self.close))
+        self.assertSeries(ta.rsi(close, 14), ref_rsi(self.close, 14), "rsi")
+        ranges = [self.high[0] - self.low[0]] + [max(h - l, abs(h - c), abs(l - c)) for h, l, c in
+                                                   zip(self.high[1:], self.low[1:], self.close)]
+        self.assertSeries(ta.atr(high, low, close, 14), ref_smooth(ranges, 1 / 14, 14), "atr")
+
+        up = [NA] + [b - a for a, b in zip(self.high, self.high[1:])]
+        down = [NA] + [a - b for a, b in zip(self.low, self.low[1:])]
+        plus_dm = [NA] + [u if u > d and u > 0 else 0 for u, d in zip(up[1:], down[1:])]
+        minus_dm = [NA] + [d if d > u and d > 0 else 0 for u, d in zip(up[1:], down[1:])]
+        true_range = ref_smooth([NA] + ranges[1:], 1 / 14, 14)
+        plus = [100 * p / r for p, r in zip(ref_smooth(plus_dm, 1 / 14, 14), true_range)]
+        minus = [100 * m / r for m, r in zip(ref_smooth(minus_dm, 1 / 14, 14), true_range)]
+        dx = [abs(p - m) / ((p + m) or 1) for p, m in zip(plus, minus)]
+        dmi = ta.dmi(high, low, close, 14, 14)
+        self.assertSeries(dmi[0], plus, "+di")
+        self.assertSeries(dmi[1], minus, "-di")
+        self.assertSeries(dmi[2], [100 * v for v in ref_smooth(dx, 1 / 14, 14)], "adx")
+
+        for n in (1, 7, 50):
+            self.assertSeries(ta.highest(high, n), [max(self.high[t - n + 1:t + 1]) if t >= n - 1 else NA
+                                                    for t in range(len(high))], f"highest {n}")
+            self.assertSeries(ta.lowest(low, n), [min(self.low[t - n + 1:t + 1]) if t >= n - 1 else NA
+                                                  for t in range(len(low))], f"lowest {n}")
+        rising = np.array([1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0])
+        self.assertEqual(ta.crossover(rising, 2.0).tolist(), [False, False, True, False, False, False, True])
+        self.assertEqual(ta.crossunder(rising, np.full(7, 2.0)).tolist(), [False] * 4 + [True, False, False])
+
+    def test_load_csv(self):
+        """TEST 3: Bars are read by column name; other columns are skipped, bad files refused."""
+        path = os.path.join(self.realm, "bars.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("time,Close,Open,High,Low,Volume\n1600000000,10.5,10,11,9.5,300\n1600003600,11,10.5,11.5,10,200\n")
+        bars = load_csv(path)
+        self.assertEqual(len(bars), 2)
+        self.assertEqual(bars.close.tolist(), [10.5, 11.0])
+        self.assertEqual(bars.low.tolist(), [9.5, 10.0])
+        for text in ("time,open,high,close\n1,2,3,4\n", "open,high,low,close\n1,2,x,4\n", "open,high,low,close\n"):
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+            with self.assertRaises(BacktestError):
+                load_csv(path)
+
+    def test_positions_and_score(self):
+        """TEST 4: Buys are held, or reversed by sells, and scored from the close of their bar."""
+        bars = Bars(*([[100.0, 110.0, 121.0, 110.0]] * 4))
+        held = Signals(buy=np.array([True, False, False, False]), hold=2)
+        self.assertEqual(positions(held).tolist(), [1.0, 1.0, 0.0, 0.0])
+        result = score(bars, held)
+        self.assertEqual((result.signals, result.trades, result.win_rate, result.exposure), (1, 1, 1.0, 0.5))
+        self.assertAlmostEqual(result.total_return, 0.21)
+
+        reversal = Signals(buy=np.array([True, False, False, False]), sell=np.array([False, False, True, False]))
+        self.assertEqual(positions(reversal).tolist(), [1.0, 1.0, -1.0, -1.0])
+        result = score(bars, reversal)
+        self.assertEqual((result.signals, result.trades, result.win_rate), (2, 2, 1.0))
+        self.assertAlmostEqual(result.total_return, 1.21 * (2 - 110 / 121) - 1)
+
+        with self.assertRaises(BacktestError):
+            backtest("no_such_strategy", bars)
+        with self.assertRaises(BacktestError):
+            Bars([], [], [], [])
+
+    def test_score_sweep(self):
+        """TEST 5: Every variant of a sweep is scored; 'mpl backtest' ranks them and writes the scores."""
+        path = os.path.join(self.realm, "bars.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("open,high,low,close\n")
+            file.writelines(f"{c},{h},{l},{c}\n" for h, l, c in zip(self.high, self.low, self.close))
+        folder = os.path.join(self.realm, "oracles")
+        # A float given to an int slot (as 'mpl sweep slow=20:50.0:30' does) is read back as an int.
+        sweep("hybrid_oracle", dict(title="Oracle", fast=50, slow=[20, 50.0], rsi=[40, 50], adx=10, offset=5), folder)
+        bars = load_csv(path)
+        scored = list(score_sweep(bars, folder))
+        self.assertEqual(len(scored), 4)
+        row, result = scored[3]
+        self.assertEqual((row["slow"], row["rsi"]), ("50", "50"))
+        self.assertEqual(result, backtest("hybrid_oracle", Bars(bars.open, bars.high, bars.low, bars.close),
+                                          slow=50, rsi=50, adx=10, offset=5))
+
+        scores = os.path.join(self.realm, "scores.csv")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main.backtest(path, folder, top=2, scores_path=scores), 0)
+            self.assertEqual(main.backtest(path, self.realm), 1)
+        self.assertIn("4 variants scored on 600 bars", output.getvalue())
+        self.assertIn("No sweep manifest", output.getvalue())
+        with open(scores, encoding="utf-8") as file:
+            self.assertEqual(len(list(csv.DictReader(file))), 4)
+
+class TestBacktestWithoutNumPy(unittest.TestCase):
+    """🔮 THE MIRROR, CLOUDED: NumPy is optional, and never loaded by 'mpl' itself."""
+
+    def test_missing_numpy_is_reported(self):
+        """TEST 6: Without NumPy the backtest says how to install it; the rest of MPL is untouched."""
+        probe = ("import sys; sys.modules['numpy'] = None; import src.main; "
+                 "from src.backtest import BacktestError, load_csv\n"
+                 "try: load_csv('bars.csv')\n"
+                 "except BacktestError as e: print(e)")
+        result = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True)
+        self.assertIn("pip install mpl-magick[backtest]", result.stdout, result.stderr)
+
+        # Nor are the sweep's modules, until a subcommand needs them.
+        probe = "import sys; import src.main; print([name in sys.modules for name in ('numpy', 'src.sweep')])"
+        result = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), "[False, False]", result.stderr)
@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import struct
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.resolver import Resolver, build_codex, MAGI_PATH, SOLOMON_PATH, ABRAMELIN_PATH
+from src.codex import Codex, CodexError, CodexTable
+
+def quiet(ritual, *args, **kwargs):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = ritual(*args, **kwargs)
+    return result, output.getvalue()
+
+class TestCodex(unittest.TestCase):
+    """
+    📕 THE BOUND GRIMOIRES (Binary Codex Tests)
+    Verifies that the codex answers exactly as the JSON grimoires do, and is
+    never trusted once they have changed.
+    """
+
+    def setUp(self):
+        self.realm = tempfile.mkdtemp()
+        self.paths = {}
+        for name, path in (("magi_path", MAGI_PATH), ("solomon_path", SOLOMON_PATH), ("abramelin_path", ABRAMELIN_PATH)):
+            self.paths[name] = os.path.join(self.realm, os.path.basename(path))
+            shutil.copy(path, self.paths[name])
+        self.codex = os.path.join(self.realm, 'ontology.mplc')
+        quiet(build_codex, self.codex, **self.paths)
+
+    def tearDown(self):
+        shutil.rmtree(self.realm)
+
+    def test_codex_matches_the_json(self):
+        """TEST 1: Every key resolves to the same record from the codex as from the JSON."""
+        bound, _ = quiet(Resolver, codex_path=self.codex, **self.paths)
+        plain, _ = quiet(Resolver, codex_path="", **self.paths)
+        self.assertTrue(all(isinstance(g, CodexTable) for g in bound.grimoires))
+        self.assertEqual(sum(len(g.records) for g in bound.grimoires), 0)  # Nothing decoded yet
+        for key, record in plain.knowledge_base.items():
+            self.assertEqual(bound.resolve(key), record, key)
+        self.assertEqual([key for key, _ in bound.invocable()], [key for key, _ in plain.invocable()])
+        self.assertEqual(bound.abramelin("MILON")["matrix"][0], ["M", "I", "L", "O", "N"])
+        self.assertEqual(bound.abramelin("truth_seeker")["spirit"], "VASSAGO")
+        self.assertEqual(plain.abramelin("future_vision"), bound.abramelin("milon"))
+        print("✅ [TEST] Codex Round Trip Passed.")
+
+    def test_stale_codex_is_not_trusted(self):
+        """TEST 2: A grimoire edited after the build is read from its JSON."""
+        with open(self.paths["solomon_path"], 'w', encoding='utf-8') as file:
+            json.dump({"entities": [{"id": "073_newcomer", "name": "Newcomer"}]}, file)
+        resolver, output = quiet(Resolver, codex_path=self.codex, **self.paths)
+        self.assertIn("The codex is stale for '72_solomon_sigil_shapes.json'", output)
+        self.assertEqual(resolver.resolve("newcomer")["id"], "073_newcomer")
+        self.assertIsNone(resolver.resolve("bael"))
+        self.assertIsInstance(resolver.grimoires[-1], CodexTable)  # The Magi are still bound
+
+    def test_unreadable_codex_is_ignored(self):
+        """TEST 3: A codex of another version is refused, and the JSON read instead."""
+        with open(self.codex, 'r+b') as file:
+            file.seek(8)
+            file.write(struct.pack("<H", 99))
+        with self.assertRaises(CodexError):
+            Codex.open(self.codex)
+        resolver, output = quiet(Resolver, codex_path=self.codex, **self.paths)
+        self.assertIn("Codex version 99 cannot be read", output)
+        self.assertEqual(resolver.resolve("bael")["name"], "Bael")
+        with self.assertRaises(CodexError):
+            Codex(b"MPL")
@@ -0,0 +1,53 @@
+import unittest
+import sys
+import os
+import io
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer, RegexLexer, Token, TokenType, stream_tokens
+from src.parser import Parser, Bind, Literal
+
+SCROLL = 'bind mana to 1\ncycle(3) {\n  bind mana to mana + 2.5 # flux\n  echo "two\nlines" + mana\n}\n'
+
+class TestCompactNodes(unittest.TestCase):
+    """
+    🪶 THE FEATHER-LIGHT GLYPHS (Slotted Token & AST Tests)
+    Verifies that Tokens and nodes stay small without changing what they mean.
+    """
+
+    def test_no_instance_dicts(self):
+        """TEST 1: Tokens and AST nodes are slotted but still compare and print by value."""
+        statements = Parser(Lexer(SCROLL).scan_tokens()).parse()
+        for node in (statements[0], statements[1].body, statements[0].value, statements[1].body.statements[0].value.left):
+            self.assertFalse(hasattr(node, '__dict__'))
+        self.assertFalse(hasattr(Token(TokenType.EOF, "", None, 1), '__dict__'))
+        self.assertEqual(statements[0], Bind("mana", Literal(1)))
+        self.assertIn("Bind(name='mana'", repr(statements[0]))
+        print("✅ [TEST] Slotted Nodes Passed.")
+
+    def test_lexemes_are_offsets_and_names_are_interned(self):
+        """TEST 2: Lexemes point into the source; every occurrence of a name shares one string."""
+        for tokens in (Lexer(SCROLL).scan_tokens(), RegexLexer(SCROLL).scan_tokens()):
+            number = next(t for t in tokens if t.type == TokenType.NUMBER and t.literal == 2.5)
+            self.assertIs(number.text, SCROLL)
+            self.assertEqual(number.lexeme, "2.5")
+            names = [t.lexeme for t in tokens if t.type == TokenType.IDENTIFIER]
+            self.assertEqual(names, ["mana"] * 4)
+            self.assertTrue(all(name is names[0] for name in names))
+
+    def test_columns_agree(self):
+        """TEST 3: All three tokenizers report the same 1-based columns."""
+        expected = [(t.line, t.column) for t in Lexer(SCROLL).scan_tokens()]
+        self.assertEqual(expected[:4], [(1, 1), (1, 6), (1, 11), (1, 14)])
+        self.assertEqual([(t.line, t.column) for t in RegexLexer(SCROLL).scan_tokens()], expected)
+        self.assertEqual([(t.line, t.column) for t in stream_tokens(io.StringIO(SCROLL))], expected)
+        # EOF sits after the last glyph, also when the scroll does not end with a newline.
+        for scroll in (SCROLL + "echo mana", SCROLL + 'echo "open\nsigil"'):
+            expected = [(t.line, t.column) for t in Lexer(scroll).scan_tokens()]
+            self.assertEqual(expected[-1], (8, 7) if "sigil" in scroll else (7, 10))
+            self.assertEqual([(t.line, t.column) for t in stream_tokens(io.StringIO(scroll))], expected, repr(scroll))
+
+if __name__ == '__main__':
+    unittest.main()
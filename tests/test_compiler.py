@@ -0,0 +1,129 @@
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+
+class TestClosureCompiler(unittest.TestCase):
+    """
+    ⚒️ THE SIGIL FORGE (Closure Compiler Tests)
+    Verifies that the compiled engine performs rituals exactly like the tree-walker.
+    """
+
+    def run_script(self, code, engine):
+        """Performs the ritual with the given engine and returns the global bindings."""
+        interpreter = Interpreter(engine=engine)
+        interpreter.interpret(Parser(Lexer(code).scan_tokens()).parse())
+        return interpreter.environment.values
+
+    def assert_engines_agree(self, code):
+        self.assertEqual(self.run_script(code, "closure"), self.run_script(code, "tree"))
+
+    def test_nested_arithmetic(self):
+        """TEST 1: Operator precedence and string weaving survive compilation."""
+        code = """
+        bind total to 0
+        cycle(4) {
+            bind total to total + 2 * 3 - 8 / 4
+        }
+        bind label to "Total: " + total
+        """
+        self.assertEqual(self.run_script(code, "closure")['label'], "Total: 16.0")
+        self.assert_engines_agree(code)
+        print("✅ [TEST] Compiled Alchemy Passed.")
+
+    def test_conditionals_and_hex(self):
+        """TEST 2: Branches, Hex and Morph behave identically."""
+        code = """
+        bind mana to "33"
+        morph mana into Mana
+        if mana > 30 {
+            hex mana with value = mana * 3
+        } else {
+            bind mana to 0
+        }
+        if mana == 0 bind low to True else bind low to False
+        """
+        self.assertEqual(self.run_script(code, "closure")['mana'], 99)
+        self.assert_engines_agree(code)
+        print("✅ [TEST] Compiled Branching Passed.")
+
+    def test_block_scope_is_private(self):
+        """TEST 3: Bindings made inside a block dissipate with it."""
+        code = """
+        bind outer to 1
+        {
+            bind inner to 2
+            bind outer to outer + inner
+        }
+        """
+        self.assertEqual(self.run_script(code, "closure"), {'outer': 3})
+        self.assert_engines_agree(code)
+        print("✅ [TEST] Compiled Circle Scope Passed.")
+
+    def test_sealed_binding_fails_the_ritual(self):
+        """TEST 4: Sealing is still enforced by the compiled Bind."""
+        code = """
+        bind key to 7
+        seal key
+        bind key to 8
+        """
+        self.assertEqual(self.run_script(code, "closure")['key'], 7)
+        self.assert_engines_agree(code)
+        # From an inner scope, the sealed binding is shadowed instead.
+        code = """
+        bind key to 7
+        seal key
+        {
+            bind key to 8
+            bind seen to key
+            echo key
+        }
+        echo key
+        """
+        for engine in Interpreter.ENGINES:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                self.assertEqual(self.run_script(code, engine), {'key': 7}, engine)
+            echoes = [line for line in output.getvalue().splitlines() if "[ECHO]" in line]
+            self.assertEqual(echoes, ["👁️‍🗨️ [ECHO]: 8", "👁️‍🗨️ [ECHO]: 7"], engine)
+        print("✅ [TEST] Compiled Seal Passed.")
+
+    def test_unknown_engine_is_rejected(self):
+        """TEST 5: Asking for an engine that does not exist fails loudly."""
+        with self.assertRaises(ValueError):
+            Interpreter(engine="ouija")
+
+    def test_cycle_fast_path(self):
+        """TEST 6: Renewed scopes, hoisted invariants and unrolled resonance change nothing."""
+        code = """
+        bind base to 2
+        bind total to 0
+        bind trace to ""
+        cycle(6) {
+            bind total to total + base * 10
+            circle {
+                bind local to total
+                seal local
+                bind trace to trace + local + ghost * 2
+            }
+            bind ghost to 1
+            cycle(4) bind total to total + base * base - ghost
+        }
+        cycle(3) bind base to base + 1
+        cycle(9) { bind base to base * 2 }
+        """
+        expected = self.run_script(code, "tree")
+        self.assertEqual(self.run_script(code, "closure"), expected)
+        self.assertEqual(expected['base'], 2560)
+        print("✅ [TEST] Cycle Fast Path Passed.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser, Diagnostic, Block, Cycle, Echo
+from src.main import lint
+
+def parse(code):
+    return Parser(Lexer(code).scan_tokens()).parse()
+
+class TestDiagnostics(unittest.TestCase):
+    """
+    🩺 THE DIAGNOSIS (Parser Recovery Tests)
+    Verifies that syntax errors are collected, not printed, and that one
+    broken statement never takes the rest of the scroll down with it.
+    """
+
+    def test_errors_are_collected_silently(self):
+        """TEST 1: Each error becomes a Diagnostic (line, column, message); nothing is printed."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = parse('bind mana 1\necho 2\n')
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(result, [parse('echo 2')[0]])
+        self.assertEqual(result.diagnostics, [Diagnostic(1, 11, "Expect 'to'.")])
+        print("✅ [TEST] Diagnostics Passed.")
+
+    def test_synchronizes_at_the_next_statement(self):
+        """TEST 2: Panic mode skips to the next statement keyword (or the closing '}')."""
+        result = parse('bind x to + + + echo 1\ncycle(3) { bind } echo 3\n) ) echo 4')
+        self.assertEqual([type(s) for s in result], [Echo, Cycle, Echo, Echo])
+        self.assertEqual(result[1].body, Block([]))  # No None left behind in the Block
+        self.assertEqual([(d.line, d.column) for d in result.diagnostics], [(1, 11), (2, 17), (3, 1)])
+
+    def test_lint(self):
+        """TEST 3: mpl lint reports every scroll of a folder in one pass, as JSON lines."""
+        with tempfile.TemporaryDirectory() as realm:
+            for name, code in [('good.ms', 'echo 1\n'), ('bad.ms', 'echo 1\nbind\n'), ('glyph.ms', 'echo @\n')]:
+                with open(os.path.join(realm, name), 'w', encoding='utf-8') as file:
+                    file.write(code)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                status = lint([realm], "json", use_cache=False)
+            self.assertEqual(status, 1)
+            reports = [json.loads(line) for line in output.getvalue().splitlines()]
+            self.assertEqual([(os.path.basename(r["scroll"]), r["line"], r["column"]) for r in reports],
+                             [('bad.ms', 3, 1), ('glyph.ms', 1, 6)])
+            self.assertEqual(lint([os.path.join(realm, 'good.ms')], use_cache=False), 0)
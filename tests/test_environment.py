@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.environment import Environment, RuntimeException
+
+class TestEnvironment(unittest.TestCase):
+    """
+    🌫️ THE ETHER (Environment Tests)
+    Verifies name-keyed binding without exception-driven control flow.
+    """
+
+    def setUp(self):
+        self.cosmos = Environment()
+        self.cosmos.define("mana", 1)
+        self.circle = Environment(Environment(self.cosmos))
+
+    def test_lookup_owner(self):
+        """TEST 1: The owning scope is found without raising."""
+        self.assertIs(self.circle.lookup_owner("mana"), self.cosmos)
+        self.assertIsNone(self.circle.lookup_owner("void"))
+
+    def test_set_or_define(self):
+        """TEST 2: 'bind' updates the nearest binding, else defines locally."""
+        self.circle.set_or_define("mana", 2)
+        self.circle.set_or_define("flux", 3)
+        self.assertEqual(self.cosmos.values, {"mana": 2})
+        self.assertEqual(self.circle.values, {"flux": 3})
+
+    def test_sealed_binding_is_shadowed_from_inner_scopes(self):
+        """TEST 3: Sealing is tracked once per name; inner scopes shadow a sealed binding."""
+        self.cosmos.seal("mana")
+        self.cosmos.seal("mana")
+        self.assertEqual(self.cosmos.sealed, {"mana"})
+        with self.assertRaises(RuntimeException):
+            self.cosmos.set_or_define("mana", 9)
+        self.circle.set_or_define("mana", 8)
+        self.assertEqual((self.circle.values, self.cosmos.values), ({"mana": 8}, {"mana": 1}))
+        with self.assertRaises(RuntimeException):
+            self.circle.assign_name("void", 0)
+
+    def test_frozen_snapshot(self):
+        """TEST 4: A frozen snapshot flattens the chain and refuses every write."""
+        self.circle.define("flux", 2)
+        snapshot = self.circle.frozen_snapshot()
+        self.assertEqual(snapshot.values, {"mana": 1, "flux": 2})
+        for write in (lambda: snapshot.set_or_define("flux", 3), lambda: snapshot.define("new", 0),
+                      lambda: snapshot.banish("mana"), snapshot.purge):
+            with self.assertRaises(RuntimeException):
+                write()
+        self.assertEqual(snapshot.values, {"mana": 1, "flux": 2})
+
+if __name__ == '__main__':
+    unittest.main()
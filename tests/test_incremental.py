@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+import random
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.incremental import IncrementalParser, _tokens
+from src.lexer import RegexLexer, LexerError
+from src.parser import Parser, Diagnostic
+
+def full_parse(source):
+    try:
+        return Parser(RegexLexer(source).scan_tokens()).parse()
+    except LexerError as e:
+        return e
+
+class TestIncremental(unittest.TestCase):
+    """
+    📜 THE PALIMPSEST (Incremental Parser Tests)
+    Verifies that an edited scroll re-parses only what changed, and always
+    to the same AST as a full parse.
+    """
+
+    def test_edit_reuses_untouched_statements(self):
+        """TEST 1: An edit in the middle re-parses a couple of statements, not the scroll."""
+        source = "".join(f"bind mana_{i} to {i}\n" for i in range(200))
+        parser = IncrementalParser(source)
+        self.assertEqual(parser.reparsed, 200)
+
+        offset = source.index("bind mana_100")
+        parser.edit(offset, offset + len("bind mana_100 to 100"), 'echo "one"\necho "two"')
+        self.assertLessEqual(parser.reparsed, 4)
+        self.assertGreaterEqual(parser.reused, 196)
+        self.assertEqual(parser.statements, full_parse(parser.source))
+        print("✅ [TEST] Incremental Reuse Passed.")
+
+    def test_random_edits_match_a_full_parse(self):
+        """TEST 2: Random edits (breaking and mending statements) agree with a full parse, lines and columns included."""
+        fragments = ['bind x to 1\n', 'echo "hi" ', 'if x > 1 echo 2 else echo 3\n', 'cycle(3) { echo x }\n',
+                     '{', '}', 'else ', 'echo ', 'x', ' + ', '2', '\n', '"', '"a\nb"', ')', '# c\n', 'purge ']
+        rng = random.Random(13)
+        source = "".join(rng.choice(fragments[:4]) for _ in range(30))
+        parser = IncrementalParser(source)
+        for _ in range(1500):
+            start = rng.randint(0, len(source))
+            end = min(len(source), start + rng.choice([0, 0, 1, 3, 10]))
+            text = rng.choice(fragments) if rng.random() < 0.8 else ""
+            parser.edit(start, end, text)
+            source = source[:start] + text + source[end:]
+
+            expected = full_parse(source)
+            if isinstance(expected, LexerError):
+                self.assertEqual(parser.diagnostics[-1], Diagnostic(expected.line, expected.column, expected.message))
+                continue
+            self.assertEqual(parser.statements, expected, repr(source))
+            self.assertEqual(parser.diagnostics, expected.diagnostics, repr(source))
+            self.assertEqual([(t.line, t.column) for t in _tokens(parser.statements)],
+                             [(t.line, t.column) for t in _tokens(expected)])
+
+    def test_unfinished_entry(self):
+        """TEST 3: A ritual that runs off the end of the scroll is unfinished until it is closed."""
+        parser = IncrementalParser("cycle(3) {\n")
+        self.assertTrue(parser.unfinished)
+        parser.append("echo 1\n")
+        self.assertTrue(parser.unfinished)
+        parser.append("}\n")
+        self.assertFalse(parser.unfinished)
+        self.assertEqual(parser.statements, full_parse(parser.source))
+        with self.assertRaises(ValueError):
+            parser.edit(5, 2, "")
@@ -74,6 +74,17 @@ class TestMPLEngine(unittest.TestCase):
         self.assertEqual(env.values['counter'], 3)
         print("✅ [TEST] Tesla Cycle (3-6-9) Passed.")
 
+    def test_resonance_hook(self):
+        """TEST 5: The Tesla Protocol's pause is configurable and pluggable."""
+        heard = []
+        self.interpreter = Interpreter(resonance_delay=0, resonance_hook=heard.append)
+        env = self.run_script('bind n to 0\ncycle(9) { cycle(3) bind n to n + 1 }')
+
+        # Expectation: one resonance per resonant cycle entered, and 27 iterations.
+        self.assertEqual(env.values['n'], 27)
+        self.assertEqual(heard, [9] + [3] * 9)
+        print("✅ [TEST] Resonance Hook Passed.")
+
 if __name__ == '__main__':
     print("⚡ [TESTING] Initiating Safety Seals...")
     unittest.main()
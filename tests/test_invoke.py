@@ -0,0 +1,129 @@
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.stdlib import StdLib, Market, Spell
+from src.resolver import invalidate_resolvers, shared_resolver
+
+class Familiar:
+    """A module registered by the tests: it remembers every cast."""
+    casts = []
+
+    @staticmethod
+    def scry(target, depth=1, omen="none"):
+        Familiar.casts.append((target, depth, omen))
+        return depth
+
+    @staticmethod
+    def backfire(power=1):
+        Familiar.casts.append(power)
+        raise ValueError("the circle broke")
+
+def perform(source, engine, interpreter=None):
+    interpreter = interpreter or Interpreter(engine=engine, resonance_delay=0)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        interpreter.interpret(Parser(Lexer(source).scan_tokens()).parse())
+    return output.getvalue()
+
+class TestInvoke(unittest.TestCase):
+    """
+    🕯️ THE SUMMONING (Invocation Tests)
+    Verifies that each invoke statement resolves its entity once, and again
+    only when the StdLib registry or the resolver changes.
+    """
+
+    def setUp(self):
+        Familiar.casts = []
+
+    def tearDown(self):
+        StdLib.modules.pop("familiar", None)
+
+    def test_call_site_resolves_once(self):
+        """TEST 1: A cycle of invocations resolves its entity once, on every engine."""
+        for engine in Interpreter.ENGINES:
+            interpreter = Interpreter(engine=engine, resonance_delay=0)
+            resolved = []
+            summoning = interpreter._summoning
+            interpreter._summoning = lambda entity: resolved.append(entity) or summoning(entity)
+            output = perform('cycle(5) { invoke.bael() }\ncycle(4) { invoke.market(title="Once") }', engine, interpreter)
+            self.assertEqual(output.count("Summoning Bael..."), 5, engine)
+            self.assertEqual(output.count("forging the Hybrid Strategy: Once"), 4, engine)
+            self.assertEqual(sorted(resolved), ["bael", "market"], engine)
+        print("✅ [TEST] Call Site Memo Passed.")
+
+    def test_registry_change_invalidates(self):
+        """TEST 2: Registering a module is seen by call sites that fizzled before."""
+        for engine in Interpreter.ENGINES:
+            source = 'cycle(2) { invoke.familiar(title="Familiar") }'
+            interpreter = Interpreter(engine=engine, resonance_delay=0)
+            self.assertIn("'familiar' did not answer", perform(source, engine, interpreter))
+            StdLib.modules["familiar"] = Market
+            self.assertEqual(perform(source, engine, interpreter).count("forging the Hybrid Strategy: Familiar"), 2, engine)
+            del StdLib.modules["familiar"]
+
+    def test_resolver_change_invalidates(self):
+        """TEST 3: An interpreter given another resolver resolves again."""
+        class Empty:
+            def resolve(self, entity_id): return None
+            def suggest(self, entity_id): return []
+
+        interpreter = Interpreter(engine="tree", resonance_delay=0)
+        self.assertIn("Summoning Bael", perform('invoke.bael()', "tree", interpreter))
+        interpreter.resolver = Empty()
+        self.assertIn("'bael' did not answer", perform('invoke.bael()', "tree", interpreter))
+
+    def test_parameters_bind_by_name(self):
+        """TEST 4: Named parameters bind by name, in any order; others fill the free ones in order."""
+        spell = Spell("familiar.scry", Familiar.scry)
+        self.assertEqual(spell.bind({"omen": "owl", "target": "Bael"}).arguments, {"target": "Bael", "omen": "owl"})
+        self.assertEqual(spell.bind({"depth": 3, "sacrifice": "Bael"}).arguments, {"target": "Bael", "depth": 3})
+        self.assertEqual(spell.bind({0: "Bael", 1: 2}).arguments, {"target": "Bael", "depth": 2})
+        with self.assertRaises(TypeError):
+            spell.bind({"a": 1, "b": 2, "c": 3, "d": 4})
+
+        # Leftover values go to *args, unknown names to **kwargs; positional-only parameters are filled too.
+        def gather(*args): return args
+        def consult(a, **kw): return a, kw
+        for function, params, expected in [(gather, {0: 1, 1: 2}, (1, 2)),
+                                           (consult, {"a": 1, "b": 2}, (1, {"b": 2})),
+                                           (len, {0: "Bael"}, 4), (len, {"obj": "Bael"}, 4),
+                                           (max, {0: 3, 1: 9}, 9)]:
+            self.assertEqual(Spell("familiar.call", function).cast(params), expected, function)
+
+        StdLib.modules["familiar"] = Familiar
+        self.assertEqual(StdLib.call("familiar", "scry", {"omen": "raven", "depth": 7, "target": "Paimon"}), 7)
+        self.assertEqual(Familiar.casts, [("Paimon", 7, "raven")])
+        self.assertIs(StdLib.dispatch_table()[("familiar", "scry")].function, Familiar.scry)
+
+    def test_failing_spell_runs_once(self):
+        """TEST 5: A spell that fails, or cannot take its parameters, is never cast a second time."""
+        StdLib.modules["familiar"] = Familiar
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertIsNone(StdLib.call("familiar", "backfire", {"power": 9}))
+            self.assertIsNone(StdLib.call("familiar", "backfire", {"power": 1, "rage": 2}))
+            self.assertIsNone(StdLib.call("familiar", "scry", {}))
+        self.assertEqual(Familiar.casts, [9])
+        self.assertIn("💥 [BACKFIRE] Internal Error: the circle broke", output.getvalue())
+        self.assertIn("The spell 'familiar.backfire' cannot take these parameters", output.getvalue())
+        self.assertIn("The spell 'familiar.scry' cannot take these parameters", output.getvalue())
+
+    def test_resolver_opens_on_first_invocation(self):
+        """TEST 6: A ritual that invokes nothing never loads the grimoires."""
+        invalidate_resolvers()
+        for engine in Interpreter.ENGINES:
+            interpreter = Interpreter(engine=engine, resonance_delay=0)
+            self.assertNotIn("Loaded", perform('bind mana to 1\necho mana', engine, interpreter))
+            self.assertIsNone(interpreter._resolver, engine)
+        interpreter = Interpreter(engine="closure", resonance_delay=0)
+        self.assertIn("📚 Magi Loaded.", perform('invoke.bael()', "closure", interpreter))
+        self.assertIs(interpreter.resolver, shared_resolver())
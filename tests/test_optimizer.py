@@ -0,0 +1,76 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser, Bind, Block, Cycle, Literal, Binary, Echo
+from src.interpreter import Interpreter
+from src.optimizer import Optimizer, count_nodes
+
+class TestOptimizer(unittest.TestCase):
+    """
+    ⚗️ THE ALCHEMIST'S REDUCTION (Optimizer Tests)
+    Verifies that the optimized ritual is smaller but performs identically.
+    """
+
+    def parse(self, code):
+        return Parser(Lexer(code).scan_tokens()).parse()
+
+    def test_constant_folding(self):
+        """TEST 1: Literal arithmetic and Sigil weaving are folded ahead of time."""
+        optimizer = Optimizer()
+        statements = optimizer.optimize(self.parse('bind x to 33 + 10 * 2\nbind s to "Total: " + 4 + 2\nbind y to x + 1'))
+        self.assertEqual(statements[0], Bind("x", Literal(53)))
+        self.assertEqual(statements[1], Bind("s", Literal("Total: 42")))
+        self.assertIsInstance(statements[2].value, Binary)
+        self.assertEqual(optimizer.eliminated, 8)
+        print("✅ [TEST] Constant Folding Passed.")
+
+    def test_dead_branches_and_empty_blocks(self):
+        """TEST 2: Constant conditions keep only their live branch; empty Blocks vanish."""
+        statements = Optimizer().optimize(self.parse("""
+        if 1 > 2 { echo "never" } else echo "always"
+        if False echo "never"
+        { }
+        cycle(3) { if 0 echo "never" }
+        """))
+        self.assertEqual(statements[0], Echo(Literal("always")))
+        self.assertEqual(statements[1], Cycle(Literal(3), Block([])))
+        self.assertEqual(len(statements), 2)
+
+    def test_failures_are_not_folded(self):
+        """TEST 3: An operation that fails at runtime is left to fail there."""
+        statements = self.parse('bind x to 1 / 0')
+        optimizer = Optimizer()
+        self.assertEqual(optimizer.optimize(statements), statements)
+        self.assertEqual(optimizer.eliminated, 0)
+        # Nor is a Sigil too long to be worth carrying in the AST.
+        statements = self.parse('bind x to "x" * 1000000000\nbind y to 3 * "ab" + "c" * 4094')
+        optimized = optimizer.optimize(statements)
+        self.assertEqual(optimized[0], statements[0])
+        self.assertEqual((optimized[1].value.left, optimized[1].value.right), (Literal("ababab"), Literal("c" * 4094)))
+        self.assertEqual(optimizer.optimize(self.parse('bind z to "c" * 4096'))[0], Bind("z", Literal("c" * 4096)))
+
+    def test_engines_agree_after_optimizing(self):
+        """TEST 4: Every engine performs the optimized ritual like the original."""
+        code = """
+        bind total to 0
+        cycle(2 + 2) {
+            if 3 >= 3 bind total to total + 6 / 2 else bind total to 0
+            bind label to "Total: " + total
+        }
+        if total == 12 bind verdict to 1 + 1 == 2
+        """
+        for engine in Interpreter.ENGINES:
+            original, optimized = Interpreter(engine=engine), Interpreter(engine=engine)
+            original.interpret(self.parse(code))
+            optimized.interpret(Optimizer().optimize(self.parse(code)))
+            self.assertEqual(optimized.environment.values, original.environment.values, engine)
+        self.assertEqual(optimized.environment.values, {'total': 12.0, 'verdict': True})
+        self.assertLess(count_nodes(Optimizer().optimize(self.parse(code))), count_nodes(self.parse(code)))
+
+if __name__ == '__main__':
+    unittest.main()
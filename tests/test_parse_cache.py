@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import parse_cache
+from src.parse_cache import parse_scroll, cache_path
+from src.lexer import LexerError
+
+class TestParseCache(unittest.TestCase):
+    """
+    📜 THE AKASHIC RECORD (Parse Cache Tests)
+    Verifies that archived scrolls skip parsing and are never trusted when stale.
+    """
+
+    def setUp(self):
+        self.realm = tempfile.mkdtemp()
+        self.scroll = os.path.join(self.realm, "ritual.ms")
+
+    def tearDown(self):
+        shutil.rmtree(self.realm)
+
+    def test_unchanged_scroll_skips_parsing(self):
+        """TEST 1: The second run is served from __mplcache__ without lexing."""
+        source = 'bind mana to 100\ncycle(3) { bind mana to mana + 1 }'
+        first = parse_scroll(self.scroll, source)
+        self.assertTrue(os.path.exists(cache_path(self.scroll)))
+
+        with mock.patch.dict(parse_cache.LEXERS, scan=mock.Mock(side_effect=AssertionError("re-lexed"))):
+            self.assertEqual(parse_scroll(self.scroll, source), first)
+        print("✅ [TEST] Parse Cache Hit Passed.")
+
+    def test_stale_archives_are_rejected(self):
+        """TEST 2: A changed scroll, another MPL version or a damaged archive re-parses."""
+        parse_scroll(self.scroll, 'bind mana to 1')
+        self.assertIsNone(parse_cache.load(self.scroll, 'bind mana to 2'))
+        self.assertEqual(parse_scroll(self.scroll, 'bind mana to 2')[0].value.value, 2)
+
+        with mock.patch.object(parse_cache, "__version__", "0.0.0"):
+            self.assertIsNone(parse_cache.load(self.scroll, 'bind mana to 2'))
+        with mock.patch.object(parse_cache, "AST_FINGERPRINT", "an older AST"):
+            self.assertIsNone(parse_cache.load(self.scroll, 'bind mana to 2'))
+
+        with open(cache_path(self.scroll), "wb") as file:
+            file.write(b"not an archive")
+        self.assertIsNone(parse_cache.load(self.scroll, 'bind mana to 2'))
+        self.assertEqual(parse_scroll(self.scroll, 'bind mana to 2')[0].value.value, 2)
+
+    def test_syntax_errors_are_not_archived(self):
+        """TEST 3: Broken scrolls report their errors on every run."""
+        parse_scroll(self.scroll, 'bind mana to')
+        self.assertFalse(os.path.exists(cache_path(self.scroll)))
+        parse_scroll(self.scroll, 'bind mana to 1', use_cache=False)
+        self.assertFalse(os.path.exists(cache_path(self.scroll)))
+
+    def test_archives_only_rebuild_ast_nodes(self):
+        """TEST 4: Every example scroll survives the JSON archive; foreign records are refused."""
+        examples = os.path.join(os.path.dirname(__file__), '..', 'examples')
+        for name in sorted(os.listdir(examples)):
+            if not name.endswith('.ms'): continue
+            with open(os.path.join(examples, name), encoding='utf-8') as file:
+                source = file.read()
+            try:
+                with mock.patch('builtins.print'):
+                    statements = parse_scroll(self.scroll, source, use_cache=False)
+            except LexerError:
+                continue  # Not every example is written in MPL itself.
+            self.assertEqual(parse_cache.decode(parse_cache.encode(statements)), statements, name)
+
+        with self.assertRaises(KeyError):
+            parse_cache.decode({"node": "Popen", "fields": ["rm -rf /"]})
+
+if __name__ == '__main__':
+    unittest.main()
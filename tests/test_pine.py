@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.pine import Template, TemplateError, emit, render, template
+from src.stdlib import Market
+
+ORACLE = dict(title="Oracle", fast=50, slow=200, rsi=45, adx=20, offset=21)
+
+class TestPine(unittest.TestCase):
+    """
+    📜 THE SCRIBE (Pine Script Emitter Tests)
+    Verifies that templates are parsed into typed slots, that renderings
+    are cached by their parameters, and that scripts go where they are sent.
+    """
+
+    def test_template_segments(self):
+        """TEST 1: A template is parsed once into literals and typed slots."""
+        scroll = Template('len = input.int(${fast:int}) // $$ ${title:str} ${fast:int}', "scroll")
+        self.assertEqual(scroll.segments, ["len = input.int(", ("fast", "int"), ") // $ ", ("title", "str"), " ",
+                                           ("fast", "int"), ""])
+        self.assertEqual(scroll.names, ("fast", "title"))
+        self.assertEqual(scroll.render(fast=9, title='Say "hi"'), 'len = input.int(9) // $ Say \\"hi\\" 9')
+        for broken in ("cost $5", "${fast:integer}", "${fast:int} ${fast:str}"):
+            with self.assertRaises(TemplateError):
+                Template(broken)
+        print("✅ [TEST] Template Parsing Passed.")
+
+    def test_typed_slots(self):
+        """TEST 2: Parameters are converted for their slots, or refused."""
+        oracle = template("hybrid_oracle")
+        self.assertIn("input.int(200,", render("hybrid_oracle", **dict(ORACLE, slow=200.0)))
+        self.assertIn("input.int(7,", render("hybrid_oracle", **dict(ORACLE, slow="7")))
+        for wrong in (dict(ORACLE, slow=199.5), dict(ORACLE, slow=True), dict(ORACLE, slow="soon")):
+            with self.assertRaises(TemplateError):
+                oracle.render(**wrong)
+        with self.assertRaises(TemplateError):
+            oracle.render(title="Oracle")
+        with self.assertRaises(TemplateError):
+            oracle.render(colour="red", **ORACLE)
+        with self.assertRaises(TemplateError):
+            template("no_such_template")
+
+    def test_renderings_are_cached(self):
+        """TEST 3: A variant seen before (even spelt 50.0) is not rendered again."""
+        oracle = Template(template("hybrid_oracle").segments[0] + "${fast:int}", "fresh")
+        first = oracle.render(fast=50)
+        self.assertIs(oracle.render(fast=50.0), first)
+        oracle.render(fast=51)
+        info = oracle.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_divine_writes_to_file_or_stream(self):
+        """TEST 4: Market.divine writes its script to a path or stream instead of the terminal."""
+        script = render("hybrid_oracle", **ORACLE)
+        self.assertTrue(script.startswith("//@version=6\n"))
+        stream, shown = io.StringIO(), io.StringIO()
+        with redirect_stdout(shown):
+            Market.divine(output=stream, **ORACLE)
+        self.assertEqual(stream.getvalue(), script)
+        self.assertNotIn("//@version=6", shown.getvalue())
+
+        with tempfile.TemporaryDirectory() as realm:
+            path = os.path.join(realm, "oracle.pine")
+            source = f'invoke.vassago(title="Oracle", output="{path}")'
+            with redirect_stdout(shown):
+                Interpreter(resonance_delay=0).interpret(Parser(Lexer(source).scan_tokens()).parse())
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), script)
+        self.assertIn("The strategy is inscribed in", shown.getvalue())
+
+        with redirect_stdout(shown):
+            Market.divine(**ORACLE)
+        self.assertIn("=" * 40 + "\n" + script + "=" * 40 + "\n", shown.getvalue())
+
+    def test_emit_watchtower(self):
+        """TEST 5: The watchtower artifact comes from its own template."""
+        stream = io.StringIO()
+        emit("enochian_watchtower", stream, entity="MIELA", vector_grid=257, sigil_cipher=463, fib_level=377)
+        self.assertIn("var int VECTOR_GRID = 257", stream.getvalue())
+        self.assertIn('Enochian Watchtower [257-463]"', stream.getvalue())
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+import io
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src import stdlib
+from src.stdlib import StdLib, Plugin
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PLUGIN_SOURCE = '''
+default_spell = "brew"
+
+def brew(herb, strength=1):
+    return f"{herb} x{strength}"
+'''
+
+def perform(source, engine):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        Interpreter(engine=engine, resonance_delay=0).interpret(Parser(Lexer(source).scan_tokens()).parse())
+    return output.getvalue()
+
+class TestPlugins(unittest.TestCase):
+    """
+    📦 THE SUMMONING CIRCLE (Plugin Module Tests)
+    Verifies that plugin modules are imported on first use, found through
+    entry points, and summoned ahead of time by 'summon'.
+    """
+
+    def setUp(self):
+        self.realm = tempfile.mkdtemp()
+        with open(os.path.join(self.realm, 'mpl_test_herbal.py'), 'w', encoding='utf-8') as file:
+            file.write(PLUGIN_SOURCE)
+        sys.path.insert(0, self.realm)
+
+    def tearDown(self):
+        sys.path.remove(self.realm)
+        sys.modules.pop('mpl_test_herbal', None)
+        StdLib.modules.pop('herbal', None)
+
+    def test_plugin_is_imported_on_first_invoke(self):
+        """TEST 1: A registered plugin is not imported until it is invoked."""
+        StdLib.modules['herbal'] = Plugin('mpl_test_herbal')
+        self.assertTrue(StdLib.knows('herbal'))
+        self.assertNotIn('mpl_test_herbal', sys.modules)
+        self.assertEqual(StdLib.call('herbal', None, {'strength': 3, 'herb': 'sage'}), "sage x3")
+        self.assertIn('mpl_test_herbal', sys.modules)
+        print("✅ [TEST] Lazy Plugin Passed.")
+
+    def test_entry_points_are_discovered(self):
+        """TEST 2: Installed packages' entry points are found on the first unknown name."""
+        with mock.patch.object(stdlib, 'entry_point_plugins', return_value={'herbal': Plugin('mpl_test_herbal')}), \
+                mock.patch.object(StdLib, '_discovered', False):
+            self.assertEqual(StdLib.call('herbal', 'brew', ['rue']), "rue x1")
+
+    def test_summon_on_every_engine(self):
+        """TEST 3: 'summon' imports a module ahead of its invocation, or says it did not answer."""
+        for engine in Interpreter.ENGINES:
+            StdLib.modules['herbal'] = Plugin('mpl_test_herbal')
+            sys.modules.pop('mpl_test_herbal', None)
+            output = perform('summon herbal\nsummon herbl', engine)
+            self.assertIn("📦 [SUMMON] The module 'herbal' answers.", output, engine)
+            self.assertIn("'herbl' did not answer", output, engine)
+            self.assertIn("Did you mean: herbal", output, engine)
+            self.assertIn('mpl_test_herbal', sys.modules, engine)
+        self.assertIn("💥 Ritual Failure: The module 'broken' could not be summoned",
+                      self._broken_summon())
+
+    def _broken_summon(self):
+        StdLib.modules['broken'] = Plugin('mpl_test_no_such_module')
+        try:
+            return perform('summon broken', "tree")
+        finally:
+            del StdLib.modules['broken']
+
+    def test_stdlib_imports_nothing_eagerly(self):
+        """TEST 4: Importing the StdLib loads neither the plugins nor unused system modules."""
+        probe = ("import sys; import src.stdlib; "
+                 "print(sorted(m for m in ('subprocess', 'shlex', 'urllib.request', 'random', "
+                 "'src.modules.gematria_engine', 'src.modules.occultator') if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), "[]", result.stderr)
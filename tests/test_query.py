@@ -0,0 +1,76 @@
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.resolver import shared_resolver
+from src.query import AttributeIndex, QueryError, parse_request
+
+class TestQuery(unittest.TestCase):
+    """
+    🗂️ THE CATALOGUE (Attribute Query Tests)
+    Verifies the secondary indexes, Resolver.query() and pacts.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with redirect_stdout(io.StringIO()):
+            cls.resolver = shared_resolver()
+
+    def test_query_from_python(self):
+        """TEST 1: Filters narrow, lists mean any of, and order_by sorts."""
+        everyone = [record for _, record in self.resolver.invocable()]
+        fire_kings = self.resolver.query(element="Fire", rank="King", order_by="en_count", descending=True)
+        expected = [r for r in everyone if r.get("element") == "Fire" and "King" in str(r.get("rank", "")).split("/")]
+        self.assertEqual({r["name"] for r in fire_kings}, {r["name"] for r in expected})
+        self.assertEqual(fire_kings[0]["name"], "Bael")
+        legions = [int(r["en_count"]) for r in fire_kings]
+        self.assertEqual(legions, sorted(legions, reverse=True))
+
+        self.assertEqual(len(self.resolver.query(kind="daemon")), 72)
+        self.assertEqual(len(self.resolver.query(kind="magus")), 225)
+        either = self.resolver.query(element=["Fire", "Water"], kind="DAEMON")
+        self.assertEqual(len(either), sum(1 for r in everyone if r.get("element") in ("Fire", "Water")))
+        self.assertEqual(len(self.resolver.query(kind="daemon", limit=5)), 5)
+        self.assertEqual(self.resolver.query(element="Aether"), [])
+        print("✅ [TEST] Attribute Query Passed.")
+
+    def test_compound_values_and_errors(self):
+        """TEST 2: A 'King/Earl' answers to both ranks; unindexed attributes are refused."""
+        index = AttributeIndex([{"name": "A", "rank": "King/Earl", "en_count": "30"},
+                                {"name": "B", "rank": "Earl", "en_count": 5},
+                                {"name": "C", "rank": "Duke"}])
+        self.assertEqual([r["name"] for r in index.query(rank="earl", order_by="en_count")], ["B", "A"])
+        self.assertEqual([r["name"] for r in index.query(order_by="en_count", descending=True)], ["A", "B", "C"])
+        with self.assertRaises(QueryError):
+            index.query(colour="red")
+        with self.assertRaises(QueryError):
+            parse_request("element")
+        self.assertEqual(parse_request("element=Fire order=-en_count limit=3"),
+                         ({"element": "Fire"}, "en_count", True, 3))
+
+    def test_pact_on_every_engine(self):
+        """TEST 3: A pact binds the names that answered, on every engine."""
+        source = 'pact kings with "element=Fire kind=daemon order=-en_count limit=2"\necho kings'
+        for engine in ("closure", "vm", "tree"):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                Interpreter(engine=engine, resonance_delay=0).interpret(Parser(Lexer(source).scan_tokens()).parse())
+            self.assertIn("📜 [PACT] 2 entities answered: Bael, Sitri", output.getvalue(), engine)
+            self.assertIn("['Bael', 'Sitri']", output.getvalue(), engine)
+
+    def test_refused_pact(self):
+        """TEST 4: A pact asking for an unindexed attribute is refused."""
+        statements = Parser(Lexer('pact x with "colour=red"').scan_tokens()).parse()
+        for engine in ("closure", "vm", "tree"):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                Interpreter(engine=engine, resonance_delay=0).interpret(statements)
+            self.assertIn("💥 Ritual Failure: The pact was refused: 'colour' is not indexed", output.getvalue(), engine)
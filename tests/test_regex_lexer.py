@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+import random
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer, RegexLexer
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+# Fragments of real rituals plus the glyphs that exercise every error path.
+FRAGMENTS = [
+    "bind", "mana", "to", "cycle", "(", ")", "{", "}", "if", "else", "echo", "invoke", ".", "market",
+    "divine", "hex", "with", "value", "=", "==", "!=", "!", "<", "<=", ">", ">=", "->", "-", "+", "*",
+    "/", ",", "True", "False", "Sigil", "morph", "into", "42", "3.14", "7.", ".5", '"oracle"', '"multi\nline"',
+    '"', "# comment", "\n", " ", "\t", "\r", "_x1", "x٣", "²", "é", "@", "\0", "$",
+]
+
+def outcome(lexer_class, source):
+    """The tokens a lexer produces, or the failure it raises."""
+    try:
+        return lexer_class(source).scan_tokens()
+    except Exception as e:
+        return (type(e), str(e))
+
+class TestRegexLexer(unittest.TestCase):
+    """
+    🔣 THE MASTER PATTERN (Regex Lexer Tests)
+    Differential tests: the regex lexer must tokenize exactly like the reference Lexer.
+    """
+
+    def assert_same(self, source):
+        self.assertEqual(outcome(RegexLexer, source), outcome(Lexer, source), repr(source))
+
+    def test_examples(self):
+        """TEST 1: Every example scroll (MPL or not) gives identical tokens or errors."""
+        for name in sorted(os.listdir(EXAMPLES)):
+            with open(os.path.join(EXAMPLES, name), encoding='utf-8') as file:
+                self.assert_same(file.read())
+        print("✅ [TEST] Regex Lexer Examples Passed.")
+
+    def test_fuzzed_inputs(self):
+        """TEST 2: Random scrolls built from MPL fragments and stray glyphs."""
+        rng = random.Random(369)
+        for _ in range(2000):
+            pieces = rng.choices(FRAGMENTS, k=rng.randint(1, 12))
+            self.assert_same("".join(p if rng.random() < 0.7 else p + " " for p in pieces))
+
+    def test_random_characters(self):
+        """TEST 3: Arbitrary printable noise fails (or succeeds) the same way."""
+        rng = random.Random(9)
+        alphabet = "abcXYZ_019 \n\t\"#(){}.,+-*/=!<>'$;:²٣é"
+        for _ in range(1000):
+            self.assert_same("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20))))
+
+if __name__ == '__main__':
+    unittest.main()
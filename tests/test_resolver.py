@@ -0,0 +1,84 @@
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.resolver import Resolver, Grimoire, GOETIA, INDEX_MAGIC, shared_resolver, invalidate_resolvers
+from src.interpreter import Interpreter
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'data')
+MAGI_PATH = os.path.join(DATA, 'MAGI_225.json')
+SOLOMON_PATH = os.path.join(DATA, '72_solomon_sigil_shapes.json')
+
+def quiet_resolver(*paths):
+    with redirect_stdout(io.StringIO()):
+        return Resolver(*paths)
+
+class TestResolver(unittest.TestCase):
+    """
+    📚 THE LIBRARIAN (Ontology Resolver Tests)
+    Verifies that the indexed, memory-mapped grimoires answer exactly as the
+    fully loaded JSON always did, while decoding only what is asked for.
+    """
+
+    def test_index_matches_the_json(self):
+        """TEST 1: Every daemon is found by name and id, with its full record."""
+        resolver = quiet_resolver(MAGI_PATH, SOLOMON_PATH)
+        with open(SOLOMON_PATH, encoding='utf-8') as file:
+            entities = json.load(file)["entities"]
+        for entity in entities:
+            self.assertEqual(resolver.resolve(entity["id"]), dict(entity, _type="DAEMON"))
+        self.assertEqual(resolver.resolve("BAEL")["name"], "Bael")
+        self.assertEqual(resolver.resolve("hermes_trismegistus")["_type"], "MAGUS")
+        self.assertIs(resolver.resolve("hermes"), resolver.resolve("hermes_trismegistus"))
+        self.assertIsNone(resolver.resolve("nobody"))
+        print("✅ [TEST] Ontology Index Passed.")
+
+    def test_records_are_decoded_lazily(self):
+        """TEST 2: Opening the grimoires decodes nothing; a lookup decodes one record."""
+        resolver = quiet_resolver(MAGI_PATH, SOLOMON_PATH)
+        self.assertEqual(sum(len(g.records) for g in resolver.grimoires), 0)
+        resolver.resolve("vassago")
+        self.assertEqual(sum(len(g.records) for g in resolver.grimoires), 1)
+
+    def test_stale_index_is_rebuilt(self):
+        """TEST 3: An index built for another edition of a grimoire is never trusted."""
+        with tempfile.TemporaryDirectory() as realm:
+            path = os.path.join(realm, 'goetia.json')
+            shutil.copy(SOLOMON_PATH, path)
+            Grimoire(path, GOETIA)
+            with open(os.path.join(realm, 'goetia.idx'), encoding='utf-8') as file:
+                self.assertTrue(file.readline().startswith(INDEX_MAGIC))
+
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({"entities": [{"id": "073_newcomer", "name": "Newcomer"}]}, file)
+            grimoire = Grimoire(path, GOETIA)
+            self.assertEqual(grimoire.get("newcomer")["id"], "073_newcomer")
+            self.assertIsNone(grimoire.get("bael"))
+
+    def test_interpreters_share_one_resolver(self):
+        """TEST 4: One Resolver per process, re-opened when a grimoire changes or on request."""
+        with redirect_stdout(io.StringIO()):
+            self.assertIs(Interpreter().resolver, Interpreter(engine="tree").resolver)
+            with tempfile.TemporaryDirectory() as realm:
+                magi, solomon = os.path.join(realm, 'magi.json'), os.path.join(realm, 'goetia.json')
+                shutil.copy(MAGI_PATH, magi)
+                shutil.copy(SOLOMON_PATH, solomon)
+                first = shared_resolver(magi, solomon)
+                self.assertIs(shared_resolver(magi, solomon), first)
+
+                status = os.stat(solomon)
+                os.utime(solomon, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+                changed = shared_resolver(magi, solomon)
+                self.assertIsNot(changed, first)
+                self.assertIs(Interpreter(resolver=changed).resolver, changed)
+
+                invalidate_resolvers()
+                self.assertIsNot(shared_resolver(magi, solomon), changed)
@@ -0,0 +1,110 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.scope_resolver import ScopeResolver
+from src.environment import Environment, Layout
+
+class TestScopeResolver(unittest.TestCase):
+    """
+    🗺️ THE CARTOGRAPHER OF CIRCLES (Scope Resolver Tests)
+    Verifies slot addresses and that slot access never changes a ritual's outcome.
+    """
+
+    def parse(self, code):
+        return Parser(Lexer(code).scan_tokens()).parse()
+
+    def run_script(self, code, engine):
+        interpreter = Interpreter(engine=engine)
+        interpreter.interpret(self.parse(code))
+        return interpreter.environment.values
+
+    def assert_engines_agree(self, code):
+        expected = self.run_script(code, "tree")
+        for engine in ("closure", "vm"):
+            self.assertEqual(self.run_script(code, engine), expected, engine)
+        return expected
+
+    def test_addresses(self):
+        """TEST 1: Variables are addressed by (depth, slot) from where they are used."""
+        bind_a, bind_b, cycle = self.parse("""
+        bind a to 1
+        bind b to 2
+        cycle(2) {
+            if a > 0 {
+                bind b to b + a
+                bind c to b
+            }
+        }
+        """)
+        ScopeResolver(Layout()).resolve([bind_a, bind_b, cycle])
+        inner = cycle.body.statements[0].then_branch.statements
+        self.assertEqual((bind_a.address, bind_b.address), ((0, 0), (0, 1)))
+        self.assertEqual(cycle.body.statements[0].condition.left.address, (1, 0))
+        self.assertEqual(inner[0].address, (2, 1))
+        self.assertEqual(inner[0].value.right.address, (2, 0))
+        # b may be shadowed here (if sealed outside), so it is read from here first.
+        self.assertEqual((inner[1].address, inner[1].value.address), ((0, 1), (0, 0)))
+        print("✅ [TEST] Slot Addresses Passed.")
+
+    def test_cycle_scopes_dissipate(self):
+        """TEST 2: Each iteration gets fresh slots; earlier iterations leave nothing behind."""
+        code = """
+        bind turn to 0
+        cycle(2) {
+            bind turn to turn + 1
+            if turn == 2 { bind x to 5 bind turn to turn + x } else bind x to 1
+        }
+        """
+        self.assertEqual(self.assert_engines_agree(code), {'turn': 7})
+
+    def test_unbound_slots_fall_back_to_names(self):
+        """TEST 3: Banished or never-bound slots behave like the name-based lookup."""
+        code = """
+        if False bind ghost to 0
+        bind echo_count to 0
+        {
+            bind ghost to 7
+            bind echo_count to ghost
+        }
+        bind kept to 1
+        banish kept
+        circle bind found to kept
+        """
+        self.assertEqual(self.assert_engines_agree(code), {'echo_count': 7})
+
+    def test_globals_survive_between_rituals(self):
+        """TEST 4: The REPL keeps slots stable across separate rituals."""
+        interpreter = Interpreter()
+        interpreter.interpret(self.parse('bind mana to 10'))
+        interpreter.interpret(self.parse('bind power to mana * 2\ncycle(2) { bind mana to mana + power }'))
+        self.assertEqual(interpreter.environment.values, {'mana': 50, 'power': 20})
+
+    def test_shared_frozen_parameters(self):
+        """TEST 5: A frozen parameter snapshot is read by slot, shadowed by binds, never modified."""
+        params = Environment()
+        params.define("slow", 200)
+        params.define("fast", 50)
+        snapshot = params.frozen_snapshot()
+        code = """
+        bind spread to slow - fast
+        { bind spread to spread + fast }
+        bind slow to 1
+        bind spread to spread + slow
+        """
+        for engine in Interpreter.ENGINES:
+            interpreter = Interpreter(engine=engine, parameters=snapshot)
+            interpreter.interpret(self.parse(code))
+            self.assertEqual(interpreter.environment.values, {'spread': 201, 'slow': 1}, engine)
+        self.assertEqual(snapshot.values, {'slow': 200, 'fast': 50})
+        with self.assertRaises(ValueError):
+            Interpreter(parameters=params)
+
+if __name__ == '__main__':
+    unittest.main()
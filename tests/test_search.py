@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.resolver import shared_resolver
+from src.search import SearchIndex
+
+class TestSearch(unittest.TestCase):
+    """
+    🔎 THE CONCORDANCE (Ontology Search Tests)
+    Verifies prefix search, misspelling search and "did you mean".
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with redirect_stdout(io.StringIO()):
+            cls.resolver = shared_resolver()
+
+    def test_prefix_search(self):
+        """TEST 1: A prefix finds names first, then roles, planets and elements."""
+        hits = self.resolver.search("herm", limit=5)
+        self.assertEqual(hits[0].key, "hermes")
+        self.assertEqual(hits[0].name, "Hermes Trismegistus")
+        self.assertIs(self.resolver.resolve(hits[0].key), hits[0].record)
+
+        fire = self.resolver.search_index.prefix("fire", limit=1000)
+        self.assertEqual(len({id(hit.record) for hit in fire}), len(fire))  # Each entity once
+        self.assertEqual({hit.key for hit in fire if hit.field == "element"},
+                         {key for key, record in self.resolver.invocable() if record.get("element") == "Fire"})
+        print("✅ [TEST] Prefix Search Passed.")
+
+    def test_misspellings(self):
+        """TEST 2: A misspelt name is found, and suggested."""
+        self.assertEqual(self.resolver.search("vasago", limit=1)[0].key, "vassago")
+        self.assertEqual(self.resolver.suggest("asmodai")[:1], ["asmoday (asmodeus)"])
+        self.assertEqual(self.resolver.search("", limit=5), [])
+        self.assertEqual(self.resolver.search("qqqq", limit=5), [])
+
+    def test_did_you_mean(self):
+        """TEST 3: An invocation nobody answers suggests what was meant."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Interpreter(resonance_delay=0).interpret(Parser(Lexer('invoke.vasago()\ninvoke.markt()').scan_tokens()).parse())
+        self.assertIn("'vasago' did not answer (Not found in Grimoire). Did you mean: vassago?", output.getvalue())
+        self.assertIn("Did you mean: market", output.getvalue())
+
+    def test_index_of_plain_records(self):
+        """TEST 4: The index works over any (key, record) pairs."""
+        index = SearchIndex([("alpha", {"name": "Alpha One", "planet": "Mars"}),
+                             ("beta", {"name": "Beta Two", "planet": "Mars"})])
+        self.assertEqual([hit.key for hit in index.search("mars")], ["alpha", "beta"])
+        self.assertEqual([hit.key for hit in index.search("two")], ["beta"])
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import io
+import random
+from unittest import mock
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import RegexLexer, stream_tokens
+from src.parser import Parser
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'examples')
+
+def outcome(tokenize):
+    try:
+        return list(tokenize())
+    except Exception as e:
+        return (type(e), str(e))
+
+class TestStreaming(unittest.TestCase):
+    """
+    🌊 THE RIVER OF GLYPHS (Streaming Lexer & Parser Tests)
+    Verifies that lazily streamed scrolls parse exactly like fully loaded ones.
+    """
+
+    def assert_same_tokens(self, source):
+        expected = outcome(lambda: RegexLexer(source).scan_tokens())
+        self.assertEqual(outcome(lambda: stream_tokens(io.StringIO(source))), expected, repr(source))
+
+    def test_stream_matches_regex_lexer(self):
+        """TEST 1: Examples and fuzzed scrolls (with multi-line Sigils) stream identically."""
+        for name in sorted(os.listdir(EXAMPLES)):
+            with open(os.path.join(EXAMPLES, name), encoding='utf-8') as file:
+                self.assert_same_tokens(file.read())
+        rng = random.Random(6)
+        fragments = ['bind', ' x', ' to', ' 1', '\n', '"a\nb"', '"', '# c', '{', '}', '!', '!=', '->', ' ', '@']
+        for _ in range(1000):
+            self.assert_same_tokens("".join(rng.choices(fragments, k=rng.randint(0, 10))))
+        print("✅ [TEST] Token Stream Passed.")
+
+    def test_parser_keeps_a_small_lookahead(self):
+        """TEST 2: Statements come out one by one while only the next token is buffered."""
+        source = "".join(f'bind mana_{i} to {i} * 2\ncycle(3) {{ echo "tick" }}\n' for i in range(500))
+        parser = Parser(stream_tokens(io.StringIO(source)))
+        count = 0
+        for stmt in parser.statements():
+            count += 1
+            self.assertEqual(len(parser.lookahead), 0)
+        self.assertEqual(count, 1000)
+        self.assertEqual(Parser(stream_tokens(io.StringIO(source))).parse(), Parser(RegexLexer(source).scan_tokens()).parse())
+        self.assertEqual(parser.peek(5).type, parser.peek(1).type)  # EOF repeats forever
+
+    def test_stream_without_eof(self):
+        """TEST 3: A token stream that simply stops is treated as ending there."""
+        tokens = RegexLexer('bind mana to 1 + 2').scan_tokens()[:-1]
+        self.assertEqual(Parser(iter(tokens)).parse(), Parser(RegexLexer('bind mana to 1 + 2').scan_tokens()).parse())
+        with mock.patch('builtins.print'):
+            self.assertEqual(Parser(iter(RegexLexer('bind mana to').scan_tokens()[:-1])).parse(), [])
+
+if __name__ == '__main__':
+    unittest.main()
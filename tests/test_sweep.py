@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import io
+import csv
+import shutil
+import tempfile
+import zipfile
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pine import TemplateError, render
+from src.stdlib import Market
+from src.sweep import Grid, axis, sweep
+from src import main
+
+ORACLE = dict(title="Oracle", fast=50, slow=200, rsi=45, adx=20, offset=21)
+
+def quiet(ritual, *args, **kwargs):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = ritual(*args, **kwargs)
+    return result, output.getvalue()
+
+class TestSweep(unittest.TestCase):
+    """
+    🧮 THE LOOM (Strategy Sweep Tests)
+    Verifies that a sweep writes one script per combination of its
+    parameters, with a manifest, whether rendered here or in a pool.
+    """
+
+    def setUp(self):
+        self.realm = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.realm)
+
+    def test_axes_and_grid(self):
+        """TEST 1: Specs name their values, and the grid is walked lazily, last axis first."""
+        self.assertEqual(list(axis("10:50:20")), [10, 30, 50])
+        self.assertEqual(axis("0.5:1:0.25"), [0.5, 0.75, 1.0])
+        self.assertEqual(axis("3,5,Oracle"), [3, 5, "Oracle"])
+        self.assertEqual(axis("7"), (7,))
+        for broken in ("1:9:0", "a:b"):
+            with self.assertRaises(ValueError):
+                axis(broken)
+        grid = Grid(dict(title="Oracle", fast=range(10 ** 6), slow=[1, 2]))
+        self.assertEqual(len(grid), 2 * 10 ** 6)
+        self.assertEqual(next(grid.batches(3)), (0, [("Oracle", 0, 1), ("Oracle", 0, 2), ("Oracle", 1, 1)]))
+        print("✅ [TEST] Sweep Grid Passed.")
+
+    def test_sweep_into_directory(self):
+        """TEST 2: Market.sweep writes each script and names its parameters in the manifest."""
+        folder = os.path.join(self.realm, "oracles")
+        count, output = quiet(Market.sweep, folder, title="Oracle {fast}/{slow} #{index}",
+                              fast=range(10, 40, 10), slow=[100, 200], workers=1)
+        self.assertEqual(count, 6)
+        self.assertIn("swept 6 Hybrid Strategies", output)
+        with open(os.path.join(folder, "manifest.csv"), encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([row["title"] for row in rows[:2]], ["Oracle 10/100 #0", "Oracle 10/200 #1"])
+        self.assertEqual(len(os.listdir(folder)), 7)
+        last = rows[-1]
+        self.assertEqual(last["file"], "hybrid_oracle_000005.pine")
+        with open(os.path.join(folder, last["file"]), encoding="utf-8") as file:
+            self.assertEqual(file.read(), render("hybrid_oracle", **dict(ORACLE, title="Oracle 30/200 #5",
+                                                                          fast=30, slow=200)))
+
+    def test_pool_matches_one_process(self):
+        """TEST 3: An archive rendered by a process pool holds what one process writes."""
+        axes = dict(ORACLE, fast=range(5, 12), slow=[100, 150, 200])
+        alone, pooled = os.path.join(self.realm, "alone.zip"), os.path.join(self.realm, "pooled.zip")
+        self.assertEqual(sweep("hybrid_oracle", axes, alone, workers=1, batch_size=4), 21)
+        self.assertEqual(sweep("hybrid_oracle", axes, pooled, workers=2, batch_size=4), 21)
+        with zipfile.ZipFile(alone) as first, zipfile.ZipFile(pooled) as second:
+            self.assertEqual(first.namelist(), second.namelist())
+            self.assertEqual(len(first.namelist()), 22)
+            for name in first.namelist():
+                self.assertEqual(first.read(name), second.read(name), name)
+
+    def test_bad_parameters_write_nothing(self):
+        """TEST 4: A parameter that does not fit is refused before any script is written."""
+        folder = os.path.join(self.realm, "refused")
+        for axes in (dict(ORACLE, slow="soon"), dict(ORACLE, colour="red"), dict(fast=1),
+                     dict(ORACLE, title="Oracle {speed}")):
+            with self.assertRaises(TemplateError):
+                sweep("hybrid_oracle", axes, folder)
+        self.assertFalse(os.path.exists(folder))
+        status, output = quiet(main.sweep, folder, ["fast=1:9:0"])
+        self.assertEqual(status, 1)
+        self.assertIn("is not a range", output)
+        status, output = quiet(main.sweep, folder, ["fast=5,6", "slow=100"])
+        self.assertEqual(status, 0)
+        self.assertEqual(len(os.listdir(folder)), 3)
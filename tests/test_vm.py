@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Add the project root to the Python path so the 'src' folder can be found.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.bytecode import BytecodeCompiler, OpCode
+from src.scope_resolver import ScopeResolver
+from src.environment import Layout
+
+class TestBytecodeVM(unittest.TestCase):
+    """
+    🜔 THE ENGINE OF GLYPHS (Bytecode VM Tests)
+    Verifies that the stack VM performs rituals exactly like the tree-walker.
+    """
+
+    def parse(self, code):
+        return Parser(Lexer(code).scan_tokens()).parse()
+
+    def run_script(self, code, engine="vm"):
+        interpreter = Interpreter(engine=engine)
+        interpreter.interpret(self.parse(code))
+        return interpreter.environment.values
+
+    def assert_engines_agree(self, code):
+        self.assertEqual(self.run_script(code, "vm"), self.run_script(code, "tree"))
+
+    def test_protection_circle_cases(self):
+        """TEST 1: The tree-walker's unit test rituals give identical results."""
+        for code in ['bind mana to 100', 'bind result to 33 + 10',
+                     'bind greeting to "Hello" + " World"',
+                     'bind counter to 0\ncycle(3) {\n bind counter to counter + 1\n}']:
+            self.assert_engines_agree(code)
+        self.assertEqual(self.run_script('bind counter to 0\ncycle(3) bind counter to counter + 1')['counter'], 3)
+        print("✅ [TEST] VM Parity Passed.")
+
+    def test_nested_cycles_and_branches(self):
+        """TEST 2: Nested cycles keep their counters apart on the stack."""
+        code = """
+        bind hits to 0
+        bind misses to 0
+        cycle(4) {
+            cycle(5) {
+                if hits < 7 bind hits to hits + 1 else bind misses to misses + 1
+            }
+        }
+        cycle(0) bind misses to 1000
+        """
+        self.assertEqual(self.run_script(code), {'hits': 7, 'misses': 13})
+        self.assert_engines_agree(code)
+        print("✅ [TEST] VM Nested Cycles Passed.")
+
+    def test_circle_recovers_scope_and_stack(self):
+        """TEST 3: A failure inside a Circle resumes after it with the outer scope."""
+        code = """
+        bind level to 1
+        cycle(2) {
+            circle {
+                bind inner to 1
+                abyss "Chaos"
+            }
+            bind level to level * 10
+        }
+        seal level
+        hex level with value = 0
+        """
+        self.assertEqual(self.run_script(code), {'level': 100})
+        self.assert_engines_agree(code)
+        print("✅ [TEST] VM Circle Passed.")
+
+    def test_superinstructions_are_emitted(self):
+        """TEST 4: Literal operands are folded into the instruction stream."""
+        statements = self.parse('bind x to 1\nbind x to x + 2')
+        ScopeResolver(Layout()).resolve(statements)
+        chunk = BytecodeCompiler().compile(statements)
+        self.assertIn(int(OpCode.GET_BINARY_CONSTANT), chunk.code)
+        self.assertIn("GET_BINARY_CONSTANT", chunk.disassemble())
+
+    def test_unresolved_names(self):
+        """TEST 5: Names the resolver never saw are looked up (and fail) like the tree-walker."""
+        outputs = {}
+        for engine in ("vm", "tree"):
+            with redirect_stdout(io.StringIO()) as out:
+                self.run_script('circle echo ghost\necho phantom', engine)
+            outputs[engine] = out.getvalue()
+        self.assertIn("Protected against chaos: Undefined variable 'ghost'.", outputs["vm"])
+        self.assertIn("Ritual Failure: Undefined variable 'phantom'.", outputs["vm"])
+        self.assertEqual(outputs["vm"], outputs["tree"])
+
+    def test_cycle_scope_is_renewed(self):
+        """TEST 6: The shared cycle scope forgets its locals and seals every iteration."""
+        code = """
+        bind total to 0
+        cycle(3) {
+            circle bind total to total + seen
+            bind seen to 5
+            seal seen
+        }
+        cycle(0) { bind never to 1 }
+        """
+        self.assertEqual(self.run_script(code), {'total': 0})
+        self.assert_engines_agree(code)
+
+if __name__ == '__main__':
+    unittest.main()